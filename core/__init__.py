@@ -44,15 +44,23 @@ from .bot_controller import BotController
 
 from .utils import (
     log,
+    log_timestamp,
+    queue_db_log,
+    flush_db_logs,
     set_gui_instance,
     set_state_manager,
     set_log_db,
     set_headless_mode,
     is_headless,
     build_function_map,
-    build_command_map
+    build_command_map,
+    wait_for,
+    wait_for_condition,
+    wait_until_gone
 )
 
+from .timings import DELAYS, get_delay, wait, get_speed_multiplier
+
 __all__ = [
     # Classes
     'BOT',
@@ -91,6 +99,9 @@ __all__ = [
 
     # Utils
     'log',
+    'log_timestamp',
+    'queue_db_log',
+    'flush_db_logs',
     'set_gui_instance',
     'set_state_manager',
     'set_log_db',
@@ -98,4 +109,13 @@ __all__ = [
     'is_headless',
     'build_function_map',
     'build_command_map',
+    'wait_for',
+    'wait_for_condition',
+    'wait_until_gone',
+
+    # Timings
+    'DELAYS',
+    'get_delay',
+    'wait',
+    'get_speed_multiplier',
 ]
@@ -13,6 +13,7 @@ import numpy as np
 import time
 import json
 import os
+import struct
 import threading
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from functools import wraps
@@ -168,6 +169,11 @@ class AndroidStoppedException(Exception):
     pass
 
 
+class _RawScreencapRefused(Exception):
+    """The device answered FAIL to the exec:screencap request itself"""
+    pass
+
+
 # Class-level lock shared across all Android instances for the same device
 # Key: serial_number, Value: {'lock': Lock, 'failed': bool}
 _reconnect_locks = {}
@@ -178,6 +184,38 @@ _reconnect_locks_mutex = threading.Lock()
 _adb_locks = {}
 _adb_locks_mutex = threading.Lock()
 
+# Raw screencap pixel format for RGBA_8888 (the only one decoded directly)
+_RAW_FORMAT_RGBA_8888 = 1
+
+
+def _decode_raw_screencap(data):
+    """Decode raw `screencap` output (no -p) into a BGRA image
+
+    Raw output is a header of width, height and pixel format (plus a color
+    space field on Android 9+) followed by uncompressed RGBA pixels.
+
+    Args:
+        data: Bytes returned by screencap without -p
+
+    Returns:
+        numpy.ndarray or None: BGRA image, or None if the pixel format is not RGBA_8888
+
+    Raises:
+        ValueError: If the data is shorter or longer than its header says
+                    (e.g. a truncated read)
+    """
+    if data is None or len(data) < 12:
+        raise ValueError("raw screencap header incomplete")
+    width, height, pixel_format = struct.unpack_from('<III', data)
+    if pixel_format != _RAW_FORMAT_RGBA_8888:
+        return None
+    pixel_bytes = width * height * 4
+    header_size = len(data) - pixel_bytes
+    if header_size not in (12, 16):
+        raise ValueError("raw screencap length does not match its header")
+    rgba = np.frombuffer(data, dtype=np.uint8, count=pixel_bytes, offset=header_size)
+    return cv.cvtColor(rgba.reshape(height, width, 4), cv.COLOR_RGBA2BGRA)
+
 
 class Android:
     """Android device controller via ADB
@@ -211,6 +249,7 @@ class Android:
         self.device_name = device_name or serial  # Use serial as fallback
         self.gui = None
         self.should_stop = False
+        self._raw_screencap = True  # Cleared if the device can't give raw RGBA frames
         self._setup_reconnect_lock()
         self._initialize_connection()
 
@@ -397,6 +436,8 @@ class Android:
 
         Note:
             - Automatically reconnects on error and retries capture
+            - Reads raw RGBA frames when the device supports it, skipping the
+              PNG encode on the device and the decode here; falls back to PNG
             - Uses OpenCV for fast decoding (50-60% faster than PIL)
             - cv.imdecode automatically decodes PNG to BGR/BGRA format
             - Uses ADB lock to prevent concurrent commands from blocking each other
@@ -410,6 +451,11 @@ class Android:
             raise ADBTimeoutError("Could not acquire ADB lock for screencap (timeout)")
 
         try:
+            if self._raw_screencap:
+                np_img = self._capture_raw()
+                if np_img is not None:
+                    return np_img
+
             # Run screencap with timeout protection
             screenshot_bytes = self._run_with_timeout(
                 self.device.screencap,
@@ -452,6 +498,54 @@ class Android:
 
         return np_img
 
+    def _read_raw_screencap(self):
+        """Run screencap without -p over the exec: service (binary-safe, no pty)
+
+        Raises:
+            _RawScreencapRefused: If the device refuses the exec: service
+            RuntimeError: If the ADB server or device transport is unavailable
+                          (retryable - left to the normal reconnect path)
+        """
+        conn = self.device.create_connection(set_transport=False)
+        with conn:
+            self.device.transport(conn)
+            try:
+                conn.send("exec:screencap")
+            except RuntimeError as e:
+                raise _RawScreencapRefused(str(e)) from e
+            return conn.read_all()
+
+    def _capture_raw(self):
+        """Capture a raw screencap frame, caller must hold the ADB lock
+
+        Returns:
+            numpy.ndarray or None: BGRA screenshot, or None if the device can't
+                                   provide raw RGBA frames (raw capture is then
+                                   disabled for this instance)
+
+        Raises:
+            Exception: If the frame was incomplete (retryable, like the PNG path)
+        """
+        try:
+            data = self._run_with_timeout(self._read_raw_screencap, operation_name="screencap")
+        except _RawScreencapRefused as e:
+            # The device refused the exec: service (Android 4.x)
+            self._raw_screencap = False
+            self.log(f"[Warning] Raw screencap refused ({e}) - using PNG screencap")
+            return None
+
+        try:
+            np_img = _decode_raw_screencap(data)
+        except ValueError:
+            self.log(f"[Warning] Screenshot data incomplete ({len(data) if data else 0} bytes)")
+            raise Exception("Screenshot data incomplete - will retry")
+
+        if np_img is None:
+            self._raw_screencap = False
+            pixel_format = struct.unpack_from('<I', data, 8)[0]
+            self.log(f"[Warning] Raw screencap pixel format {pixel_format} is not RGBA_8888 - using PNG screencap")
+        return np_img
+
     # ============================================================================
     # TOUCH INPUT & GESTURES
     # ============================================================================
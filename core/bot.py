@@ -6,21 +6,74 @@ OCR support, and gesture control. Abstracts android.py for easier bot developmen
 """
 
 from .android import Android
+from .config_loader import load_master_config
+from .regions import get_region
+from .timings import get_delay, DEFAULT_SPEED_MULTIPLIER
 import cv2 as cv
 import numpy as np
 import os
 import threading
+import time
 import queue
 from datetime import datetime
 from typing import Callable, Any, Optional
 
 
+# Whether OpenCV was built with CUDA and a CUDA device is present (checked once)
+_cuda_available = None
+
+# Whether template matching uses OpenCL (T-API) - "use_opencl" in master.conf (checked once)
+_opencl_enabled = None
+
+
 def _log_framework(message: str):
     """Print timestamped framework log message"""
     timestamp = datetime.now().strftime("%H:%M:%S")
     print(f"[{timestamp}][BOT] {message}")
 
 
+def _has_cuda():
+    """Check whether template matching can run on a CUDA device
+
+    Returns:
+        bool: True if OpenCV has CUDA support and at least one device is present
+    """
+    global _cuda_available
+    if _cuda_available is None:
+        try:
+            _cuda_available = cv.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv.error):
+            _cuda_available = False
+        if _cuda_available:
+            _log_framework('CUDA device found - template matching runs on the GPU')
+    return _cuda_available
+
+
+def _has_opencl():
+    """Check whether template matching should run through OpenCL (T-API)
+
+    OpenCL is opt-in ("use_opencl": true in master.conf): on a discrete or
+    integrated GPU it offloads full-resolution matching, but for small search
+    regions the upload can cost more than matching on the CPU.
+
+    Returns:
+        bool: True if enabled in master.conf and an OpenCL device is available
+    """
+    global _opencl_enabled
+    if _opencl_enabled is None:
+        try:
+            requested = bool(load_master_config().get('use_opencl', False))
+        except Exception:
+            requested = False
+        _opencl_enabled = requested and cv.ocl.haveOpenCL()
+        if _opencl_enabled:
+            cv.ocl.setUseOpenCL(True)
+            _log_framework(f'OpenCL enabled - template matching runs on {cv.ocl.Device.getDefault().name()}')
+        elif requested:
+            _log_framework('use_opencl is set but no OpenCL device was found - matching on the CPU')
+    return _opencl_enabled
+
+
 class BotStoppedException(Exception):
     """Exception raised when bot execution is stopped by user
 
@@ -54,6 +107,17 @@ class BOT:
     _shared_needles: dict = {}
     _shared_needles_lock = threading.Lock()
 
+    # Coarse-to-fine matching: needles at least this many pixels in both
+    # dimensions are first matched on a half-resolution (pyrDown) screenshot
+    PYRAMID_MIN_NEEDLE = 24
+    # A coarse score must reach accuracy - PYRAMID_MARGIN before the
+    # full-resolution check around the coarse peak. Downscaling a needle that
+    # sits on an odd pixel offset costs it up to ~0.2 of score, hence the margin.
+    PYRAMID_MARGIN = 0.25
+    # Coarse peaks confirmed at full resolution before giving up - a similar
+    # looking element can outscore the real needle at half resolution
+    PYRAMID_PEAKS = 3
+
     def __init__(self, android_device, findimg_path=None):
         """Initialize bot with Android device connection
 
@@ -73,8 +137,15 @@ class BOT:
         self.needle = {}  # Points to shared cache after loading
         self.gui = None
         self.should_stop = False
+        self.speed_multiplier = DEFAULT_SPEED_MULTIPLIER  # Scales bot.wait() delays
         self._template_cache = {}  # Cache for template matching results
         self._cache_max_size = 50  # Limit cache size to prevent memory bloat
+        self._pyramid_cache = {}  # Half-resolution search areas of the last screenshot
+        self._bgr_cache = None  # (screenshot, screenshot without alpha) for opaque needles
+        self._cuda_matcher = None  # cv.cuda TemplateMatching, created on first GPU match
+        self._gpu_cache = {}  # Uploaded search areas of the last screenshot (CUDA or OpenCL)
+        self._gpu_needles = {}  # Uploaded needles, keyed by (needle name, channels)
+        self._screen_cache = None  # (monotonic time, screens key, screen) from current_screen()
         self._findimg_path = findimg_path
 
         # Command queue for serialized execution of remote commands
@@ -334,8 +405,10 @@ class BOT:
             if cache_key in cls._shared_needles:
                 return cls._shared_needles[cache_key]
 
-            # Load needles into shared cache
-            needles = {'findimg': {}}
+            # Load needles into shared cache. 'bgr' holds alpha-free copies of
+            # fully opaque needles and 'half' the precomputed half-resolution
+            # copies used for coarse-to-fine matching.
+            needles = {'findimg': {}, 'bgr': {}, 'half': {}}
 
             if not os.path.exists(folder_path):
                 _log_framework(f'WARNING: findimg folder not found: {folder_path}')
@@ -354,6 +427,19 @@ class BOT:
                         needle_path, cv.IMREAD_UNCHANGED
                     )
 
+            for needle_name, needle in needles['findimg'].items():
+                if needle is None:
+                    continue
+                # A constant alpha channel adds nothing to TM_CCOEFF_NORMED scores
+                # but a quarter of the matching work - drop it
+                if needle.ndim == 3 and needle.shape[2] == 4 and needle[:, :, 3].min() == 255:
+                    needle = needles['bgr'][needle_name] = cv.cvtColor(needle, cv.COLOR_BGRA2BGR)
+                elif needle.ndim == 3 and needle.shape[2] == 3:
+                    # Cropped from a 3-channel screenshot - match against the BGR screenshot
+                    needles['bgr'][needle_name] = needle
+                if min(needle.shape[:2]) >= cls.PYRAMID_MIN_NEEDLE:
+                    needles['half'][needle_name] = cv.pyrDown(needle)
+
             _log_framework(f'Loaded {len(needles["findimg"])} needle images (shared)')
             cls._shared_needles[cache_key] = needles
             return needles
@@ -389,7 +475,8 @@ class BOT:
             screenshot: Pre-captured screenshot, or None to capture new (default: None)
             click_delay: Touch delay parameter in ms (default: 10)
             show_screenshot: Display screenshot for debugging (default: False)
-            search_region: Optional tuple (x, y, w, h) to limit search area for 2-4x speedup (default: None)
+            search_region: Optional tuple (x, y, w, h) to limit search area for 2-4x speedup
+                          (default: None - uses the needle's registered region, see core.regions)
             use_cache: Use cached template matching results for repeated searches (default: False)
             sqdiff: Use TM_SQDIFF_NORMED matching which is sensitive to brightness differences (default: False)
 
@@ -418,9 +505,154 @@ class BOT:
             cv.imshow("test", screenshot)
             cv.waitKey()
 
-        # Cache debug mode check for this method call
-        debug_mode = self.is_debug_mode
+        if search_region is None:
+            search_region = get_region(needle_name, screenshot)
+
+        max_val, max_loc = self._match(needle_name, screenshot, search_region, use_cache, sqdiff, accuracy)
+        return self._report_match(needle_name, screenshot, max_val, max_loc, accuracy, tap,
+                                  offset_x, offset_y, click_delay, search_region)
+
+    def find_first_of(self, candidates, accuracy=0.9, tap=True, screenshot=None,
+                      click_delay=10, search_region=None, sqdiff=False):
+        """Find the first of several needles on one screenshot and optionally tap it
+
+        Candidates are matched in order against the same screenshot and the
+        search stops at the first hit, so a list of mutually exclusive popups
+        costs one capture and only as many matches as needed.
+
+        Args:
+            candidates: Needle names, or (needle_name, accuracy) tuples, in priority order
+            accuracy: Accuracy for candidates given without one (default: 0.9)
+            tap: Whether to tap the needle that was found (default: True)
+            screenshot: Pre-captured screenshot, or None to capture new (default: None)
+            click_delay: Touch delay parameter in ms (default: 10)
+            search_region: Optional tuple (x, y, w, h) to limit search area
+                          (default: None - each needle's registered region, see core.regions)
+            sqdiff: Use TM_SQDIFF_NORMED matching which is sensitive to brightness differences (default: False)
+
+        Returns:
+            tuple: (needle_name, (x, y)) of the first match, or (None, None) if none matched
+
+        Example:
+            name, _ = bot.find_first_of([('close_ad', 0.99), 'back_button'])
+            if name:
+                print(f"Closed {name}")
+        """
+        self.check_should_stop()
+
+        if screenshot is None:
+            screenshot = self.screenshot()
+
+        for candidate in candidates:
+            if isinstance(candidate, str):
+                needle_name, needle_accuracy = candidate, accuracy
+            else:
+                needle_name, needle_accuracy = candidate
+
+            region = search_region if search_region is not None else get_region(needle_name, screenshot)
+            max_val, max_loc = self._match(needle_name, screenshot, region, sqdiff=sqdiff,
+                                           accuracy=needle_accuracy)
+            if self._report_match(needle_name, screenshot, max_val, max_loc, needle_accuracy, tap,
+                                  0, 0, click_delay, region):
+                return needle_name, max_loc
 
+        return None, None
+
+    def tap_while_visible(self, needle_name, max_taps=20, accuracy=0.9, offset_x=0, offset_y=0,
+                          offset_range=None, delay="ANIMATION"):
+        """Keep tapping a needle until it is no longer on screen
+
+        Each iteration takes one screenshot; the loop stops as soon as a
+        screenshot does not show the needle or after max_taps taps.
+
+        Args:
+            needle_name: Name of the needle image to tap
+            max_taps: Maximum number of taps (default: 20)
+            accuracy: Match accuracy threshold (default: 0.9)
+            offset_x: X offset from found location (default: 0)
+            offset_y: Y offset from found location (default: 0)
+            offset_range: Optional ((min_x, max_x), (min_y, max_y)) - uses a new random
+                          offset (bounds inclusive) after every tap, starting from
+                          offset_x/offset_y (default: None)
+            delay: Named delay to wait after each tap, see core.timings (default: "ANIMATION")
+
+        Returns:
+            int: Number of taps made
+
+        Example:
+            # Collect every gift, tapping slightly off the icon's corner
+            bot.tap_while_visible("gift", accuracy=0.98, offset_x=3, offset_y=3)
+        """
+        jitter = None
+        if offset_range:
+            # Draw all offsets up front rather than two randint calls per tap
+            (min_x, max_x), (min_y, max_y) = offset_range
+            jitter = np.column_stack((
+                np.random.randint(min_x, max_x + 1, max_taps),
+                np.random.randint(min_y, max_y + 1, max_taps),
+            )).tolist()
+
+        taps = 0
+        while taps < max_taps and self.find_and_click(needle_name, offset_x=offset_x, offset_y=offset_y,
+                                                       accuracy=accuracy):
+            if jitter:
+                offset_x, offset_y = jitter[taps]
+            taps += 1
+            self.wait(delay)
+        return taps
+
+    def current_screen(self, screens, ttl=0.2, accuracy=0.99, screenshot=None, sqdiff=False):
+        """Identify which screen is showing, reusing a very recent answer
+
+        Screen checks like "am I on the map or main screen?" run at the start
+        of most bot functions. If the same screens were classified less than
+        ttl seconds ago and nothing was tapped since, the previous answer is
+        returned without a screenshot or template match.
+
+        Args:
+            screens: Needle names (or (needle_name, accuracy) tuples) that identify
+                     each screen, in priority order
+            ttl: Seconds a previous answer stays valid (default: 0.2)
+            accuracy: Accuracy for screens given without one (default: 0.99)
+            screenshot: Pre-captured screenshot - always classified fresh (default: None)
+            sqdiff: Use TM_SQDIFF_NORMED matching which is sensitive to brightness differences (default: False)
+
+        Returns:
+            str or None: Needle name of the first screen found, or None
+
+        Example:
+            if bot.current_screen(['screen-map', 'screen-main']) is None:
+                return  # Not on a known screen
+        """
+        key = (tuple(screens), accuracy, sqdiff)
+        now = time.monotonic()
+
+        cached = self._screen_cache
+        if screenshot is None and cached and cached[1] == key and now - cached[0] < ttl:
+            return cached[2]
+
+        screen, _ = self.find_first_of(screens, accuracy=accuracy, tap=False,
+                                       screenshot=screenshot, sqdiff=sqdiff)
+        self._screen_cache = (now, key, screen)
+        return screen
+
+    def _match(self, needle_name, screenshot, search_region=None, use_cache=False, sqdiff=False,
+               accuracy=None):
+        """Template-match one needle against a screenshot
+
+        Args:
+            needle_name: Name of the needle image to find
+            screenshot: Screenshot to search
+            search_region: Optional tuple (x, y, w, h) to limit search area (default: None)
+            use_cache: Use cached template matching results (default: False)
+            sqdiff: Use TM_SQDIFF_NORMED matching (default: False)
+            accuracy: Threshold the caller will apply - enables coarse-to-fine
+                      matching for large needles (default: None)
+
+        Returns:
+            tuple: (score, (x, y)) - best score on a 0-1 higher-is-better scale and
+                   the top-left match position in full screenshot coordinates
+        """
         # Handle ROI (Region of Interest) for faster searching
         search_area = screenshot
         roi_offset_x, roi_offset_y = 0, 0
@@ -445,7 +677,17 @@ class BOT:
             # (both dimensions under 10 pixels) to avoid false positives from normalization artifacts
             use_sqdiff = sqdiff or (needle_h < 10 and needle_w < 10)
 
+            area_h, area_w = search_area.shape[:2]
+            use_pyramid = (
+                accuracy is not None and not use_cache and
+                min(needle_h, needle_w) >= self.PYRAMID_MIN_NEEDLE and
+                area_h >= 2 * needle_h and area_w >= 2 * needle_w
+            )
+
             if use_sqdiff:
+                if needle.ndim == 3 and needle.shape[2] == 3:
+                    needle, search_area = self._ccoeff_inputs(needle_name, needle, screenshot,
+                                                              search_region, search_area)
                 # TM_SQDIFF_NORMED: lower values = better match (0 is perfect)
                 result = cv.matchTemplate(search_area, needle, cv.TM_SQDIFF_NORMED)
                 min_val, _, min_loc, _ = cv.minMaxLoc(result)
@@ -453,9 +695,22 @@ class BOT:
                 max_val = 1.0 - min_val
                 max_loc = min_loc
             else:
-                # Match needle using OpenCV template matching
-                result = cv.matchTemplate(search_area, needle, cv.TM_CCOEFF_NORMED)
-                _, max_val, _, max_loc = cv.minMaxLoc(result)
+                needle, search_area = self._ccoeff_inputs(needle_name, needle, screenshot,
+                                                          search_region, search_area)
+                if _has_cuda():
+                    # Full-resolution GPU matching beats the CPU coarse-to-fine path
+                    max_val, max_loc = self._match_cuda(needle_name, needle, screenshot,
+                                                        search_region, search_area)
+                elif _has_opencl():
+                    max_val, max_loc = self._match_opencl(needle_name, needle, screenshot,
+                                                          search_region, search_area)
+                elif use_pyramid:
+                    max_val, max_loc = self._match_pyramid(needle_name, needle, screenshot,
+                                                           search_region, search_area, accuracy)
+                else:
+                    # Match needle using OpenCV template matching
+                    result = cv.matchTemplate(search_area, needle, cv.TM_CCOEFF_NORMED)
+                    _, max_val, _, max_loc = cv.minMaxLoc(result)
 
             # Cache the result (with size limit to prevent memory bloat)
             if use_cache:
@@ -464,34 +719,244 @@ class BOT:
                     self._template_cache.pop(next(iter(self._template_cache)))
                 self._template_cache[cache_key] = (max_val, max_loc)
 
+        return max_val, (max_loc[0] + roi_offset_x, max_loc[1] + roi_offset_y)
+
+    def _ccoeff_inputs(self, needle_name, needle, screenshot, search_region, search_area):
+        """Get the needle and search area to use for TM_CCOEFF_NORMED matching
+
+        Fully opaque needles are matched without their alpha channel against
+        the screenshot without its alpha channel. The screenshot is converted
+        once and reused for every needle matched against it.
+
+        Args:
+            needle_name: Name of the needle
+            needle: Needle image as loaded
+            screenshot: Screenshot being searched (cache key for the conversion)
+            search_region: Search region tuple or None
+            search_area: Area of the screenshot to search
+
+        Returns:
+            tuple: (needle, search_area) - alpha-free copies when possible, else unchanged
+        """
+        needle_bgr = self.needle.get('bgr', {}).get(needle_name)
+        if needle_bgr is None or search_area.ndim != 3 or search_area.shape[2] != 4:
+            return needle, search_area
+
+        cached = self._bgr_cache
+        if cached is None or cached[0] is not screenshot:
+            cached = self._bgr_cache = (screenshot, cv.cvtColor(screenshot, cv.COLOR_BGRA2BGR))
+        screenshot_bgr = cached[1]
+
+        if search_region:
+            x, y, w, h = search_region
+            return needle_bgr, screenshot_bgr[y:y+h, x:x+w]
+        return needle_bgr, screenshot_bgr
+
+    def _match_cuda(self, needle_name, needle, screenshot, search_region, search_area):
+        """TM_CCOEFF_NORMED match on the CUDA device
+
+        Each search area is uploaded once per screenshot and each needle once
+        per bot, so matching several needles against one screenshot only
+        transfers the screenshot once. Only the best score and its position
+        are read back.
+
+        Args:
+            needle_name: Name of the needle (cache key for its upload)
+            needle: Needle image (as prepared by _ccoeff_inputs)
+            screenshot: Screenshot being searched (cache key for the uploaded area)
+            search_region: Search region tuple or None (cache key)
+            search_area: Area to search
+
+        Returns:
+            tuple: (score, (x, y)) relative to search_area
+        """
+        if self._cuda_matcher is None:
+            self._cuda_matcher = cv.cuda.createTemplateMatching(cv.CV_8U, cv.TM_CCOEFF_NORMED)
+
+        channels = search_area.shape[2:]
+        needle_key = (needle_name, channels)
+        gpu_needle = self._gpu_needles.get(needle_key)
+        if gpu_needle is None:
+            gpu_needle = self._gpu_needles[needle_key] = cv.cuda_GpuMat()
+            gpu_needle.upload(np.ascontiguousarray(needle))
+
+        cache = self._gpu_cache
+        if cache.get('screenshot') is not screenshot:
+            cache = self._gpu_cache = {'screenshot': screenshot}
+        area_key = (search_region, channels)
+        gpu_area = cache.get(area_key)
+        if gpu_area is None:
+            gpu_area = cache[area_key] = cv.cuda_GpuMat()
+            gpu_area.upload(np.ascontiguousarray(search_area))
+
+        result = self._cuda_matcher.match(gpu_area, gpu_needle)
+        _, max_val, _, max_loc = cv.cuda.minMaxLoc(result)
+        return max_val, max_loc
+
+    def _match_opencl(self, needle_name, needle, screenshot, search_region, search_area):
+        """TM_CCOEFF_NORMED match through OpenCL (UMat)
+
+        Same caching as _match_cuda: each search area is wrapped in a UMat once
+        per screenshot and each needle once per bot.
+
+        Args:
+            needle_name: Name of the needle (cache key for its UMat)
+            needle: Needle image (as prepared by _ccoeff_inputs)
+            screenshot: Screenshot being searched (cache key for the area UMat)
+            search_region: Search region tuple or None (cache key)
+            search_area: Area to search
+
+        Returns:
+            tuple: (score, (x, y)) relative to search_area
+        """
+        channels = search_area.shape[2:]
+        needle_key = (needle_name, channels)
+        umat_needle = self._gpu_needles.get(needle_key)
+        if umat_needle is None:
+            umat_needle = self._gpu_needles[needle_key] = cv.UMat(np.ascontiguousarray(needle))
+
+        cache = self._gpu_cache
+        if cache.get('screenshot') is not screenshot:
+            cache = self._gpu_cache = {'screenshot': screenshot}
+        area_key = (search_region, channels)
+        umat_area = cache.get(area_key)
+        if umat_area is None:
+            umat_area = cache[area_key] = cv.UMat(np.ascontiguousarray(search_area))
+
+        result = cv.matchTemplate(umat_area, umat_needle, cv.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv.minMaxLoc(result)
+        return max_val, max_loc
+
+    def _match_pyramid(self, needle_name, needle, screenshot, search_region, search_area, accuracy):
+        """Coarse-to-fine TM_CCOEFF_NORMED match
+
+        Matches the half-resolution needle against the half-resolution search
+        area (a quarter of the work), and only when the coarse score is close
+        to accuracy confirms it at full resolution in a small window around
+        the coarse peak. If that peak fails confirmation, the next best coarse
+        peaks (up to PYRAMID_PEAKS in total) are tried the same way.
+
+        Args:
+            needle_name: Name of the needle (cache key for its half-resolution copy)
+            needle: Full-resolution needle image (as prepared by _ccoeff_inputs)
+            screenshot: Screenshot being searched (cache key for the half-resolution area)
+            search_region: Search region tuple or None (cache key)
+            search_area: Full-resolution area to search
+            accuracy: Threshold the caller will apply
+
+        Returns:
+            tuple: (score, (x, y)) relative to search_area
+        """
+        # Precomputed at load time; needles added to the set later are downscaled on first use
+        half_needles = self.needle.setdefault('half', {})
+        needle_half = half_needles.get(needle_name)
+        if needle_half is None:
+            needle_half = half_needles[needle_name] = cv.pyrDown(needle)
+
+        # Downscale each search area once per screenshot
+        cache = self._pyramid_cache
+        if cache.get('screenshot') is not screenshot:
+            cache = self._pyramid_cache = {'screenshot': screenshot}
+        area_key = (search_region, search_area.shape[2:])
+        area_half = cache.get(area_key)
+        if area_half is None:
+            area_half = cache[area_key] = cv.pyrDown(search_area)
+
+        result = cv.matchTemplate(area_half, needle_half, cv.TM_CCOEFF_NORMED)
+        _, coarse_val, _, coarse_loc = cv.minMaxLoc(result)
+
+        if coarse_val < accuracy - self.PYRAMID_MARGIN:
+            return coarse_val, (coarse_loc[0] * 2, coarse_loc[1] * 2)
+
+        needle_h, needle_w = needle.shape[:2]
+        half_h, half_w = needle_half.shape[:2]
+        area_h, area_w = search_area.shape[:2]
+        best = None
+
+        for _ in range(self.PYRAMID_PEAKS):
+            # Confirm at full resolution in a window padded by 4px around the coarse peak
+            coarse_x, coarse_y = coarse_loc[0] * 2, coarse_loc[1] * 2
+            x0, y0 = max(0, coarse_x - 4), max(0, coarse_y - 4)
+            x1, y1 = min(area_w, coarse_x + needle_w + 4), min(area_h, coarse_y + needle_h + 4)
+            full_search = x1 - x0 < needle_w or y1 - y0 < needle_h
+            if full_search:
+                x0, y0, x1, y1 = 0, 0, area_w, area_h
+
+            fine = cv.matchTemplate(search_area[y0:y1, x0:x1], needle, cv.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv.minMaxLoc(fine)
+            if best is None or max_val > best[0]:
+                best = (max_val, (max_loc[0] + x0, max_loc[1] + y0))
+            if max_val >= accuracy or full_search:
+                break
+
+            # Blank out this peak's neighbourhood and move on to the next best one
+            cx, cy = coarse_loc
+            result[max(0, cy - half_h // 2):cy + half_h // 2 + 1,
+                   max(0, cx - half_w // 2):cx + half_w // 2 + 1] = -1
+            _, coarse_val, _, coarse_loc = cv.minMaxLoc(result)
+            if coarse_val < accuracy - self.PYRAMID_MARGIN:
+                break
+
+        return best
+
+    def _report_match(self, needle_name, screenshot, max_val, match_loc, accuracy, tap,
+                      offset_x, offset_y, click_delay, search_region):
+        """Log a match result and tap it if requested
+
+        Args:
+            needle_name: Name of the matched needle
+            screenshot: Screenshot the match was made on
+            max_val: Match score from _match()
+            match_loc: Top-left match position in screenshot coordinates
+            accuracy: Threshold the score must exceed
+            tap: Whether to tap if found
+            offset_x: X offset from found location
+            offset_y: Y offset from found location
+            click_delay: Touch delay parameter in ms
+            search_region: Search region used for the match, or None
+
+        Returns:
+            bool: True if max_val exceeds accuracy
+        """
+        # Cache debug mode check for this method call
+        debug_mode = self.is_debug_mode
+
+        search_area = screenshot
+        roi_offset_x, roi_offset_y = 0, 0
+        if search_region:
+            x, y, w, h = search_region
+            search_area = screenshot[y:y+h, x:x+w]
+            roi_offset_x, roi_offset_y = x, y
+
         # Check if match found
         if max_val > accuracy:
             accuracy_percent = round(max_val * 100, 2)
 
-            # Calculate final tap position (adjust for ROI offset)
-            final_x = max_loc[0] + roi_offset_x + offset_x
-            final_y = max_loc[1] + roi_offset_y + offset_y
+            # Calculate final tap position
+            final_x = match_loc[0] + offset_x
+            final_y = match_loc[1] + offset_y
 
             # Create annotated screenshot once if debug mode is on
             annotated_screenshot = None
             if debug_mode:
+                needle_h, needle_w = self.get_needle(needle_name).shape[:2]
                 # If search_region is set, log the cropped region instead of full screenshot
                 if search_region:
                     annotated_screenshot = search_area.copy()
                     # Draw rectangle around found needle (coordinates relative to cropped region)
-                    top_left = (max_loc[0], max_loc[1])
+                    top_left = (match_loc[0] - roi_offset_x, match_loc[1] - roi_offset_y)
                     bottom_right = (top_left[0] + needle_w, top_left[1] + needle_h)
                     cv.rectangle(annotated_screenshot, top_left, bottom_right, (0, 0, 255, 255), 3)
 
                     # Draw crosshair at detection position (relative to cropped region)
                     crosshair_color = (0, 0, 255, 255) if tap else (0, 255, 0, 255)
-                    crosshair_x = max_loc[0] + offset_x
-                    crosshair_y = max_loc[1] + offset_y
+                    crosshair_x = top_left[0] + offset_x
+                    crosshair_y = top_left[1] + offset_y
                     self._draw_crosshair(annotated_screenshot, crosshair_x, crosshair_y, crosshair_color, size=25, thickness=3)
                 else:
                     annotated_screenshot = screenshot.copy()
                     # Draw rectangle around found needle
-                    top_left = (max_loc[0] + roi_offset_x, max_loc[1] + roi_offset_y)
+                    top_left = match_loc
                     bottom_right = (top_left[0] + needle_w, top_left[1] + needle_h)
                     cv.rectangle(annotated_screenshot, top_left, bottom_right, (0, 0, 255, 255), 3)
 
@@ -504,6 +969,7 @@ class BOT:
             if tap:
                 log_msg = f"TAP {needle_name} at ({final_x}, {final_y}) acc:{accuracy_percent}%"
                 self.log(log_msg, screenshot=annotated_screenshot)
+                self._screen_cache = None  # Tapping may change the screen
                 self.andy.touch(final_x, final_y, delay=click_delay, suppress_log=True)
             else:
                 log_msg = f"FOUND {needle_name} acc:{accuracy_percent}%"
@@ -530,7 +996,8 @@ class BOT:
             needle_name: Name of the needle image to find (without path/extension)
             accuracy: Match accuracy 0.0-1.0, higher is stricter (default: 0.9)
             screenshot: Pre-captured screenshot, or None to capture new (default: None)
-            search_region: Optional tuple (x, y, w, h) to limit search area (default: None)
+            search_region: Optional tuple (x, y, w, h) to limit search area
+                          (default: None - uses the needle's registered region, see core.regions)
             debug: Display annotated screenshot with detected needles (default: False)
 
         Returns:
@@ -559,6 +1026,9 @@ class BOT:
         if screenshot is None:
             screenshot = self.screenshot()
 
+        if search_region is None:
+            search_region = get_region(needle_name, screenshot)
+
         # Handle ROI (Region of Interest) for faster searching
         search_area = screenshot
         roi_offset_x, roi_offset_y = 0, 0
@@ -573,7 +1043,9 @@ class BOT:
         needle_h, needle_w = needle.shape[:2]
 
         # Match needle using OpenCV template matching
-        result = cv.matchTemplate(search_area, needle, cv.TM_CCOEFF_NORMED)
+        match_needle, match_area = self._ccoeff_inputs(needle_name, needle, screenshot,
+                                                       search_region, search_area)
+        result = cv.matchTemplate(match_area, match_needle, cv.TM_CCOEFF_NORMED)
 
         # Find all locations where match exceeds accuracy threshold
         locations = np.where(result >= accuracy)
@@ -756,6 +1228,7 @@ class BOT:
             self._draw_crosshair(annotated_screenshot, x, y, (0, 0, 255, 255), size=25, thickness=3)  # Red crosshair with alpha
             self.log(f"TAP COORDINATES at ({x}, {y})", screenshot=annotated_screenshot)
 
+        self._screen_cache = None  # Tapping may change the screen
         self.andy.touch(x, y)
 
     def swipe(self, x1, y1, x2, y2, duration=500):
@@ -785,8 +1258,21 @@ class BOT:
             cv.circle(annotated_screenshot, (x2, y2), 10, (0, 0, 255, 255), 3)  # Red hollow end with alpha
             self.log(f"SWIPE from ({x1}, {y1}) to ({x2}, {y2}) duration:{duration}ms", screenshot=annotated_screenshot)
 
+        self._screen_cache = None  # Swiping may change the screen
         self.andy.touch(x1, y1, x2, y2, delay=duration)
 
+    def wait(self, kind):
+        """Wait for a named UI delay scaled by this bot's speed multiplier
+
+        Args:
+            kind: Delay name from core.timings.DELAYS (e.g., "SHORT", "MEDIUM")
+
+        Example:
+            bot.tap(270, 480)
+            bot.wait("SHORT")  # Let the screen transition finish
+        """
+        time.sleep(get_delay(kind, self.speed_multiplier))
+
     # ============================================================================
     # SCREEN CAPTURE
     # ============================================================================
@@ -803,6 +1289,84 @@ class BOT:
         """
         return self.andy.capture_screen()
 
+    def _thumbnail(self, screenshot, region=None):
+        """Shrink a screenshot (or region of it) to a 16x16 fingerprint for change checks"""
+        if region:
+            x, y, w, h = region
+            screenshot = screenshot[y:y+h, x:x+w]
+        return cv.resize(screenshot, (16, 16), interpolation=cv.INTER_AREA)
+
+    def changed_blocks(self, screenshot1, screenshot2, block_size=32, threshold=8):
+        """Find which blocks of the screen differ between two screenshots
+
+        The screenshots are compared in block_size x block_size tiles: a tile
+        counts as changed when its mean absolute pixel difference exceeds
+        threshold. Partial tiles at the right and bottom edges are ignored.
+
+        Args:
+            screenshot1: First screenshot
+            screenshot2: Second screenshot (same shape as the first)
+            block_size: Tile edge length in pixels (default: 32)
+            threshold: Mean per-channel difference above which a tile changed (default: 8)
+
+        Returns:
+            numpy.ndarray: Bool array of shape (rows, cols), True where a tile changed
+
+        Example:
+            changed = bot.changed_blocks(before, bot.screenshot())
+            if changed[10:20, :].any():
+                bot.log("Something appeared mid-screen")
+        """
+        rows, cols = screenshot1.shape[0] // block_size, screenshot1.shape[1] // block_size
+        height, width = rows * block_size, cols * block_size
+        diff = cv.absdiff(screenshot1[:height, :width], screenshot2[:height, :width])
+        # Area resampling to exactly one pixel per tile averages each tile
+        means = cv.resize(diff, (cols, rows), interpolation=cv.INTER_AREA)
+        if means.ndim == 3:
+            means = means.mean(axis=2)
+        return means > threshold
+
+    def wait_for_change(self, screenshot=None, timeout=2.0, region=None, tolerance=8,
+                        min_interval=0.1, max_interval=1.0):
+        """Wait until the screen differs from a screenshot, backing off while it is static
+
+        Each check compares a 16x16 thumbnail of a new screenshot with the
+        reference. While the screen stays the same the delay between checks
+        grows by 1.5x from min_interval up to max_interval, so a static screen
+        costs few captures; a changed screen returns immediately.
+
+        Args:
+            screenshot: Reference screenshot, or None to capture one now (default: None)
+            timeout: Maximum seconds to wait (default: 2.0)
+            region: Optional (x, y, w, h) area to watch instead of the full screen
+            tolerance: Largest thumbnail pixel difference still counted as unchanged (default: 8)
+            min_interval: First delay between checks in seconds (default: 0.1)
+            max_interval: Longest delay between checks in seconds (default: 1.0)
+
+        Returns:
+            numpy.ndarray or None: The first changed screenshot, or None on timeout
+
+        Example:
+            sc = bot.screenshot()
+            bot.tap(270, 480)
+            if bot.wait_for_change(sc) is None:
+                bot.log("Tap had no effect")
+        """
+        if screenshot is None:
+            screenshot = self.screenshot()
+        reference = self._thumbnail(screenshot, region)
+
+        deadline = time.monotonic() + timeout
+        delay = min_interval
+        while time.monotonic() < deadline:
+            self.check_should_stop()
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            current = self.screenshot()
+            if cv.absdiff(self._thumbnail(current, region), reference).max() > tolerance:
+                return current
+            delay = min(delay * 1.5, max_interval)
+        return None
+
     # ============================================================================
     # TEXT INPUT & KEYBOARD
     # ============================================================================
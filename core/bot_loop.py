@@ -10,6 +10,7 @@ import time
 from .bot import BOT, BotStoppedException
 from .android import Android, AndroidStoppedException
 from .config_loader import get_serial, format_cooldown_time
+from .timings import get_speed_multiplier
 
 
 def run_bot_loop(gui, function_map, config, command_handlers=None, fix_recover_func=None, findimg_path=None):
@@ -73,6 +74,7 @@ def run_bot_loop(gui, function_map, config, command_handlers=None, fix_recover_f
     bot = BOT(andy, findimg_path=findimg_path)
     bot.set_gui(gui)
     bot.should_stop = False
+    bot.speed_multiplier = get_speed_multiplier(config, device)
 
     # Store bot and android references on GUI for access by functions
     gui.bot = bot
@@ -40,6 +40,7 @@ class LogDatabase:
         # Connect to database
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self._apply_pragmas()
 
         # Initialize schema
         self._init_schema()
@@ -49,6 +50,22 @@ class LogDatabase:
         self.session_id = None
         self._session_created = read_only  # If read_only, mark as "created" to prevent creation
 
+    def _apply_pragmas(self):
+        """Apply tuning PRAGMAs to the connection
+
+        Note:
+            journal_mode=WAL is stored in the database file, so only writers
+            set it; read-only viewers (LogViewer) get WAL once any bot has
+            opened the database, and then never block the bot's inserts.
+            The remaining PRAGMAs are connection settings.
+        """
+        if not self.read_only:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+        self.conn.execute('PRAGMA mmap_size=268435456')  # 256 MB memory-mapped I/O
+
     def _init_schema(self):
         """Initialize database schema if not exists"""
         cursor = self.conn.cursor()
@@ -114,32 +131,44 @@ class LogDatabase:
         Returns:
             int: Entry ID of inserted log
         """
+        self.add_log_entries([(message, screenshot, datetime.now())])
+        return self.conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+
+    def add_log_entries(self, entries):
+        """Add several log entries in a single transaction
+
+        Args:
+            entries: Iterable of (message, screenshot, logged_at) tuples, where
+                     screenshot may be None and logged_at is a datetime
+        """
         # Lazy session creation - only create session when first entry is added
         if not self._session_created:
             self.session_id = self._create_session()
             self._session_created = True
 
-        cursor = self.conn.cursor()
+        rows = []
+        for message, screenshot, logged_at in entries:
+            timestamp_ms = logged_at.strftime("%H:%M:%S.%f")[:-3]  # HH:MM:SS.sss
 
-        now = datetime.now()
-        timestamp = now
-        timestamp_ms = now.strftime("%H:%M:%S.%f")[:-3]  # HH:MM:SS.sss
+            # Convert screenshot to PNG bytes if provided
+            screenshot_blob = None
+            if screenshot is not None:
+                # Encode screenshot as PNG
+                success, encoded = cv.imencode('.png', screenshot)
+                if success:
+                    screenshot_blob = encoded.tobytes()
 
-        # Convert screenshot to PNG bytes if provided
-        screenshot_blob = None
-        if screenshot is not None:
-            # Encode screenshot as PNG
-            success, encoded = cv.imencode('.png', screenshot)
-            if success:
-                screenshot_blob = encoded.tobytes()
+            rows.append((self.session_id, logged_at, timestamp_ms, message, screenshot_blob))
 
-        cursor.execute('''
+        if not rows:
+            return
+
+        self.conn.executemany('''
             INSERT INTO log_entries (session_id, timestamp, timestamp_ms, message, screenshot)
             VALUES (?, ?, ?, ?, ?)
-        ''', (self.session_id, timestamp, timestamp_ms, message, screenshot_blob))
+        ''', rows)
 
         self.conn.commit()
-        return cursor.lastrowid
 
     def get_sessions(self):
         """Get all sessions for this device
@@ -45,24 +45,25 @@ def extract_ratio_from_image(bot, image, fallback_used=0, fallback_of=1):
         # Convert to grayscale for preprocessing
         gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
 
-        # Try multiple preprocessing approaches to handle different text styles/backgrounds
-        processed_images = [
+        # Try multiple preprocessing approaches to handle different text styles/backgrounds.
+        # Generated lazily - the first one usually reads the ratio, so the
+        # others are only computed when it fails.
+        def processed_images():
             # Simple binary threshold at midpoint (127) - works for high contrast text
-            ('Simple Threshold', cv.threshold(gray, 127, 255, cv.THRESH_BINARY)[1]),
+            yield 'Simple Threshold', cv.threshold(gray, 127, 255, cv.THRESH_BINARY)[1]
 
             # Adaptive threshold - adjusts to local brightness variations
-            ('Adaptive Threshold', cv.adaptiveThreshold(
+            yield 'Adaptive Threshold', cv.adaptiveThreshold(
                 gray, 255, cv.ADAPTIVE_THRESH_GAUSSIAN_C, cv.THRESH_BINARY, 11, 2
-            )),
+            )
 
             # Otsu's method - automatically determines optimal threshold value
-            ('OTSU Threshold', cv.threshold(gray, 0, 255, cv.THRESH_BINARY + cv.THRESH_OTSU)[1]),
-        ]
+            otsu = cv.threshold(gray, 0, 255, cv.THRESH_BINARY + cv.THRESH_OTSU)[1]
+            yield 'OTSU Threshold', otsu
 
-        # Add morphological closing to remove small noise and connect broken characters
-        kernel = np.ones((2, 2), np.uint8)
-        morph = cv.morphologyEx(processed_images[2][1], cv.MORPH_CLOSE, kernel)
-        processed_images.append(('Morphological', morph))
+            # Morphological closing to remove small noise and connect broken characters
+            kernel = np.ones((2, 2), np.uint8)
+            yield 'Morphological', cv.morphologyEx(otsu, cv.MORPH_CLOSE, kernel)
 
         # OCR configurations to try (different Page Segmentation Modes)
         configs = [
@@ -72,7 +73,7 @@ def extract_ratio_from_image(bot, image, fallback_used=0, fallback_of=1):
         ]
 
         # Test each preprocessed image with each OCR config (12 combinations total)
-        for name, processed_img in processed_images:
+        for name, processed_img in processed_images():
             pil_img = Image.fromarray(processed_img)
 
             for config in configs:
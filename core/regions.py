@@ -0,0 +1,57 @@
+"""
+Search Regions - Per-needle template matching areas
+
+Many needles only ever appear in a fixed part of the screen. Registering a
+search region for them lets BOT.find_and_click(), find_first_of() and
+find_all() match against that area instead of the full screenshot, which
+cuts template matching cost roughly in proportion to the area saved.
+
+Game modules register their regions once at import time:
+
+    from core.regions import register_regions
+
+    register_regions({
+        'main-parking-activespot': (10, 570, 85, 20),
+    })
+
+All functions are game-agnostic.
+"""
+
+# Needle name -> (x, y, w, h) in full-screenshot coordinates
+SEARCH_REGIONS = {}
+
+
+def register_regions(regions):
+    """Register default search regions for needles
+
+    Args:
+        regions: Dict mapping needle name to (x, y, w, h)
+
+    Note:
+        Later registrations for the same needle replace earlier ones.
+    """
+    for needle_name, region in regions.items():
+        SEARCH_REGIONS[needle_name] = tuple(region)
+
+
+def get_region(needle_name, screenshot):
+    """Get the registered search region for a needle, if it fits the screenshot
+
+    Args:
+        needle_name: Name of the needle
+        screenshot: Screenshot that will be searched
+
+    Returns:
+        tuple or None: (x, y, w, h), or None if no region is registered or
+                       the region falls outside the screenshot (e.g. when
+                       the caller passes an already-cropped image)
+    """
+    region = SEARCH_REGIONS.get(needle_name)
+    if region is None:
+        return None
+
+    x, y, w, h = region
+    height, width = screenshot.shape[:2]
+    if x + w > width or y + h > height:
+        return None
+    return region
@@ -37,9 +37,26 @@ Usage:
 import sqlite3
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime
 import cv2 as cv
 import threading
+import time
+
+# orjson is optional - falls back to the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard is optional - without it text columns are stored uncompressed
+try:
+    import zstandard
+    _zstd_compressor = zstandard.ZstdCompressor(level=1)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+except ImportError:
+    _zstd_compressor = None
+    _zstd_decompressor = None
 
 # Cache for valid checkboxes loaded from config
 _valid_checkboxes_cache = None
@@ -67,6 +84,195 @@ def _get_valid_checkboxes():
     return _valid_checkboxes_cache
 
 
+# Screenshot encoding - WebP is 30-50% smaller than JPEG at the same quality
+SCREENSHOT_QUALITY = 80
+
+# Whether this OpenCV build can encode WebP (None = not probed yet)
+_webp_supported = None
+
+# Schema version stored in PRAGMA user_version.
+# Bump when _init_schema gains tables, columns or indexes.
+SCHEMA_VERSION = 4
+
+# A device has an active screenshot viewer if its screenshot was read within
+# this many seconds; readers record a read at most every VIEW_MARK_INTERVAL
+VIEWER_TIMEOUT = 10
+VIEW_MARK_INTERVAL = 2
+
+# bot_states columns returned by the state queries. latest_screenshot is left
+# out on purpose - only get_device_screenshot*() read the BLOB. Callers that
+# just need to know whether a screenshot exists use the computed has_screenshot.
+_STATE_COLS = (
+    'device_name', 'is_running', 'last_update', 'start_time', 'end_time',
+    'doStreet', 'doArtists', 'doStudio', 'doTour', 'doGroup', 'doConcert',
+    'doHelp', 'doCoin', 'doHeal', 'doRally', 'doParking', 'doGig',
+    'fix_enabled', 'debug_enabled', 'sleep_time', 'studio_stop',
+    'screenshot_interval', 'ld_running', 'screenshot_len',
+    'screenshot_timestamp', 'current_log', 'current_action', 'command_queue',
+)
+
+# Text columns that may hold zstd-compressed data (see _pack_text)
+_PACKED_COLS = ('current_log', 'command_queue')
+
+_STATE_COLS_SQL = ', '.join(
+    f'unpack_text({col}) AS {col}' if col in _PACKED_COLS else col
+    for col in _STATE_COLS
+) + ', screenshot_len > 0 AS has_screenshot'
+
+# Checkboxes listed in get_running_bots_summary(), and a SQL expression that
+# builds the comma-separated list of the enabled ones (e.g. "doStreet, doCoin")
+_SUMMARY_CHECKBOXES = ('doStreet', 'doArtists', 'doStudio', 'doTour', 'doGroup',
+                       'doConcert', 'doHelp', 'doCoin', 'doHeal', 'doRally')
+_ENABLED_SQL = 'substr({}, 3)'.format(' || '.join(
+    f"CASE WHEN {cb} = 1 THEN ', {cb}' ELSE '' END" for cb in _SUMMARY_CHECKBOXES
+))
+
+# Remote command statements. Kept as constants so every call passes the same
+# SQL text and hits the connection's prepared-statement cache.
+# created_at/processed_at are INTEGER unix epoch seconds, stamped by SQLite.
+_SQL_EPOCH_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+_SQL_INSERT_COMMAND = f'''
+    INSERT INTO remote_commands (device_name, command_type, command_data, created_at)
+    VALUES (?, ?, ?, {_SQL_EPOCH_NOW})
+'''
+_SQL_SELECT_PENDING = '''
+    SELECT id, command_type, command_data, created_at FROM remote_commands
+    WHERE device_name = ? AND processed = 0
+    ORDER BY created_at ASC
+'''
+_SQL_DELETE_OLD_COMMANDS = '''
+    DELETE FROM remote_commands
+    WHERE processed = 1 AND processed_at < ?
+'''
+
+# Size of each connection's prepared-statement cache
+_CACHED_STATEMENTS = 256
+
+# Frame magic number that starts every zstd-compressed value
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _json_dumps(obj):
+    """Serialize an object to compact JSON text (orjson when available)
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        str: JSON text without extra whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes (orjson when available)
+
+    Args:
+        data: JSON str or bytes
+
+    Returns:
+        object: Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _to_pending(row):
+    """Convert a _SQL_SELECT_PENDING result tuple to a command dict
+
+    Args:
+        row: (id, command_type, command_data, created_at) tuple
+
+    Returns:
+        dict: Command with id, command_type, command_data (decoded or None), created_at
+    """
+    data = row[2]
+    return {
+        'id': row[0],
+        'command_type': row[1],
+        'command_data': _json_loads(data) if data else None,
+        'created_at': row[3],
+    }
+
+
+def _pack_text(text):
+    """Compress a text column value with zstd when that makes it smaller
+
+    Args:
+        text: String to store
+
+    Returns:
+        bytes or str: Compressed bytes, or the original string if zstandard
+                      is unavailable or compression doesn't save space
+    """
+    if _zstd_compressor is None or not text:
+        return text
+    raw = text.encode('utf-8')
+    packed = _zstd_compressor.compress(raw)
+    return packed if len(packed) < len(raw) else text
+
+
+def _unpack_text(value):
+    """Decode a text column value written by _pack_text
+
+    Registered on every connection as the SQL function unpack_text().
+
+    Args:
+        value: Column value (str, zstd-compressed bytes, or None)
+
+    Returns:
+        str or None: Decoded text
+    """
+    if isinstance(value, bytes):
+        if value.startswith(_ZSTD_MAGIC):
+            if _zstd_decompressor is None:
+                return None  # Written by a process with zstandard installed
+            value = _zstd_decompressor.decompress(value)
+        return value.decode('utf-8')
+    return value
+
+# WAL checkpoint policy for the background writer (seconds / bytes)
+WAL_CHECKPOINT_INTERVAL = 60
+WAL_CHECKPOINT_MAX_BYTES = 16 * 1024 * 1024
+
+# Pre-allocated size of the latest_screenshot BLOB. Frames that fit are written
+# in place with incremental BLOB I/O instead of rewriting the row.
+SCREENSHOT_MAX_BYTES = 300 * 1024
+
+
+def _encode_screenshot(screenshot, quality=SCREENSHOT_QUALITY):
+    """Encode a screenshot for storage in the state database
+
+    Args:
+        screenshot: Numpy array (BGR/BGRA format)
+        quality: Encoder quality (1-100)
+
+    Returns:
+        bytes or None: Encoded image bytes, or None if encoding failed
+
+    Note:
+        Uses WebP when the OpenCV build supports it, otherwise JPEG.
+        Readers use cv.imdecode which detects the format from the data,
+        so no format marker is stored alongside the BLOB.
+    """
+    global _webp_supported
+    if _webp_supported is not False:
+        try:
+            success, encoded = cv.imencode('.webp', screenshot, [cv.IMWRITE_WEBP_QUALITY, quality])
+            _webp_supported = True
+            if success:
+                return encoded.tobytes()
+        except cv.error:
+            # OpenCV built without WebP - use JPEG from now on
+            _webp_supported = False
+
+    success, encoded = cv.imencode('.jpg', screenshot, [cv.IMWRITE_JPEG_QUALITY, quality])
+    return encoded.tobytes() if success else None
+
+
 class StateManager:
     """SQLite-backed state manager for multi-instance bot monitoring"""
 
@@ -79,6 +285,28 @@ class StateManager:
     # Thread-local storage for connection pooling (one connection per thread)
     _thread_local = threading.local()
 
+    # Thread-local read-only connections for the query classmethods
+    _reader_local = threading.local()
+
+    # Thread-local autocommit connections for the writing classmethods
+    _tls = threading.local()
+
+    # Database paths already switched to WAL by this process
+    _pragmas_applied = set()
+
+    # Device -> monotonic time this process last recorded a screenshot read
+    _view_marks = {}
+
+    # Wakes wait_for_commands() when this process sends a command; _command_seq
+    # counts notifications so one sent before the wait starts isn't missed
+    _command_cond = threading.Condition()
+    _command_seq = 0
+
+    # Devices with a pending heartbeat, flushed once per second by the background writer
+    _heartbeat_dirty = set()
+    _heartbeat_lock = threading.Lock()
+    _writer_thread = None
+
     @classmethod
     def _get_db_path(cls):
         """Get the shared database path (lazy initialization)"""
@@ -103,6 +331,14 @@ class StateManager:
         self.device_name = device_name
         self.db_path = self._get_db_path()
         self.current_action = ""  # Track current action/function for display
+        self._last_queue_hash = None  # Skip command_queue writes when unchanged
+        self._viewer_check = (0.0, False)  # (monotonic time, result) of has_active_viewer
+        self._seen_command_seq = StateManager._command_seq  # Last notification seen by wait_for_commands
+        self._last_command_id = -1  # Newest command id seen by wait_for_commands (0 = none yet)
+
+        # Screenshot encode + write runs on a single worker; newest frame wins
+        self._enc_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"StateShot-{device_name}")
+        self._pending = None
 
         # Initialize database schema (thread-safe)
         self._init_schema()
@@ -110,7 +346,33 @@ class StateManager:
         # Create or update bot state entry
         self._init_bot_state()
 
-    def _get_connection(self):
+        # Heartbeat flushing and WAL checkpoints
+        self._start_background_writer()
+
+    @classmethod
+    def _apply_pragmas(cls, conn):
+        """Apply tuning PRAGMAs to a new connection
+
+        Args:
+            conn: Freshly opened sqlite3.Connection
+
+        Note:
+            journal_mode=WAL is stored in the database file, so it is only set
+            once per process and path. The remaining PRAGMAs are connection
+            settings and are applied to every new connection.
+        """
+        db_path = cls._get_db_path()
+        if db_path not in cls._pragmas_applied:
+            conn.execute('PRAGMA journal_mode=WAL')
+            cls._pragmas_applied.add(db_path)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MB memory-mapped I/O
+        conn.execute('PRAGMA busy_timeout=5000')
+
+    @classmethod
+    def _get_connection(cls):
         """Get a database connection using thread-local pooling
 
         Each thread reuses its own connection instead of creating new ones.
@@ -120,14 +382,59 @@ class StateManager:
             sqlite3.Connection: Database connection for current thread
         """
         # Check if this thread already has a connection
-        if not hasattr(self._thread_local, 'connection') or self._thread_local.connection is None:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        if not hasattr(cls._thread_local, 'connection') or cls._thread_local.connection is None:
+            conn = sqlite3.connect(cls._get_db_path(), check_same_thread=False, timeout=30.0,
+                                   cached_statements=_CACHED_STATEMENTS)
             conn.row_factory = sqlite3.Row
-            # Enable WAL mode for better concurrent performance
-            conn.execute('PRAGMA journal_mode=WAL')
-            conn.execute('PRAGMA synchronous=NORMAL')
-            self._thread_local.connection = conn
-        return self._thread_local.connection
+            conn.create_function('unpack_text', 1, _unpack_text, deterministic=True)
+            # WAL mode + tuning for better concurrent performance
+            cls._apply_pragmas(conn)
+            cls._thread_local.connection = conn
+        return cls._thread_local.connection
+
+    @classmethod
+    def _get_reader_conn(cls):
+        """Get a read-only database connection for the current thread
+
+        Used by the SELECT-only classmethods. WAL readers never block the
+        writer, so these queries run without taking _db_lock.
+
+        Returns:
+            sqlite3.Connection: Read-only connection for current thread
+        """
+        conn = getattr(cls._reader_local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(cls._get_db_path(), check_same_thread=False, timeout=30.0,
+                                   cached_statements=_CACHED_STATEMENTS)
+            conn.row_factory = sqlite3.Row
+            conn.create_function('unpack_text', 1, _unpack_text, deterministic=True)
+            cls._apply_pragmas(conn)
+            conn.execute('PRAGMA query_only=1')
+            cls._reader_local.connection = conn
+        return conn
+
+    @classmethod
+    def _get_shared_conn(cls):
+        """Get the autocommit connection for writing classmethods
+
+        Opened once per thread and kept alive, so classmethod writes don't
+        pay for opening the database (and its -wal/-shm files) or applying
+        PRAGMAs every call.
+        Single statements commit on their own; multi-statement writes use
+        explicit BEGIN/COMMIT.
+
+        Returns:
+            sqlite3.Connection: Autocommit connection for current thread
+        """
+        conn = getattr(cls._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(cls._get_db_path(), check_same_thread=False, timeout=30.0,
+                                   cached_statements=_CACHED_STATEMENTS, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.create_function('unpack_text', 1, _unpack_text, deterministic=True)
+            cls._apply_pragmas(conn)
+            cls._tls.conn = conn
+        return conn
 
     def _close_connection(self):
         """Close the thread-local connection if it exists"""
@@ -139,11 +446,22 @@ class StateManager:
             self._thread_local.connection = None
 
     def _init_schema(self):
-        """Initialize database schema if not exists (thread-safe)"""
+        """Initialize database schema if not exists (thread-safe)
+
+        Note:
+            Keyed by PRAGMA user_version - when the database is already at
+            SCHEMA_VERSION this is a single pragma read.
+        """
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
 
+            # Fast path: schema already up to date
+            cursor.execute('PRAGMA user_version')
+            version = cursor.fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+
             # Bot states table - one row per device
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS bot_states (
@@ -175,9 +493,11 @@ class StateManager:
                     screenshot_interval INTEGER DEFAULT 0,
                     ld_running INTEGER DEFAULT 1,
 
-                    -- Latest screenshot
+                    -- Latest screenshot (pre-sized BLOB, true length in screenshot_len)
                     latest_screenshot BLOB,
+                    screenshot_len INTEGER DEFAULT 0,
                     screenshot_timestamp TIMESTAMP,
+                    screenshot_viewed_at INTEGER DEFAULT 0,
 
                     -- Current log (last 10 entries)
                     current_log TEXT DEFAULT '',
@@ -197,9 +517,9 @@ class StateManager:
                     device_name TEXT NOT NULL,
                     command_type TEXT NOT NULL,
                     command_data TEXT,
-                    created_at TIMESTAMP NOT NULL,
+                    created_at INTEGER NOT NULL,
                     processed INTEGER DEFAULT 0,
-                    processed_at TIMESTAMP
+                    processed_at INTEGER
                 )
             ''')
 
@@ -214,25 +534,60 @@ class StateManager:
                 ON bot_states(last_update)
             ''')
 
+            # Pending-command poll: WHERE device_name = ? AND processed = 0 ORDER BY created_at
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_device_processed
-                ON remote_commands(device_name, processed)
+                CREATE INDEX IF NOT EXISTS idx_cmd_pending
+                ON remote_commands(device_name, processed, created_at)
             ''')
 
-            # Migration: Add columns if they don't exist (for existing databases)
-            cursor.execute("PRAGMA table_info(bot_states)")
-            columns = [col[1] for col in cursor.fetchall()]
-            if 'ld_running' not in columns:
-                cursor.execute('ALTER TABLE bot_states ADD COLUMN ld_running INTEGER DEFAULT 1')
-            if 'doParking' not in columns:
-                cursor.execute('ALTER TABLE bot_states ADD COLUMN doParking INTEGER DEFAULT 0')
-            if 'doGig' not in columns:
-                cursor.execute('ALTER TABLE bot_states ADD COLUMN doGig INTEGER DEFAULT 0')
-            if 'current_action' not in columns:
-                cursor.execute('ALTER TABLE bot_states ADD COLUMN current_action TEXT DEFAULT \'\'')
-            if 'command_queue' not in columns:
-                cursor.execute('ALTER TABLE bot_states ADD COLUMN command_queue TEXT DEFAULT \'{}\'')
+            # clear_old_commands: WHERE processed = 1 AND processed_at < ?
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cmd_cleanup
+                ON remote_commands(processed, processed_at)
+            ''')
 
+            # Migration 1: Add columns missing from databases created before
+            # user_version tracking
+            if version < 1:
+                cursor.execute("PRAGMA table_info(bot_states)")
+                columns = [col[1] for col in cursor.fetchall()]
+                if 'ld_running' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN ld_running INTEGER DEFAULT 1')
+                if 'doParking' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN doParking INTEGER DEFAULT 0')
+                if 'doGig' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN doGig INTEGER DEFAULT 0')
+                if 'current_action' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN current_action TEXT DEFAULT \'\'')
+                if 'command_queue' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN command_queue TEXT DEFAULT \'{}\'')
+                if 'screenshot_len' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN screenshot_len INTEGER DEFAULT 0')
+
+            # Migration 2: idx_cmd_pending supersedes idx_device_processed
+            if version < 2:
+                cursor.execute('DROP INDEX IF EXISTS idx_device_processed')
+
+            # Migration 3: remote_commands timestamps become unix epoch integers
+            # (existing tables keep their TIMESTAMP declaration, whose NUMERIC
+            # affinity stores the converted values as integers). The old text
+            # values are naive local times from datetime.now(), hence 'utc'.
+            if version < 3:
+                for col in ('created_at', 'processed_at'):
+                    cursor.execute(f'''
+                        UPDATE remote_commands
+                        SET {col} = CAST(strftime('%s', {col}, 'utc') AS INTEGER)
+                        WHERE typeof({col}) = 'text'
+                    ''')
+
+            # Migration 4: screenshot readers record when they last read a frame
+            if version < 4:
+                cursor.execute("PRAGMA table_info(bot_states)")
+                columns = [col[1] for col in cursor.fetchall()]
+                if 'screenshot_viewed_at' not in columns:
+                    cursor.execute('ALTER TABLE bot_states ADD COLUMN screenshot_viewed_at INTEGER DEFAULT 0')
+
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
             conn.commit()
             # Don't close - connection is reused via thread-local pooling
 
@@ -242,6 +597,8 @@ class StateManager:
         Note:
             Does NOT set is_running=1 automatically. The bot should call
             mark_running() only after successfully connecting to a device.
+            Pre-sizes latest_screenshot to SCREENSHOT_MAX_BYTES so later
+            screenshot writes can go through incremental BLOB I/O.
         """
         with self._db_lock:
             conn = self._get_connection()
@@ -251,12 +608,13 @@ class StateManager:
 
             # Check if entry exists
             cursor.execute('''
-                SELECT device_name FROM bot_states WHERE device_name = ?
+                SELECT rowid FROM bot_states WHERE device_name = ?
             ''', (self.device_name,))
 
-            exists = cursor.fetchone() is not None
+            row = cursor.fetchone()
 
-            if exists:
+            if row:
+                self._rowid = row[0]
                 # Update existing entry - reset timestamp but keep is_running as 0
                 # Bot will call mark_running() after successful device connection
                 cursor.execute('''
@@ -275,9 +633,56 @@ class StateManager:
                         device_name, is_running, ld_running, start_time, last_update
                     ) VALUES (?, 0, 0, ?, ?)
                 ''', (self.device_name, now, now))
+                self._rowid = cursor.lastrowid
+
+            # Reserve the screenshot slot (keeps an existing slot that is already big enough)
+            cursor.execute('''
+                UPDATE bot_states
+                SET latest_screenshot = zeroblob(?),
+                    screenshot_len = 0
+                WHERE rowid = ?
+                  AND (latest_screenshot IS NULL OR length(latest_screenshot) < ?)
+            ''', (SCREENSHOT_MAX_BYTES, self._rowid, SCREENSHOT_MAX_BYTES))
 
             conn.commit()
 
+    def _write_screenshot_blob(self, conn, screenshot_blob):
+        """Write encoded screenshot bytes into the pre-sized BLOB slot
+
+        Args:
+            conn: Connection with the surrounding UPDATE already executed
+            screenshot_blob: Encoded image bytes
+
+        Note:
+            Frames that fit the slot are written in place with blobopen(),
+            which touches only the changed pages instead of rewriting the row.
+            Larger frames fall back to a regular UPDATE that grows the slot.
+            Caller holds _db_lock and commits.
+            The rowid is looked up inside the caller's transaction rather than
+            cached: after clear_device_state()/clear_all_states() another
+            device's re-inserted row can reuse this device's old rowid.
+        """
+        row = conn.execute(
+            'SELECT rowid FROM bot_states WHERE device_name = ?', (self.device_name,)
+        ).fetchone()
+        if row is None:
+            return  # Row was cleared - nothing to write into
+        self._rowid = row[0]
+
+        try:
+            with conn.blobopen('bot_states', 'latest_screenshot', self._rowid) as blob:
+                if len(screenshot_blob) <= len(blob):
+                    blob.write(screenshot_blob)
+                    return
+        except sqlite3.OperationalError:
+            pass  # Row was replaced or slot is NULL - rewrite it below
+
+        conn.execute('''
+            UPDATE bot_states
+            SET latest_screenshot = ?
+            WHERE device_name = ?
+        ''', (screenshot_blob, self.device_name))
+
     def update_checkbox_state(self, checkbox_name, enabled):
         """Update a single checkbox state
 
@@ -457,15 +862,43 @@ class StateManager:
             - Maintains last 10 log entries in current_log field
             - Updates latest_screenshot if provided
             - Adds timestamp to each log entry
+            - current_log is stored zstd-compressed when zstandard is installed
         """
+        self.add_logs([(message, screenshot, datetime.now())])
+
+    def add_logs(self, entries):
+        """Add several log entries with a single read-modify-write
+
+        Args:
+            entries: Iterable of (message, screenshot, logged_at) tuples, where
+                     screenshot may be None and logged_at is a datetime
+
+        Note:
+            Only the newest screenshot in the batch is stored - earlier ones
+            would be overwritten immediately anyway.
+        """
+        entries = list(entries)
+        if not entries:
+            return
+
+        log_entries = [f"[{logged_at.strftime('%H:%M:%S')}] {message}"
+                       for message, _, logged_at in entries]
+
+        # Encode the newest screenshot outside the lock
+        screenshot_blob = None
+        screenshot_at = None
+        for _, screenshot, logged_at in reversed(entries):
+            if screenshot is not None:
+                screenshot_blob = _encode_screenshot(screenshot)
+                screenshot_at = logged_at
+                break
+
+        now = entries[-1][2]
+
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            now = datetime.now()
-            timestamp = now.strftime("%H:%M:%S")
-            log_entry = f"[{timestamp}] {message}"
-
             # Get current log
             cursor.execute('''
                 SELECT current_log FROM bot_states WHERE device_name = ?
@@ -473,79 +906,126 @@ class StateManager:
 
             row = cursor.fetchone()
             if row:
-                current_log = row['current_log']
+                current_log = _unpack_text(row['current_log'])
                 log_lines = current_log.split('\n') if current_log else []
 
-                # Add new entry and keep last 50 for better visibility
-                log_lines.append(log_entry)
+                # Add new entries and keep last 50 for better visibility
+                log_lines.extend(log_entries)
                 log_lines = log_lines[-50:]
 
                 new_log = '\n'.join(log_lines)
             else:
-                new_log = log_entry
+                new_log = '\n'.join(log_entries[-50:])
 
             # Update log and screenshot
-            screenshot_blob = None
-            if screenshot is not None:
-                # Use JPEG encoding for faster performance
-                encode_params = [cv.IMWRITE_JPEG_QUALITY, 85]
-                success, encoded = cv.imencode('.jpg', screenshot, encode_params)
-                if success:
-                    screenshot_blob = encoded.tobytes()
-
             if screenshot_blob:
                 cursor.execute('''
                     UPDATE bot_states
                     SET current_log = ?,
-                        latest_screenshot = ?,
+                        screenshot_len = ?,
                         screenshot_timestamp = ?,
                         last_update = ?
                     WHERE device_name = ?
-                ''', (new_log, screenshot_blob, now, now, self.device_name))
+                ''', (_pack_text(new_log), len(screenshot_blob), screenshot_at, now, self.device_name))
+                self._write_screenshot_blob(conn, screenshot_blob)
             else:
                 cursor.execute('''
                     UPDATE bot_states
                     SET current_log = ?,
                         last_update = ?
                     WHERE device_name = ?
-                ''', (new_log, now, self.device_name))
+                ''', (_pack_text(new_log), now, self.device_name))
 
             conn.commit()
 
-    def update_screenshot(self, screenshot, quality=85):
-        """Update only the latest screenshot (optimized with JPEG encoding)
+    def update_screenshot(self, screenshot, quality=SCREENSHOT_QUALITY):
+        """Update only the latest screenshot (WebP, or JPEG if WebP is unavailable)
 
         Args:
             screenshot: Numpy array (BGR/BGRA format)
-            quality: JPEG quality (1-100, default 85) - lower = smaller/faster
+            quality: Encoder quality (1-100, default 80) - lower = smaller/faster
+
+        Note:
+            Returns immediately - encoding and the database write happen on a
+            background worker. A frame still waiting for the worker is dropped
+            in favor of the newer one. Don't modify the array after passing it.
         """
         if screenshot is None:
             return
 
+        pending = self._pending
+        if pending is not None and not pending.done():
+            pending.cancel()
+        try:
+            pending = self._enc_exec.submit(self._encode_and_write_screenshot, screenshot, quality)
+        except RuntimeError:
+            return  # close() already shut the worker down
+        pending.add_done_callback(self._report_screenshot_error)
+        self._pending = pending
+
+    @staticmethod
+    def _report_screenshot_error(future):
+        """Print the error of a failed background screenshot write"""
+        if future.cancelled():
+            return
+        e = future.exception()
+        if e is not None:
+            print(f"[System] Error writing screenshot: {e}")
+
+    def flush_screenshot(self, timeout=5.0):
+        """Wait for a screenshot still being encoded/written by the worker
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if no write is left pending
+        """
+        pending = self._pending
+        if pending is None:
+            return True
+        return not wait_futures([pending], timeout=timeout).not_done
+
+    def close(self):
+        """Finish the pending screenshot write and stop the encode worker
+
+        Later update_screenshot() calls are ignored.
+        """
+        self.flush_screenshot()
+        self._enc_exec.shutdown(wait=True, cancel_futures=True)
+
+    def _encode_and_write_screenshot(self, screenshot, quality):
+        """Encode a screenshot and store it (runs on the encode worker)
+
+        Args:
+            screenshot: Numpy array (BGR/BGRA format)
+            quality: Encoder quality (1-100)
+        """
+        # Encode outside the lock so other writers aren't held up
+        screenshot_blob = _encode_screenshot(screenshot, quality)
+        if not screenshot_blob:
+            return
+
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            # Encode screenshot to JPEG (much faster than PNG, smaller file size)
-            # JPEG encoding is 5-10x faster than PNG and produces 60-80% smaller files
-            encode_params = [cv.IMWRITE_JPEG_QUALITY, quality]
-            success, encoded = cv.imencode('.jpg', screenshot, encode_params)
-            if success:
-                screenshot_blob = encoded.tobytes()
-                now = datetime.now()
-
-                cursor.execute('''
-                    UPDATE bot_states
-                    SET latest_screenshot = ?,
-                        screenshot_timestamp = ?,
-                        last_update = ?
-                    WHERE device_name = ?
-                ''', (screenshot_blob, now, now, self.device_name))
+            now = datetime.now()
+            cursor.execute('''
+                UPDATE bot_states
+                SET screenshot_len = ?,
+                    screenshot_timestamp = ?,
+                    last_update = ?
+                WHERE device_name = ?
+            ''', (len(screenshot_blob), now, now, self.device_name))
+            self._write_screenshot_blob(conn, screenshot_blob)
 
-                conn.commit()
+            conn.commit()
 
     def mark_stopped(self):
         """Mark this bot instance as stopped"""
+        # Don't let a queued screenshot land after the stopped state
+        self.flush_screenshot()
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
@@ -603,17 +1083,75 @@ class StateManager:
 
         Call this periodically (e.g., every bot loop iteration) to indicate
         the bot is still running. Useful for detecting stuck/crashed bots.
+
+        Note:
+            Only marks the device as alive. The background writer flushes
+            all pending heartbeats in one UPDATE per second.
         """
-        with self._db_lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        with self._heartbeat_lock:
+            self._heartbeat_dirty.add(self.device_name)
+        self._start_background_writer()
 
-            cursor.execute('''
+    @classmethod
+    def _start_background_writer(cls):
+        """Start the background writer thread if it is not running"""
+        if cls._writer_thread is not None and cls._writer_thread.is_alive():
+            return
+        with cls._heartbeat_lock:
+            if cls._writer_thread is None or not cls._writer_thread.is_alive():
+                cls._writer_thread = threading.Thread(
+                    target=cls._background_writer_loop,
+                    daemon=True,
+                    name="StateManagerWriter"
+                )
+                cls._writer_thread.start()
+
+    @classmethod
+    def _background_writer_loop(cls):
+        """Flush coalesced heartbeats once per second and checkpoint the WAL
+
+        The WAL is truncated every WAL_CHECKPOINT_INTERVAL seconds, or sooner
+        once it grows past WAL_CHECKPOINT_MAX_BYTES, so long-running
+        processes don't accumulate an unbounded -wal file.
+        """
+        wal_path = cls._get_db_path() + '-wal'
+        last_checkpoint = time.monotonic()
+        while True:
+            time.sleep(1.0)
+            try:
+                cls._flush_heartbeats()
+            except Exception as e:
+                print(f"[System] Error flushing heartbeats: {e}")
+
+            try:
+                wal_size = os.stat(wal_path).st_size
+            except OSError:
+                wal_size = 0
+            now = time.monotonic()
+            if now - last_checkpoint >= WAL_CHECKPOINT_INTERVAL or wal_size > WAL_CHECKPOINT_MAX_BYTES:
+                last_checkpoint = now
+                try:
+                    cls.checkpoint()
+                except Exception as e:
+                    print(f"[System] Error checkpointing state database: {e}")
+
+    @classmethod
+    def _flush_heartbeats(cls):
+        """Write last_update for every device with a pending heartbeat"""
+        with cls._heartbeat_lock:
+            if not cls._heartbeat_dirty:
+                return
+            devices = tuple(cls._heartbeat_dirty)
+            cls._heartbeat_dirty.clear()
+
+        placeholders = ', '.join('?' * len(devices))
+        with cls._db_lock:
+            conn = cls._get_connection()
+            conn.execute(f'''
                 UPDATE bot_states
                 SET last_update = ?
-                WHERE device_name = ?
-            ''', (datetime.now(), self.device_name))
-
+                WHERE device_name IN ({placeholders})
+            ''', (datetime.now(), *devices))
             conn.commit()
 
     def update_current_action(self, action):
@@ -642,7 +1180,20 @@ class StateManager:
         Args:
             queue_info: Dict with queue information from bot.get_command_queue_info()
                        {'queue_size': int, 'commands': [...]}
+
+        Note:
+            Skips the write when the queue contents are unchanged. The
+            ever-growing delay_seconds values are not part of the comparison.
         """
+        queue_hash = hash((
+            queue_info.get('queue_size'),
+            tuple((c.get('description'), c.get('queued_at')) for c in queue_info.get('commands', ()))
+        ))
+        if queue_hash == self._last_queue_hash:
+            return
+
+        queue_json = _pack_text(_json_dumps(queue_info))
+
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
@@ -652,9 +1203,24 @@ class StateManager:
                 SET command_queue = ?,
                     last_update = ?
                 WHERE device_name = ?
-            ''', (json.dumps(queue_info), datetime.now(), self.device_name))
+            ''', (queue_json, datetime.now(), self.device_name))
 
             conn.commit()
+            self._last_queue_hash = queue_hash
+
+    @classmethod
+    def checkpoint(cls):
+        """Checkpoint the WAL into the database file and truncate it
+
+        Runs automatically from the background writer. Can also be called
+        directly (e.g., from maintenance scripts) to force it.
+
+        Returns:
+            tuple: (busy, wal_pages, checkpointed_pages) from wal_checkpoint
+        """
+        with cls._db_lock:
+            conn = cls._get_connection()
+            return tuple(conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone())
 
     # ============================================================================
     # CLASS METHODS - QUERY ALL BOTS
@@ -665,47 +1231,47 @@ class StateManager:
         """Get all currently running bot instances
 
         Returns:
-            list: List of device state dictionaries for running bots
-        """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            list: List of sqlite3.Row device states for running bots
+                  (index by column name, or dict(row) for a real dict)
 
-            cursor.execute('''
-                SELECT * FROM bot_states
-                WHERE is_running = 1
-                ORDER BY start_time DESC
-            ''')
+        Note:
+            latest_screenshot is not included - use get_device_screenshot()
+            has_screenshot is 1 when a screenshot is stored, else 0
+            Each row has an extra 'enabled' column with the enabled checkbox
+            names joined by ", " (empty string if none)
+        """
+        cursor = cls._get_reader_conn().cursor()
 
-            results = [dict(row) for row in cursor.fetchall()]
-            conn.close()
+        cursor.execute(f'''
+            SELECT {_STATE_COLS_SQL}, {_ENABLED_SQL} AS enabled
+            FROM bot_states
+            WHERE is_running = 1
+            ORDER BY start_time DESC
+        ''')
 
-            return results
+        return cursor.fetchall()
 
     @classmethod
     def get_all_bots(cls):
         """Get all bot instances (running and stopped)
 
         Returns:
-            list: List of all device state dictionaries
-        """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            list: List of sqlite3.Row device states for all bots
+                  (index by column name, or dict(row) for a real dict)
 
-            cursor.execute('''
-                SELECT * FROM bot_states
-                ORDER BY last_update DESC
-            ''')
+        Note:
+            latest_screenshot is not included - use get_device_screenshot()
+            has_screenshot is 1 when a screenshot is stored, else 0
+        """
+        cursor = cls._get_reader_conn().cursor()
 
-            results = [dict(row) for row in cursor.fetchall()]
-            conn.close()
+        cursor.execute(f'''
+            SELECT {_STATE_COLS_SQL}
+            FROM bot_states
+            ORDER BY last_update DESC
+        ''')
 
-            return results
+        return cursor.fetchall()
 
     @classmethod
     def get_device_state(cls, device_name):
@@ -716,21 +1282,103 @@ class StateManager:
 
         Returns:
             dict or None: Device state dictionary or None if not found
+
+        Note:
+            latest_screenshot is not included - use get_device_screenshot()
+            has_screenshot is 1 when a screenshot is stored, else 0
         """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        cursor = cls._get_reader_conn().cursor()
 
-            cursor.execute('''
-                SELECT * FROM bot_states WHERE device_name = ?
-            ''', (device_name,))
+        cursor.execute(f'''
+            SELECT {_STATE_COLS_SQL} FROM bot_states WHERE device_name = ?
+        ''', (device_name,))
 
-            row = cursor.fetchone()
-            conn.close()
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    @classmethod
+    def _read_screenshot(cls, device_name):
+        """Read the encoded screenshot bytes and timestamp for a device
+
+        Args:
+            device_name: Device name to query
 
-            return dict(row) if row else None
+        Returns:
+            tuple: (bytes or None, timestamp or None)
+
+        Note:
+            Reads exactly screenshot_len bytes straight out of the BLOB slot
+            with blobopen(), skipping the padded column value and the
+            intermediate copy a substr() result would need. Runs in one
+            read transaction so length and bytes come from the same frame.
+        """
+        conn = cls._get_reader_conn()
+        conn.execute('BEGIN')
+        try:
+            row = conn.execute('''
+                SELECT rowid, screenshot_len, screenshot_timestamp
+                FROM bot_states WHERE device_name = ?
+            ''', (device_name,)).fetchone()
+
+            if not row or not row['screenshot_len']:
+                return None, None
+
+            with conn.blobopen('bot_states', 'latest_screenshot', row['rowid'], readonly=True) as blob:
+                data = blob.read(row['screenshot_len'])
+            return data, row['screenshot_timestamp']
+        finally:
+            conn.rollback()
+            cls._mark_viewed(device_name)
+
+    @classmethod
+    def _mark_viewed(cls, device_name):
+        """Record that a device's screenshot is being watched
+
+        Bots skip screenshot capture while nobody reads their frames (see
+        has_active_viewer). Written at most every VIEW_MARK_INTERVAL seconds
+        per device, so polling viewers add one small UPDATE every few seconds.
+
+        Args:
+            device_name: Device whose screenshot was read
+        """
+        now = time.monotonic()
+        if now - cls._view_marks.get(device_name, 0.0) < VIEW_MARK_INTERVAL:
+            return
+        cls._view_marks[device_name] = now
+        try:
+            with cls._db_lock:
+                cls._get_shared_conn().execute(
+                    'UPDATE bot_states SET screenshot_viewed_at = ? WHERE device_name = ?',
+                    (int(time.time()), device_name)
+                )
+        except sqlite3.Error:
+            pass
+
+    def has_active_viewer(self):
+        """Check whether anyone read this device's screenshot recently
+
+        Returns:
+            bool: True if the screenshot was read within VIEWER_TIMEOUT seconds
+
+        Note:
+            The result is cached for a second, so callers can poll it every
+            loop without a query each time.
+        """
+        checked_at, active = self._viewer_check
+        now = time.monotonic()
+        if now - checked_at < 1.0:
+            return active
+
+        try:
+            row = self._get_reader_conn().execute(
+                'SELECT screenshot_viewed_at FROM bot_states WHERE device_name = ?',
+                (self.device_name,)
+            ).fetchone()
+            active = bool(row) and time.time() - (row[0] or 0) <= VIEWER_TIMEOUT
+        except sqlite3.Error:
+            active = True  # Can't tell - keep capturing
+        self._viewer_check = (now, active)
+        return active
 
     @classmethod
     def get_device_screenshot(cls, device_name):
@@ -742,26 +1390,15 @@ class StateManager:
         Returns:
             numpy.ndarray or None: Screenshot image or None if not found
         """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        data, _ = cls._read_screenshot(device_name)
 
-            cursor.execute('''
-                SELECT latest_screenshot FROM bot_states WHERE device_name = ?
-            ''', (device_name,))
+        if data:
+            import numpy as np
+            nparr = np.frombuffer(data, np.uint8)
+            img = cv.imdecode(nparr, cv.IMREAD_UNCHANGED)
+            return img
 
-            row = cursor.fetchone()
-            conn.close()
-
-            if row and row['latest_screenshot']:
-                import numpy as np
-                nparr = np.frombuffer(row['latest_screenshot'], np.uint8)
-                img = cv.imdecode(nparr, cv.IMREAD_UNCHANGED)
-                return img
-
-            return None
+        return None
 
     @classmethod
     def get_device_screenshot_with_timestamp(cls, device_name):
@@ -773,26 +1410,15 @@ class StateManager:
         Returns:
             tuple: (numpy.ndarray or None, timestamp or None)
         """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT latest_screenshot, screenshot_timestamp FROM bot_states WHERE device_name = ?
-            ''', (device_name,))
-
-            row = cursor.fetchone()
-            conn.close()
+        data, timestamp = cls._read_screenshot(device_name)
 
-            if row and row['latest_screenshot']:
-                import numpy as np
-                nparr = np.frombuffer(row['latest_screenshot'], np.uint8)
-                img = cv.imdecode(nparr, cv.IMREAD_UNCHANGED)
-                return img, row['screenshot_timestamp']
+        if data:
+            import numpy as np
+            nparr = np.frombuffer(data, np.uint8)
+            img = cv.imdecode(nparr, cv.IMREAD_UNCHANGED)
+            return img, timestamp
 
-            return None, None
+        return None, None
 
     @classmethod
     def clear_device_state(cls, device_name):
@@ -802,17 +1428,10 @@ class StateManager:
             device_name: Device name to remove
         """
         with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
-            cursor.execute('''
+            cls._get_shared_conn().execute('''
                 DELETE FROM bot_states WHERE device_name = ?
             ''', (device_name,))
 
-            conn.commit()
-            conn.close()
-
     @classmethod
     def clear_all_states(cls):
         """Clear all device states from database
@@ -820,14 +1439,7 @@ class StateManager:
         Use with caution - removes all monitoring data!
         """
         with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
-            cursor.execute('DELETE FROM bot_states')
-
-            conn.commit()
-            conn.close()
+            cls._get_shared_conn().execute('DELETE FROM bot_states')
 
     @classmethod
     def get_database_stats(cls):
@@ -836,36 +1448,36 @@ class StateManager:
         Returns:
             dict: Statistics including counts and database size
         """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Get counts
-            cursor.execute('SELECT COUNT(*) as total_bots FROM bot_states')
-            total_bots = cursor.fetchone()['total_bots']
-
-            cursor.execute('SELECT COUNT(*) as running_bots FROM bot_states WHERE is_running = 1')
-            running_bots = cursor.fetchone()['running_bots']
-
-            cursor.execute('SELECT COUNT(*) as with_screenshots FROM bot_states WHERE latest_screenshot IS NOT NULL')
-            with_screenshots = cursor.fetchone()['with_screenshots']
-
-            conn.close()
-
-            # Get database file size
-            db_size_bytes = os.path.getsize(db_path) if os.path.exists(db_path) else 0
-            db_size_mb = db_size_bytes / (1024 * 1024)
-
-            return {
-                'total_bots': total_bots,
-                'running_bots': running_bots,
-                'stopped_bots': total_bots - running_bots,
-                'with_screenshots': with_screenshots,
-                'db_size_mb': round(db_size_mb, 2),
-                'db_path': db_path
-            }
+        db_path = cls._get_db_path()
+        cursor = cls._get_reader_conn().cursor()
+
+        # Get all counts in a single scan
+        cursor.execute('''
+            SELECT COUNT(*) AS total_bots,
+                   COALESCE(SUM(is_running = 1), 0) AS running_bots,
+                   COALESCE(SUM(screenshot_len > 0), 0) AS with_screenshots
+            FROM bot_states
+        ''')
+        row = cursor.fetchone()
+        total_bots = row['total_bots']
+        running_bots = row['running_bots']
+        with_screenshots = row['with_screenshots']
+
+        # Get database file size
+        try:
+            db_size_bytes = os.path.getsize(db_path)
+        except OSError:
+            db_size_bytes = 0
+        db_size_mb = db_size_bytes / (1024 * 1024)
+
+        return {
+            'total_bots': total_bots,
+            'running_bots': running_bots,
+            'stopped_bots': total_bots - running_bots,
+            'with_screenshots': with_screenshots,
+            'db_size_mb': round(db_size_mb, 2),
+            'db_path': db_path
+        }
 
     # ============================================================================
     # REMOTE COMMAND METHODS
@@ -883,52 +1495,116 @@ class StateManager:
         Returns:
             int: Command ID
         """
-        import json
+        data_json = _json_dumps(command_data) if command_data else None
 
         with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            cursor = conn.cursor()
+            cursor = cls._get_shared_conn().execute(
+                _SQL_INSERT_COMMAND, (device_name, command_type, data_json)
+            )
 
-            data_json = json.dumps(command_data) if command_data else None
+        cls.notify_commands()
+        return cursor.lastrowid
 
-            cursor.execute('''
-                INSERT INTO remote_commands (device_name, command_type, command_data, created_at)
-                VALUES (?, ?, ?, ?)
-            ''', (device_name, command_type, data_json, datetime.now()))
+    @classmethod
+    def send_commands(cls, commands):
+        """Send several remote commands in a single transaction
 
-            command_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+        Use this instead of calling send_command() in a loop, e.g. when
+        broadcasting the same command to several devices.
 
-            return command_id
+        Args:
+            commands: List of (device_name, command_type, command_data) tuples
+
+        Returns:
+            list: Command IDs, in the same order as commands
+        """
+        rows = [
+            (device_name, command_type, _json_dumps(command_data) if command_data else None)
+            for device_name, command_type, command_data in commands
+        ]
+        if not rows:
+            return []
+
+        with cls._db_lock:
+            conn = cls._get_shared_conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(_SQL_INSERT_COMMAND, rows)
+                last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+        cls.notify_commands()
+
+        # Rows inserted by one statement in one write transaction get consecutive ids
+        first_id = last_id - len(rows) + 1
+        return list(range(first_id, last_id + 1))
+
+    @classmethod
+    def notify_commands(cls):
+        """Wake every thread blocked in wait_for_commands()
+
+        Called after sending commands; also used to wake a monitor thread
+        so it can notice it was asked to stop.
+        """
+        with cls._command_cond:
+            cls._command_seq += 1
+            cls._command_cond.notify_all()
+
+    def wait_for_commands(self, timeout=0.25):
+        """Wait until new commands may be pending for this device
+
+        Returns at once when a command is sent from this process. Commands
+        sent by other processes (the web server) can't notify the condition,
+        so they are picked up when the wait times out: the newest command id
+        for this device is read on the lock-free reader connection and
+        compared with the last one seen. Other writes (heartbeats, logs,
+        screenshots) don't count as new commands.
+
+        Args:
+            timeout: Seconds to wait for a notification before checking the
+                     database; the polling interval, and so the worst-case
+                     latency, for commands sent from another process
+
+        Returns:
+            bool: True if get_pending_commands() is worth calling (always True
+                  on the first call, to pick up commands queued before it)
+        """
+        cond = self._command_cond
+        with cond:
+            notified = cond.wait_for(lambda: StateManager._command_seq != self._seen_command_seq, timeout)
+            self._seen_command_seq = StateManager._command_seq
+        if notified:
+            return True
+
+        try:
+            newest_id = self._get_reader_conn().execute(
+                'SELECT max(id) FROM remote_commands WHERE device_name = ?', (self.device_name,)
+            ).fetchone()[0] or 0
+        except sqlite3.Error:
+            return True
+        changed = newest_id != self._last_command_id
+        self._last_command_id = newest_id
+        return changed
 
     def get_pending_commands(self):
         """Get all pending commands for this device
 
         Returns:
-            list: List of command dictionaries
+            list: List of command dictionaries with keys
+                  id, command_type, command_data (decoded or None),
+                  created_at (unix epoch seconds)
         """
-        import json
-
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples - _to_pending indexes by position
 
-            cursor.execute('''
-                SELECT * FROM remote_commands
-                WHERE device_name = ? AND processed = 0
-                ORDER BY created_at ASC
-            ''', (self.device_name,))
+            cursor.execute(_SQL_SELECT_PENDING, (self.device_name,))
 
-            commands = []
-            for row in cursor.fetchall():
-                cmd = dict(row)
-                if cmd['command_data']:
-                    cmd['command_data'] = json.loads(cmd['command_data'])
-                commands.append(cmd)
-
-            return commands
+            return [_to_pending(row) for row in cursor.fetchall()]
 
     def mark_command_processed(self, command_id):
         """Mark a command as processed
@@ -936,15 +1612,27 @@ class StateManager:
         Args:
             command_id: ID of the command to mark as processed
         """
+        self.mark_commands_processed([command_id])
+
+    def mark_commands_processed(self, command_ids):
+        """Mark several commands as processed in a single transaction
+
+        Args:
+            command_ids: List of command IDs to mark as processed
+        """
+        if not command_ids:
+            return
+
+        placeholders = ', '.join('?' * len(command_ids))
         with self._db_lock:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute('''
+            cursor.execute(f'''
                 UPDATE remote_commands
-                SET processed = 1, processed_at = ?
-                WHERE id = ?
-            ''', (datetime.now(), command_id))
+                SET processed = 1, processed_at = {_SQL_EPOCH_NOW}
+                WHERE id IN ({placeholders})
+            ''', command_ids)
 
             conn.commit()
 
@@ -955,20 +1643,11 @@ class StateManager:
         Args:
             days: Number of days to keep processed commands
         """
-        with cls._db_lock:
-            db_path = cls._get_db_path()
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
-            cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
+        # processed_at is unix epoch seconds - a plain integer range scan on idx_cmd_cleanup
+        cutoff = int(time.time()) - days * 86400
 
-            cursor.execute('''
-                DELETE FROM remote_commands
-                WHERE processed = 1 AND processed_at < datetime(?, 'unixepoch')
-            ''', (cutoff,))
-
-            conn.commit()
-            conn.close()
+        with cls._db_lock:
+            cls._get_shared_conn().execute(_SQL_DELETE_OLD_COMMANDS, (cutoff,))
 
 
 # ============================================================================
@@ -993,15 +1672,13 @@ def get_running_bots_summary():
         start_time = bot['start_time']
         last_update = bot['last_update']
 
-        # Count enabled checkboxes
-        checkboxes = ['doStreet', 'doArtists', 'doStudio', 'doTour', 'doGroup',
-                     'doConcert', 'doHelp', 'doCoin', 'doHeal', 'doRally']
-        enabled = [cb for cb in checkboxes if bot[cb] == 1]
+        # Enabled checkboxes are joined by the query (see _ENABLED_SQL)
+        enabled = bot['enabled']
 
         lines.append(f"\n{device}:")
         lines.append(f"  Started: {start_time}")
         lines.append(f"  Last Update: {last_update}")
-        lines.append(f"  Enabled: {', '.join(enabled) if enabled else 'None'}")
+        lines.append(f"  Enabled: {enabled or 'None'}")
         lines.append(f"  Settings: sleep={bot['sleep_time']}s, debug={bool(bot['debug_enabled'])}, fix={bool(bot['fix_enabled'])}")
 
         if bot['current_log']:
@@ -0,0 +1,77 @@
+"""
+Timings - Named UI delays with a per-device speed multiplier
+
+Game functions wait for animations and screen transitions between taps.
+Instead of hardcoding time.sleep() constants, they wait for a named delay:
+
+    bot.wait("SHORT")       # 1.0s * speed multiplier
+
+Every delay is scaled by the device's speed multiplier, set per device in
+the game config (fast emulators can run well below 1.0):
+
+    "devices": {
+        "Device1": {"speed_multiplier": 0.5}
+    }
+
+All functions are game-agnostic.
+"""
+
+import time
+
+# Delay name -> base duration in seconds (at speed multiplier 1.0)
+DELAYS = {
+    'POLL': 0.1,        # Between quick re-checks of the screen
+    'TAP': 0.2,         # Between consecutive taps on the same button
+    'ANIMATION': 0.3,   # Short button/popup animation
+    'SETTLE': 0.5,      # Window opening or closing
+    'SHORT': 1.0,       # Screen transition
+    'TRANSITION': 1.5,  # Slower screen transition
+    'MEDIUM': 2.0,      # Map/view change or server round trip
+    'LONG': 3.0,        # Heavy screen load
+}
+
+DEFAULT_SPEED_MULTIPLIER = 1.0
+
+
+def get_delay(kind, multiplier=DEFAULT_SPEED_MULTIPLIER):
+    """Get the scaled duration of a named delay
+
+    Args:
+        kind: Delay name from DELAYS (e.g., "SHORT")
+        multiplier: Speed multiplier to scale by (default: 1.0)
+
+    Returns:
+        float: Delay in seconds
+
+    Raises:
+        KeyError: If kind is not a known delay name
+    """
+    return DELAYS[kind] * multiplier
+
+
+def wait(kind, multiplier=DEFAULT_SPEED_MULTIPLIER):
+    """Sleep for a named delay scaled by the speed multiplier
+
+    Args:
+        kind: Delay name from DELAYS (e.g., "SHORT")
+        multiplier: Speed multiplier to scale by (default: 1.0)
+    """
+    time.sleep(get_delay(kind, multiplier))
+
+
+def get_speed_multiplier(config, device_name):
+    """Read a device's speed multiplier from the merged config
+
+    Args:
+        config: Merged configuration dictionary
+        device_name: Device name as used in config 'devices'
+
+    Returns:
+        float: Configured multiplier, or 1.0 if unset or invalid
+    """
+    device_config = config.get('devices', {}).get(device_name, {})
+    try:
+        multiplier = float(device_config.get('speed_multiplier', DEFAULT_SPEED_MULTIPLIER))
+    except (TypeError, ValueError):
+        return DEFAULT_SPEED_MULTIPLIER
+    return multiplier if multiplier > 0 else DEFAULT_SPEED_MULTIPLIER
@@ -5,7 +5,14 @@ This module provides utility functions used across the bot framework.
 All logging functionality is centralized here.
 """
 
+import atexit
+import queue
+import random
+import re
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 
 # Global references for logging
 _gui_instance = None
@@ -14,6 +21,194 @@ _log_db = None
 _debug_enabled = None  # Callable that returns bool
 _headless_mode = False  # If True, log to console; if False, only log to GUI/web
 
+# Matches the position before every uppercase letter except at the start
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+# Last formatted log timestamp: [epoch second, "HH:MM:SS"]
+_ts_cache = [0, ""]
+
+# Database log destinations are written by background writer threads so
+# log() never waits on SQLite. StateManager (web) entries and debug
+# LogDatabase entries (which PNG-encode screenshots) have separate writers,
+# so a burst of debug screenshots never delays the web log.
+LOG_QUEUE_MAX = 10000  # Entries beyond this are dropped rather than queued
+LOG_QUEUE_MAX_SCREENSHOTS = 50  # Queued entries that may carry a screenshot
+LOG_FLUSH_BATCH = 200  # Max entries written per transaction
+
+
+class _LogWriter:
+    """Queue plus daemon thread writing log entries to one kind of destination
+
+    Items are (destination, message, screenshot, logged_at). Entries for the
+    same destination within a batch are written with one call to
+    write(destination, entries).
+    """
+
+    def __init__(self, name, write):
+        self.name = name
+        self.write = write
+        self.queue = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.queued_screenshots = 0
+        self.dropped = 0  # Entries dropped since last reported
+        self.dropped_screenshots = 0  # Screenshots stripped since last reported
+
+    def put(self, destination, message, screenshot, logged_at):
+        """Queue an entry without blocking, dropping it if the queue is full"""
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+                    self.thread.start()
+
+        # Full-frame screenshots are megabytes each - only a few may wait
+        if screenshot is not None:
+            with self.lock:
+                if self.queued_screenshots < LOG_QUEUE_MAX_SCREENSHOTS:
+                    self.queued_screenshots += 1
+                else:
+                    self.dropped_screenshots += 1
+                    screenshot = None
+
+        try:
+            self.queue.put_nowait((destination, message, screenshot, logged_at))
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+                if screenshot is not None:
+                    self.queued_screenshots -= 1
+
+    def flush(self, timeout=10.0):
+        """Block until everything queued so far has been written
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if the queue was drained within the timeout
+        """
+        if self.thread is None or not self.thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self.queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def _run(self):
+        """Drain the queue forever, batching whatever has accumulated"""
+        log_queue = self.queue
+        while True:
+            batch = []
+            flushed = []  # flush() markers reached in this batch
+            item = log_queue.get()
+            try:
+                while True:
+                    if isinstance(item, threading.Event):
+                        flushed.append(item)
+                    else:
+                        batch.append(item)
+                    if len(batch) >= LOG_FLUSH_BATCH:
+                        break
+                    item = log_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            if batch:
+                self._write_batch(batch)
+            for done in flushed:
+                done.set()
+
+            with self.lock:
+                dropped, self.dropped = self.dropped, 0
+                stripped, self.dropped_screenshots = self.dropped_screenshots, 0
+            if dropped:
+                print(f"[System] {self.name} fell behind - dropped {dropped} log entries")
+            if stripped:
+                print(f"[System] {self.name} fell behind - dropped screenshots from {stripped} log entries")
+
+    def _write_batch(self, batch):
+        """Write a batch of queued entries, one call per destination"""
+        by_destination = {}
+        screenshots = 0
+        for destination, message, screenshot, logged_at in batch:
+            by_destination.setdefault(id(destination), (destination, []))[1].append(
+                (message, screenshot, logged_at))
+            if screenshot is not None:
+                screenshots += 1
+
+        for destination, entries in by_destination.values():
+            try:
+                self.write(destination, entries)
+            except Exception as e:
+                print(f"[System] {self.name} error writing logs: {e}")
+
+        if screenshots:
+            with self.lock:
+                self.queued_screenshots -= screenshots
+
+
+_state_log_writer = _LogWriter("StateLogWriter", lambda state_manager, entries: state_manager.add_logs(entries))
+_db_log_writer = _LogWriter("DebugLogWriter", lambda log_db, entries: log_db.add_log_entries(entries))
+
+
+def log_timestamp():
+    """Get the current time as HH:MM:SS, formatted at most once per second
+
+    Returns:
+        str: Current local time (e.g., "14:03:27")
+    """
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _ts_cache[1]
+
+
+def queue_db_log(state_manager, log_db, message, screenshot):
+    """Queue a log entry for the background database writers
+
+    Entries queued together are written with one add_logs() /
+    add_log_entries() call per destination. Never blocks: if a writer is
+    LOG_QUEUE_MAX entries behind, the entry is dropped and counted, and
+    beyond LOG_QUEUE_MAX_SCREENSHOTS queued screenshots new entries are
+    queued without their screenshot.
+
+    Args:
+        state_manager: StateManager to append to, or None
+        log_db: LogDatabase to append to, or None
+        message: Log message text
+        screenshot: Optional screenshot image
+    """
+    logged_at = datetime.now()
+    if state_manager is not None:
+        _state_log_writer.put(state_manager, message, screenshot, logged_at)
+    if log_db is not None:
+        _db_log_writer.put(log_db, message, screenshot, logged_at)
+
+
+def flush_db_logs(timeout=10.0):
+    """Block until all queued log entries have been written
+
+    Call before closing a LogDatabase or ending its session, so entries
+    still queued for it are written first.
+
+    Args:
+        timeout: Maximum seconds to wait per writer
+
+    Returns:
+        bool: True if everything was written within the timeout
+    """
+    state_done = _state_log_writer.flush(timeout)
+    db_done = _db_log_writer.flush(timeout)
+    return state_done and db_done
+
+
+# Write whatever is still queued when the process exits normally
+atexit.register(flush_db_logs, 5.0)
+
 
 def set_gui_instance(gui):
     """Set the global GUI instance for logging
@@ -88,55 +283,68 @@ def log(message, screenshot=None):
     - Debug database (if debug mode enabled)
     - Console output (only in headless mode)
 
+    GUI and console output happen immediately; the state_manager and debug
+    database writes are queued and batched by a background thread.
+
     Args:
         message: Message string to log
         screenshot: Optional screenshot image to associate with log entry
     """
-    global _gui_instance, _state_manager, _log_db, _debug_enabled, _headless_mode
+    # Bind module globals to locals once - this function is called constantly
+    gui = _gui_instance
+    state_manager = _state_manager
+    log_db = _log_db
+    debug_enabled = _debug_enabled
+    headless = _headless_mode
+    db_state_manager = None
 
     # Log to GUI display - use gui.log() method if available (enables callbacks)
-    if _gui_instance:
-        if hasattr(_gui_instance, 'log') and callable(_gui_instance.log):
+    if gui:
+        gui_log = getattr(gui, 'log', None)
+        if callable(gui_log):
             # Use the GUI's log method (HeadlessBot or BotGUI)
             # This enables WebSocket callbacks in headless mode
-            _gui_instance.log(message, screenshot)
+            gui_log(message, screenshot)
         else:
             # Fallback: direct buffer manipulation
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            formatted_message = f"[{timestamp}] {message}"
-            _gui_instance.log_buffer.append(formatted_message)
-
-            # Maintain buffer size
-            while len(_gui_instance.log_buffer) > _gui_instance.max_log_lines:
-                _gui_instance.log_buffer.pop(0)
+            formatted_message = f"[{log_timestamp()}] {message}"
+            log_queue = getattr(gui, '_log_queue', None)
+            if log_queue is not None:
+                # The GUI thread moves queued lines into log_buffer itself
+                log_queue.put_nowait(formatted_message)
+            else:
+                # log_buffer is a deque(maxlen=max_log_lines) - append trims it
+                gui.log_buffer.append(formatted_message)
 
             # Update log widget (thread-safe)
-            if hasattr(_gui_instance, 'root') and hasattr(_gui_instance, '_update_log_widget'):
-                _gui_instance.root.after(0, _gui_instance._update_log_widget)
+            if hasattr(gui, 'root') and hasattr(gui, '_update_log_widget'):
+                gui.root.after(0, gui._update_log_widget)
 
             # Log to console only in headless mode
-            if _headless_mode:
+            if headless:
                 print(formatted_message)
 
             # Log to state manager for web interface
-            if _state_manager:
-                _state_manager.add_log(message, screenshot)
+            if state_manager:
+                db_state_manager = state_manager
     else:
         # No GUI - log to console in headless mode
-        if _headless_mode:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            formatted_message = f"[{timestamp}] {message}"
-            print(formatted_message)
+        if headless:
+            print(f"[{log_timestamp()}] {message}")
 
         # Log to state manager for web interface
-        if _state_manager:
-            _state_manager.add_log(message, screenshot)
+        if state_manager:
+            db_state_manager = state_manager
 
     # Log to debug database if enabled
-    if _log_db and _debug_enabled and _debug_enabled():
-        _log_db.add_log_entry(message, screenshot)
+    if not (log_db and debug_enabled and debug_enabled()):
+        log_db = None
 
+    if db_state_manager or log_db:
+        queue_db_log(db_state_manager, log_db, message, screenshot)
 
+
+@lru_cache(maxsize=512)
 def camel_to_snake(name):
     """Convert camelCase to snake_case
 
@@ -154,14 +362,10 @@ def camel_to_snake(name):
         >>> camel_to_snake("getActiveRallyInfo")
         'get_active_rally_info'
     """
-    result = []
-    for i, char in enumerate(name):
-        if char.isupper() and i > 0:
-            result.append('_')
-        result.append(char.lower())
-    return ''.join(result)
+    return _CAMEL_RE.sub('_', name).lower()
 
 
+@lru_cache(maxsize=512)
 def snake_to_camel(name):
     """Convert snake_case to camelCase
 
@@ -177,8 +381,118 @@ def snake_to_camel(name):
         >>> snake_to_camel("do_street")
         'doStreet'
     """
-    parts = name.split('_')
-    return parts[0] + ''.join(word.capitalize() for word in parts[1:])
+    # Single pass: upper-case the first character after each underscore and
+    # lower-case the rest of every word after the first
+    chars = []
+    upper_next = False
+    first_word = True
+    for ch in name:
+        if ch == '_':
+            upper_next = True
+            first_word = False
+        elif upper_next:
+            chars.append(ch.upper())
+            upper_next = False
+        elif first_word:
+            chars.append(ch)
+        else:
+            chars.append(ch.lower())
+    return ''.join(chars)
+
+
+def wait_for_condition(predicate, timeout=10.0, min_interval=0.05, max_interval=0.4):
+    """Poll a condition until it is truthy, backing off exponentially
+
+    The first check happens immediately. Between checks the delay doubles
+    from min_interval up to max_interval, plus a little random jitter.
+
+    Args:
+        predicate: Callable taking no arguments
+        timeout: Maximum seconds to keep polling (default: 10.0)
+        min_interval: First delay between checks in seconds (default: 0.05)
+        max_interval: Longest delay between checks in seconds (default: 0.4)
+
+    Returns:
+        The first truthy predicate result, or the last falsy one on timeout
+
+    Example:
+        wait_for_condition(lambda: get_record_count(bot)["used"] <= 6, timeout=2.0)
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        result = predicate()
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(min(max_interval, min_interval * 2 ** attempt) + random.uniform(0, min_interval * 0.5))
+        attempt += 1
+
+
+def wait_for(bot, needle_name, timeout=10.0, accuracy=0.99, tap=True,
+             min_interval=0.05, max_interval=0.4, **find_kwargs):
+    """Wait for a needle to appear and optionally tap it
+
+    Returns as soon as the needle is found instead of sleeping a fixed
+    interval between attempts (see wait_for_condition for the backoff).
+
+    Args:
+        bot: BOT instance
+        needle_name: Name of needle image to find
+        timeout: Maximum seconds to wait (default: 10.0)
+        accuracy: Match accuracy threshold (default: 0.99)
+        tap: Whether to tap the needle once found (default: True)
+        min_interval: First delay between checks in seconds (default: 0.05)
+        max_interval: Longest delay between checks in seconds (default: 0.4)
+        **find_kwargs: Extra arguments for bot.find_and_click (offset_x, search_region, ...)
+
+    Returns:
+        bool: True if the needle was found (and tapped if tap=True) before the timeout
+    """
+    return wait_for_condition(
+        lambda: bot.find_and_click(needle_name, accuracy=accuracy, tap=tap, **find_kwargs),
+        timeout=timeout, min_interval=min_interval, max_interval=max_interval
+    )
+
+
+def wait_until_gone(bot, needle_name, timeout=5.0, accuracy=0.99, tap_each=True,
+                    interval=0.2, **find_kwargs):
+    """Wait for a needle to disappear, optionally tapping it while visible
+
+    Replaces tap-until-gone loops such as
+    `while bot.find_and_click("button"): time.sleep(1)` with a bounded wait
+    that checks every interval seconds and returns as soon as it is gone.
+
+    Args:
+        bot: BOT instance
+        needle_name: Name of needle image to wait on
+        timeout: Maximum seconds to wait (default: 5.0)
+        accuracy: Match accuracy threshold (default: 0.99)
+        tap_each: Whether to tap the needle each time it is still visible (default: True)
+        interval: Seconds between checks (default: 0.2)
+        **find_kwargs: Extra arguments for bot.find_and_click (offset_x, search_region, ...)
+
+    Returns:
+        bool: True if the needle disappeared before the timeout
+    """
+    return wait_for_condition(
+        lambda: not bot.find_and_click(needle_name, accuracy=accuracy, tap=tap_each, **find_kwargs),
+        timeout=timeout, min_interval=interval, max_interval=interval
+    )
+
+
+def _public_callables(module):
+    """Snapshot a module's public callables
+
+    Args:
+        module: Module to scan
+
+    Returns:
+        dict: Mapping of attribute name to callable for names without a leading underscore
+    """
+    return {
+        name: value for name, value in vars(module).items()
+        if not name.startswith('_') and callable(value)
+    }
 
 
 def build_function_map(config, functions_module):
@@ -201,6 +515,7 @@ def build_function_map(config, functions_module):
         - Functions not found in module are skipped with a warning
     """
     function_map = {}
+    available = _public_callables(functions_module)
 
     for row in config.get('function_layout', []):
         for func_name in row:
@@ -208,8 +523,9 @@ def build_function_map(config, functions_module):
             snake_name = camel_to_snake(func_name)
 
             # Get function from module if it exists
-            if hasattr(functions_module, snake_name):
-                function_map[func_name] = getattr(functions_module, snake_name)
+            func = available.get(snake_name)
+            if func is not None:
+                function_map[func_name] = func
             else:
                 log(f"[Warning] Function '{snake_name}' not found in functions module")
 
@@ -237,6 +553,7 @@ def build_command_map(config, commands_module):
         - 'start_stop' command is skipped (handled by GUI)
     """
     command_map = {}
+    available = _public_callables(commands_module)
 
     for command in config.get('commands', []):
         command_id = command.get('id', '')
@@ -249,8 +566,9 @@ def build_command_map(config, commands_module):
         handler_name = f"handle_{command_id}"
 
         # Get handler from module if it exists
-        if hasattr(commands_module, handler_name):
-            command_map[command_id] = getattr(commands_module, handler_name)
+        handler = available.get(handler_name)
+        if handler is not None:
+            command_map[command_id] = handler
         else:
             log(f"[Warning] Command handler '{handler_name}' not found in commands module")
 
@@ -11,8 +11,6 @@ Command naming convention:
 All command handlers take (bot, gui) as standard parameters.
 """
 
-import time
-
 # Import game functions for reuse
 from . import functions as game_functions
 
@@ -30,7 +28,7 @@ def handle_min_fans(bot, _gui):
     """
     bot.log("Min Fans command triggered")
     game_functions.send_assist(bot, use_min_fans=True)
-    time.sleep(2)
+    bot.wait("MEDIUM")
     bot.find_and_click("continuemarch")
 
 
@@ -43,5 +41,5 @@ def handle_max_fans(bot, _gui):
     """
     bot.log("Max Fans command triggered")
     game_functions.send_assist(bot, use_min_fans=False)
-    time.sleep(2)
+    bot.wait("MEDIUM")
     bot.find_and_click("continuemarch")
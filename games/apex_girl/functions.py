@@ -14,6 +14,7 @@ Some functions have additional parameters (e.g., do_studio has 'stop').
 
 import time
 import random
+from collections import Counter
 import cv2 as cv
 import numpy as np
 import pytesseract
@@ -25,31 +26,39 @@ from core.ocr import (
     NUMBER_SLASH_PATTERN,
     LEVEL_PATTERN
 )
+from core.regions import register_regions
+from core.utils import wait_for, wait_for_condition, wait_until_gone
 
 
-# ============================================================================
-# UTILITY FUNCTIONS
-# ============================================================================
+# Parking spot indicators on the main screen (x, y, w, h)
+PARKING_SPOTS_ROI = (10, 570, 85, 20)
 
-def wait_and_click(bot, needle_name, max_attempts=100, delay=0.1, accuracy=0.99):
-    """Wait for a needle to appear and click it
+# Screen areas (x, y, w, h) where needles always appear - find_and_click and
+# find_all search only there unless given an explicit search_region
+register_regions({
+    'main-parking-activespot': PARKING_SPOTS_ROI,
+    'opportunity-red-target': (0, 160, 540, 510),
+    'opportunity-yellow-target': (0, 160, 540, 510),
+    'opportunity-purple-target': (0, 160, 540, 510),
+    'opportunity-blue-target': (0, 160, 540, 510),
+})
 
-    Args:
-        bot: Bot instance
-        needle_name: Name of needle image to find and click
-        max_attempts: Maximum number of attempts (default: 100)
-        delay: Delay between attempts in seconds (default: 0.1)
-        accuracy: Match accuracy threshold (default: 0.99)
+# Studio record counter ("3/6") area (x, y, w, h)
+RECORDS_ROI = (460, 775, 50, 25)
+
+# Needles identifying the two screens most functions start from (see bot.current_screen)
+MAP_SCREENS = [("screen-map", 0.99), ("screen-main", 0.99)]
+
+# Needles identifying the group building screens send_assist() can resume from
+ASSIST_SCREENS = [("settingswindow", 0.99), ("sendassist", 0.99), ("sendjoin", 0.99)]
+
+# Swipe in the assist settings list that scrolls down to the SSR characters
+SSR_SWIPE = (270, 630, 270, -700)
 
-    Returns:
-        bool: True if needle was found and clicked, False if max_attempts reached
-    """
-    for _ in range(max_attempts):
-        if bot.find_and_click(needle_name, tap=True, accuracy=accuracy):
-            return True
-        time.sleep(delay)
-    return False
 
+# ============================================================================
+# UTILITY FUNCTIONS
+# ============================================================================
 
 def get_active_cars(bot):
     """Get the count of active rally cars using OCR on car status area
@@ -95,11 +104,38 @@ def get_active_cars(bot):
     }
 
 
-def get_record_count(bot):
-    """Get the count of studio records using OCR"""
+def region_stable(screenshot1, screenshot2, region, tolerance=8, max_changed=0.01):
+    """Check whether an area looks the same in two screenshots
+
+    Args:
+        screenshot1: First screenshot
+        screenshot2: Second screenshot
+        region: (x, y, w, h) area to compare
+        tolerance: Largest per-channel difference still counted as unchanged (default: 8)
+        max_changed: Fraction of values allowed to differ by more than tolerance (default: 0.01)
+
+    Returns:
+        bool: True if the area is (nearly) identical in both screenshots
+    """
+    x, y, w, h = region
+    area1 = screenshot1[y:y+h, x:x+w]
+    area2 = screenshot2[y:y+h, x:x+w]
+    changed = np.count_nonzero(cv.absdiff(area1, area2) > tolerance)
+    return changed <= max_changed * area1.size
+
+
+def get_record_count(bot, screenshot=None):
+    """Get the count of studio records using OCR
+
+    Args:
+        bot: Bot instance
+        screenshot: Pre-captured screenshot, or None to capture new (default: None)
+    """
     try:
-        sc = bot.screenshot()
-        image = sc[775:800, 460:510]
+        if screenshot is None:
+            screenshot = bot.screenshot()
+        x, y, w, h = RECORDS_ROI
+        image = screenshot[y:y+h, x:x+w]
 
         if bot.find_and_click("record0", accuracy=0.99, tap=False, screenshot=image):
             return {'used': 0, 'of': 6}
@@ -155,7 +191,7 @@ def adjust_level(bot, target):
                 level_adjust_count += 1
                 was_level_adjusted = True
 
-            time.sleep(1)
+            bot.wait("SHORT")
 
             if level_adjust_count > target:
                 was_level_adjusted = False
@@ -172,12 +208,12 @@ def do_concert(bot, device):
     """Send cars to concerts until all are sent or limit reached"""
     bot.log("do_concert() started")
 
-    if not bot.find_and_click("screen-map", accuracy=0.99, tap=False) and not bot.find_and_click("screen-main", accuracy=0.99, tap=False):
+    if bot.current_screen(MAP_SCREENS) is None:
         bot.log("ERROR: Not on map or main screen - exiting")
         return
 
     bot.find_and_click("screen-main")
-    time.sleep(1)
+    bot.wait("SHORT")
 
     counter = 0
     max_concert_loops = 10
@@ -205,22 +241,22 @@ def do_concert(bot, device):
 
             if not bot.find_and_click('nocarssent', screenshot=crop, tap=False, accuracy=0.97):
                 bot.tap(115, 790)
-                time.sleep(0.5)
+                bot.wait("SETTLE")
                 bot.tap(115, 790)
-                time.sleep(1)
+                bot.wait("SHORT")
                 bot.tap(95, 580)
-                time.sleep(0.5)
+                bot.wait("SETTLE")
 
                 if not bot.find_and_click("search-target", tap=True, accuracy=0.92):
                     continue
-                time.sleep(3)
+                bot.wait("LONG")
             else:
                 bot.tap(270, 460)
 
             pause = random.randint(1, 100) / 100
             offset_x = random.randint(1, 30)
             offset_y = random.randint(1, 35)
-            time.sleep(1)
+            bot.wait("SHORT")
 
             loop_count = 0
             while bot.find_and_click("perform", tap=True, accuracy=0.99, click_delay=1):
@@ -230,7 +266,7 @@ def do_concert(bot, device):
                 pause = random.randint(50, 100) / 100
                 time.sleep(pause)
 
-            time.sleep(1)
+            bot.wait("SHORT")
 
             loop_count = 0
             while bot.find_and_click("driveto", tap=True, accuracy=0.99, click_delay=1, offset_x=offset_x, offset_y=offset_y):
@@ -240,9 +276,9 @@ def do_concert(bot, device):
                 time.sleep(pause)
 
                 if bot.find_and_click("teleportx", tap=True, accuracy=0.99):
-                    time.sleep(0.5)
+                    bot.wait("SETTLE")
                     bot.tap(500, 830)
-                    time.sleep(0.3)
+                    bot.wait("ANIMATION")
                     bot.tap(500, 830)
                     break
 
@@ -265,7 +301,7 @@ def do_concert(bot, device):
         if car_wait_counter % 30 == 0:  # Log progress every 30 seconds
             bot.log(f"Waiting for cars to return... ({car_wait_counter}/{max_car_wait}s)")
 
-        time.sleep(1)
+        time.sleep(1)  # Real seconds - cars return on a game timer
         car_wait_counter += 1
 
     if car_wait_counter >= max_car_wait:
@@ -276,9 +312,17 @@ def do_concert(bot, device):
     bot.log("do_concert() completed")
 
 
+# Rally alerts on the map, in the order do_rally() checks them
+RALLY_ALERTS = ['rallyavailable', 'dangerrally', 'rallyradiodanger', 'rallynormalrally']
+
+# Join buttons on the rally screen (normal and radio rallies)
+RALLY_JOIN_BUTTONS = ['rallyjoin', 'rallyradiojoin']
+
+
 def do_rally(bot, device):
     """Join rally if cars are available"""
-    if not bot.find_and_click('rallyavailable', tap=False) and not bot.find_and_click('dangerrally', tap=False) and not bot.find_and_click('rallyradiodanger') and not bot.find_and_click('rallynormalrally'):
+    screenshot = bot.screenshot()
+    if not bot.find_and_click('rallyavailable', tap=False, screenshot=screenshot) and not bot.find_and_click('dangerrally', tap=False, screenshot=screenshot) and not bot.find_and_click('rallyradiodanger', screenshot=screenshot) and not bot.find_and_click('rallynormalrally', screenshot=screenshot):
         return
 
     result = get_active_cars(bot)
@@ -287,24 +331,24 @@ def do_rally(bot, device):
     if result["used"] >= result["of"]:
         return
 
-    if bot.find_and_click('rallyavailable') or bot.find_and_click('dangerrally') or bot.find_and_click('rallyradiodanger') or bot.find_and_click('rallynormalrally'):
+    rally, _ = bot.find_first_of(RALLY_ALERTS)
+    if rally:
         counter = 0
-        while not bot.find_and_click('rallyjoin') and not bot.find_and_click('rallyradiojoin') and counter <= 20:
+        while bot.find_first_of(RALLY_JOIN_BUTTONS)[0] is None and counter <= 20:
             counter += 1
-            time.sleep(0.5)
+            bot.wait("SETTLE")
             if counter > 20:
                 bot.find_and_click('rallyback')
                 return
 
-        offset_x = random.randint(1, 30)
-        offset_y = random.randint(1, 35)
+        # A fresh random tap offset (1-30, 1-35) for every attempt, drawn up front
+        offsets = np.random.randint(1, (31, 36), size=(32, 2)).tolist()
         counter2 = 0
-        while not bot.find_and_click("driveto", accuracy=0.92, offset_x=offset_x, offset_y=offset_y):
+        while not bot.find_and_click("driveto", accuracy=0.92,
+                                     offset_x=offsets[counter2][0], offset_y=offsets[counter2][1]):
             counter2 += 1
             bot.find_and_click('rallyjoin')
-            time.sleep(0.1)
-            offset_x = random.randint(1, 30)
-            offset_y = random.randint(1, 35)
+            bot.wait("POLL")
             if counter2 > 30:
                 bot.find_and_click('rallyback')
                 return
@@ -320,53 +364,61 @@ def do_studio(bot, device, stop=6):
     Returns:
         bool: True if should uncheck (stop threshold reached), False otherwise
     """
-    if not bot.find_and_click("screen-map", accuracy=0.99, tap=False) and not bot.find_and_click("screen-main", accuracy=0.99, tap=False):
+    if bot.current_screen(MAP_SCREENS) is None:
         return False
 
     bot.find_and_click("screen-map")
-    time.sleep(1)
+    bot.wait("SHORT")
     bot.tap(485, 850)
-    time.sleep(1)
+    bot.wait("SHORT")
 
     bot.log(f'Checking if record expired')
     if bot.find_and_click("records0of6", accuracy=0.75):
-        time.sleep(2)
+        bot.wait("MEDIUM")
         if bot.find_and_click("recordsexpired"):
-            time.sleep(2)
+            bot.wait("MEDIUM")
             bot.find_and_click("recordconfirm")
-            time.sleep(2)
+            bot.wait("MEDIUM")
 
-    result = get_record_count(bot)
+    # One screenshot serves both the record count OCR and the record6 check
+    screenshot = bot.screenshot()
+    result = get_record_count(bot, screenshot)
 
     if result["used"] == -1:
         return False
 
-    record_count_attempts = 0
-    while result["used"] > 6 and record_count_attempts < 20:
-        time.sleep(0.1)
-        result = get_record_count(bot)
-        record_count_attempts += 1
-
-    if record_count_attempts >= 20:
-        bot.log(f"WARNING: Record count stuck at {result['used']}/6 - treating as 6/6")
-        result = {'used': 6, 'of': 6}
+    if result["used"] > 6:
+        # OCR can misread the counter mid-animation - wait for a sane value
+        def settled_record_count():
+            nonlocal screenshot
+            screenshot = bot.screenshot()
+            count = get_record_count(bot, screenshot)
+            return count if count["used"] <= 6 else None
+
+        # No sleep between reads - each screenshot + OCR already takes a while
+        settled = wait_for_condition(settled_record_count, timeout=2.0, min_interval=0, max_interval=0)
+        if settled:
+            result = settled
+        else:
+            bot.log(f"WARNING: Record count stuck at {result['used']}/6 - treating as 6/6")
+            result = {'used': 6, 'of': 6}
 
     bot.log(f'Records: {result["used"]}/{result["of"]}')
 
-    if bot.find_and_click("record6", tap=False, accuracy=0.92) or result["used"] >= stop:
+    if bot.find_and_click("record6", tap=False, accuracy=0.92, screenshot=screenshot) or result["used"] >= stop:
         if result["used"] >= stop:
             bot.log(f"Studio at {result['used']}/{result['of']} (target: {stop}) - Auto-unchecking")
             return True
         return False
 
     if result["used"] < result["of"]:
-        if not wait_and_click(bot, "studio", delay=0.5):
-            bot.log("WARNING: Studio button not found after 100 attempts")
+        if not wait_for(bot, "studio", timeout=50.0):
+            bot.log("WARNING: Studio button not found after 50 seconds")
             return False
-        time.sleep(1)
+        bot.wait("SHORT")
 
         bot.find_and_click("askhelp", tap=True, accuracy=0.90)
-        time.sleep(1)
+        bot.wait("SHORT")
 
         # Studio recording sequence - each step must complete before next
         steps = [
@@ -375,24 +427,24 @@ def do_studio(bot, device, stop=6):
             ("autoassign", 0.99),
         ]
         for needle, acc in steps:
-            if not wait_and_click(bot, needle, accuracy=acc):
+            if not wait_for(bot, needle, accuracy=acc):
                 return False
 
-        time.sleep(1)
-        if not wait_and_click(bot, "start", accuracy=0.92):
+        bot.wait("SHORT")
+        if not wait_for(bot, "start", accuracy=0.92):
             return False
-        time.sleep(1)
+        bot.wait("SHORT")
 
         # Skip and claim sequence
-        if not wait_and_click(bot, "skip"):
+        if not wait_for(bot, "skip"):
             return False
-        time.sleep(1)
-        if not wait_and_click(bot, "skip", accuracy=0.92):
+        bot.wait("SHORT")
+        if not wait_for(bot, "skip", accuracy=0.92):
             return False
-        time.sleep(1)
-        if not wait_and_click(bot, "claim"):
+        bot.wait("SHORT")
+        if not wait_for(bot, "claim"):
             return False
-        time.sleep(1)
+        bot.wait("SHORT")
 
     return False
 
@@ -401,91 +453,85 @@ def do_studio(bot, device, stop=6):
 # GAME ACTION FUNCTIONS - GROUP ACTIVITIES
 # ============================================================================
 
+def _detect_fan_mode(bot, screenshot):
+    """Find which fan toggle button is showing on the assist screen
+
+    The min and max buttons are never shown together, so matching stops at
+    the first one found.
+
+    Args:
+        bot: BOT instance
+        screenshot: Screenshot of the assist screen
+
+    Returns:
+        tuple: ("min" or "max", (x, y)) of the visible button, or (None, None)
+    """
+    return bot.find_first_of(["min", "max"], tap=False, screenshot=screenshot)
+
+
 def assist(bot, use_min_fans=True):
     """Assist one group building by selecting and driving a character"""
     fan_mode = "min" if use_min_fans else "max"
     bot.log(f"assist() started - using {fan_mode} fans")
 
     bot.log(f"Checking current fan mode selection")
-    min_visible = bot.find_and_click("min", tap=False)
-    max_visible = bot.find_and_click("max", tap=False)
+    visible, button_loc = _detect_fan_mode(bot, bot.screenshot())
 
     if use_min_fans:
-        if min_visible:
+        if visible == "min":
             bot.log("Min button visible - clicking to select min fans")
-            bot.find_and_click("min")
-        elif max_visible:
+            bot.tap(*button_loc)
+        elif visible == "max":
             bot.log("Max button visible - min fans already selected")
         else:
-            counter = 0
-            while not bot.find_and_click("min") and counter <= 5:
-                counter += 1
-                time.sleep(1)
+            wait_for(bot, "min", timeout=6.0, accuracy=0.9)
     else:
-        if max_visible:
+        if visible == "max":
             bot.log("Max button visible - clicking to select max fans")
-            bot.find_and_click("max")
-        elif min_visible:
+            bot.tap(*button_loc)
+        elif visible == "min":
             bot.log("Min button visible - max fans already selected")
         else:
-            counter = 0
-            while not bot.find_and_click("max") and counter <= 5:
-                counter += 1
-                time.sleep(1)
+            wait_for(bot, "max", timeout=6.0, accuracy=0.9)
 
     bot.log("Looking for 'settings' button")
-    counter = 0
-    while not bot.find_and_click("settings") and counter <= 10:
-        counter += 1
-        time.sleep(0.1)
+    if not wait_for(bot, "settings", timeout=2.0, accuracy=0.9):
+        bot.find_and_click("brokensettings", offset_y=5)
 
-    bot.log("Clicking 'settings' until dialog opens")
-    settings_timeout = 0
-    max_settings_timeout = 300
+    if not wait_for(bot, "settingswindow", timeout=2.0, tap=False):
+        bot.log("Settings dialog not open yet - tapping 'settings' again")
+        if not bot.find_and_click("settings"):
+            bot.find_and_click("brokensettings", offset_y=5)
 
-    while (bot.find_and_click("settings") or bot.find_and_click("brokensettings", offset_y=5)) and settings_timeout < max_settings_timeout:
-        time.sleep(0.1)
-        settings_timeout += 1
-
-    time.sleep(2)
+    bot.wait("MEDIUM")
     bot.log("Settings dialog opened")
 
     offset_x = random.randint(1, 15)
     offset_y = random.randint(1, 10)
 
     bot.log("Unchecking all character filters")
-    check_count = 0
-    max_uncheck = 10
-
-    while bot.find_and_click("checked", accuracy=0.92, offset_x=offset_x, offset_y=offset_y) and check_count < max_uncheck:
-        check_count += 1
-        time.sleep(0.1)
-        offset_x = random.randint(1, 15)
-        offset_y = random.randint(1, 10)
+    bot.tap_while_visible("checked", max_taps=10, accuracy=0.92, delay="POLL",
+                          offset_x=offset_x, offset_y=offset_y, offset_range=((1, 15), (1, 10)))
 
-    time.sleep(1)
+    bot.wait("SHORT")
     bot.find_and_click("checked", accuracy=0.92, offset_x=offset_x, offset_y=offset_y)
-    time.sleep(1)
+    bot.wait("SHORT")
     bot.find_and_click("checked", accuracy=0.92, offset_x=offset_x, offset_y=offset_y)
 
     bot.log("Swiping to reveal SSR characters")
-    bot.swipe(270, 630, 270, -700)
+    bot.swipe(*SSR_SWIPE)
 
-    time.sleep(3)
+    bot.wait("LONG")
     bot.log("Selecting random SSR character")
     bot.find_and_click("randomssr")
 
-    time.sleep(0.5)
+    bot.wait("SETTLE")
     bot.log("Looking for 'settingsdriveto' button")
-    counter = 0
-    while not bot.find_and_click("settingsdriveto"):
-        counter += 1
-        if counter >= 10:
-            bot.log("ERROR: 'settingsdriveto' not found")
-            return
-        time.sleep(0.1)
+    if not wait_for(bot, "settingsdriveto", timeout=2.0, accuracy=0.9):
+        bot.log("ERROR: 'settingsdriveto' not found")
+        return
 
-    time.sleep(2)
+    bot.wait("MEDIUM")
     bot.log("Clicking 'continuemarch'")
     bot.find_and_click("continuemarch")
 
@@ -495,18 +541,14 @@ def send_assist(bot, use_min_fans=True):
     fan_type = "minimum" if use_min_fans else "maximum"
     bot.log(f"send_assist started with {fan_type} fans")
 
-    in_settings = bot.find_and_click("settingswindow", accuracy=0.99, tap=False)
-    in_assist = bot.find_and_click("sendassist", accuracy=0.99, tap=False)
-    in_join = bot.find_and_click("sendjoin", accuracy=0.99, tap=False)
-
-    if not (in_settings or in_assist or in_join):
+    if bot.current_screen(ASSIST_SCREENS) is None:
         bot.log("Not in settings/assist/join screen - tapping building location")
         bot.tap(270, 470)
-        time.sleep(1.5)
+        bot.wait("TRANSITION")
 
         if bot.find_and_click("sendaccelerate", accuracy=0.99, tap=True):
             bot.log("Acceleration popup found - clicked")
-            time.sleep(1)
+            bot.wait("SHORT")
 
         bot.log("Looking for assist and join buttons")
         clicked_assist = False
@@ -519,41 +561,64 @@ def send_assist(bot, use_min_fans=True):
                 bot.log("WARNING: Exceeded max loops waiting for buttons")
                 break
 
-            if not clicked_assist and bot.find_and_click("sendassist", accuracy=0.99, tap=False):
-                assist_click_counter = 0
-                while bot.find_and_click("sendassist", accuracy=0.99) and assist_click_counter < 100:
-                    time.sleep(0.1)
-                    assist_click_counter += 1
+            screenshot = bot.screenshot()
+
+            if not clicked_assist and bot.find_and_click("sendassist", accuracy=0.99, tap=False, screenshot=screenshot):
+                wait_until_gone(bot, "sendassist", timeout=5.0)
                 clicked_assist = True
                 bot.log("Successfully clicked 'assist' button")
+                # The assist taps changed the screen
+                screenshot = bot.screenshot()
 
-            if not clicked_join and bot.find_and_click("sendjoin", accuracy=0.99, tap=False):
-                join_click_counter = 0
-                while bot.find_and_click("sendjoin", accuracy=0.99) and join_click_counter < 100:
-                    time.sleep(1)
-                    join_click_counter += 1
+            if not clicked_join and bot.find_and_click("sendjoin", accuracy=0.99, tap=False, screenshot=screenshot):
+                wait_until_gone(bot, "sendjoin", timeout=5.0)
                 clicked_join = True
                 bot.log("Successfully clicked 'join' button")
 
-            time.sleep(0.1)
+            bot.wait("POLL")
 
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     bot.log(f"Calling assist() with use_min_fans={use_min_fans}")
     assist(bot, use_min_fans=use_min_fans)
     bot.log(f"send_assist completed for {fan_type} fans")
 
 
+# Windows do_recover() closes by tapping outside them (CEO card, send card, decree)
+CARD_WINDOWS = ["fixceocard", "settingswindow", "fixdecree"]
+
+# Popups and back buttons do_recover() taps to get back to the map/main screen:
+# (needle, accuracy, log message). do_recover checks the most frequently hit
+# ones first (RECOVERY_HITS), falling back to this order for ties.
+RECOVERY_ACTIONS = [
+    ("fixgroupgiftx", 0.99, "Recovery: Closed group gift screen"),
+    ("fixdecree", 0.99, "Recovery: Closed Decree"),
+    ("fixgroupback", 0.99, "Recovery: Clicked group back button"),
+    ("fixmainad", 0.9, "Recovery: Closed ad popup"),
+    ("fixgrouprallyback", 0.99, "Recovery: Clicked rally back button"),
+    ("fixgameclosed", 0.99, "Recovery: Clicked open game"),
+    ("fixcellphoneback", 0.99, "Recovery: Clicked Back on cellphone"),
+    ("skip", 0.92, "Recovery: Clicked skip in studio"),
+    ("claim", 0.99, "Recovery: Clicked claim in studio"),
+    ("fixlater", 0.99, "Recovery: Clicked Later"),
+    ("maintenanace-downloadnow", 0.99, "Recovery: Clicked Maintenance Download Now"),
+]
+_RECOVERY_MESSAGES = {needle: message for needle, _, message in RECOVERY_ACTIONS}
+
+# Times each RECOVERY_ACTIONS needle was tapped in this session
+RECOVERY_HITS = Counter()
+
+
 def do_recover(bot, device):
     """Perform recovery and screen validation operations"""
     if not hasattr(bot, '_last_maintenance_confirm_time'):
         bot._last_maintenance_confirm_time = 0
 
+    # sqdiff: a popup dims the screen behind it, which CCOEFF matching would ignore
     screenshot = bot.screenshot()
-    on_map = bot.find_and_click("screen-map", accuracy=0.99, tap=False, sqdiff=True, screenshot=screenshot)
-    on_main = bot.find_and_click("screen-main", accuracy=0.99, tap=False, sqdiff=True, screenshot=screenshot)
+    screen = bot.current_screen(MAP_SCREENS, sqdiff=True, screenshot=screenshot)
 
-    if on_map or on_main:
+    if screen:
         if bot.find_and_click("fixmapassist", accuracy=0.99, tap=False, screenshot=screenshot):
             bot.tap(250, 880)
             bot.log("Recovery: Clicked away from Assist")
@@ -566,7 +631,7 @@ def do_recover(bot, device):
     recovery_attempts = 0
     max_attempts = 20
 
-    while not (on_map or on_main) and recovery_attempts < max_attempts:
+    while not screen and recovery_attempts < max_attempts:
         recovery_attempts += 1
         screenshot = bot.screenshot()
 
@@ -574,28 +639,15 @@ def do_recover(bot, device):
             bot.log("Recovery: Fix checkbox disabled - exiting")
             return
 
-        if bot.find_and_click("fixgroupgiftx", accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Closed group gift screen")
-        if bot.find_and_click("fixdecree", accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Closed Decree")
-        if bot.find_and_click("fixgroupback", accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked group back button")
-        if bot.find_and_click("fixmainad", screenshot=screenshot):
-            bot.log("Recovery: Closed ad popup")
-        if bot.find_and_click("fixgrouprallyback", accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked rally back button")
-        if bot.find_and_click("fixgameclosed", accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked open game")
-        if bot.find_and_click("fixcellphoneback", accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked Back on cellphone")
-        if bot.find_and_click("skip", tap=True, accuracy=0.92, screenshot=screenshot):
-            bot.log("Recovery: Clicked skip in studio")
-        if bot.find_and_click("claim", tap=True, accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked claim in studio")
-        if bot.find_and_click("fixlater", tap=True, accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked Later")
-        if bot.find_and_click("maintenanace-downloadnow", tap=True, accuracy=0.99, screenshot=screenshot):
-            bot.log("Recovery: Clicked Maintenance Download Now")
+        # Tap the first known popup/back button on this screenshot, most common first
+        candidates = sorted(
+            ((needle, accuracy) for needle, accuracy, _ in RECOVERY_ACTIONS),
+            key=lambda candidate: -RECOVERY_HITS[candidate[0]]
+        )
+        fixed, _ = bot.find_first_of(candidates, screenshot=screenshot)
+        if fixed:
+            RECOVERY_HITS[fixed] += 1
+            bot.log(_RECOVERY_MESSAGES[fixed])
 
         current_time = time.time()
         if current_time - bot._last_maintenance_confirm_time >= 60:
@@ -603,9 +655,10 @@ def do_recover(bot, device):
                 bot.log("Recovery: Clicked Recovery Confirm")
                 bot._last_maintenance_confirm_time = current_time
 
-        if bot.find_and_click("fixceocard", accuracy=0.99, tap=False, screenshot=screenshot) or bot.find_and_click('settingswindow', accuracy=0.99, tap=False, screenshot=screenshot) or bot.find_and_click('fixdecree', accuracy=0.99, tap=False, screenshot=screenshot):
+        card_window, _ = bot.find_first_of(CARD_WINDOWS, accuracy=0.99, tap=False, screenshot=screenshot)
+        if card_window:
             if bot.find_and_click("fixceocardsettings", accuracy=0.99, screenshot=screenshot):
-                time.sleep(1)
+                bot.wait("SHORT")
             bot.tap(450, 855)
             bot.log("Recovery: Clicked away on CEO card or Send card window")
         if bot.find_and_click("fixgenericback", accuracy=0.91, screenshot=screenshot):
@@ -619,13 +672,11 @@ def do_recover(bot, device):
                     bot.log("Recovery: Fix checkbox disabled during wait - exiting")
                     return
 
-        time.sleep(0.1)
+        bot.wait("POLL")
 
-        screenshot = bot.screenshot()
-        on_map = bot.find_and_click("screen-map", accuracy=0.99, tap=False, screenshot=screenshot)
-        on_main = bot.find_and_click("screen-main", accuracy=0.99, tap=False, screenshot=screenshot)
+        screen = bot.current_screen(MAP_SCREENS)
 
-    if on_map or on_main:
+    if screen:
         bot.log(f"Recovery: Successfully returned (attempts: {recovery_attempts})")
     else:
         bot.log(f"WARNING: Recovery failed after {max_attempts} attempts")
@@ -642,71 +693,68 @@ def do_group(bot, device):
 
     # Phase 1: Navigation
     bot.log("Phase 1: Verifying screen state")
-    on_map = bot.find_and_click("screen-map", accuracy=0.99, tap=False)
-    on_main = bot.find_and_click("screen-main", accuracy=0.99, tap=False)
-
-    if not (on_map or on_main):
+    if bot.current_screen(MAP_SCREENS) is None:
         bot.log("ERROR: Not on map or main screen - aborting")
         return False
 
     bot.log("Navigating to group menu")
     loop_count = 0
-    while bot.find_and_click("group", accuracy=0.99) or bot.find_and_click("help", accuracy=0.99):
+    while True:
+        screenshot = bot.screenshot()
+        if not (bot.find_and_click("group", accuracy=0.99, screenshot=screenshot) or
+                bot.find_and_click("help", accuracy=0.99, screenshot=screenshot)):
+            break
         loop_count += 1
         if loop_count > 20:
             break
-        time.sleep(0.2)
+        bot.wait("TAP")
 
     bot.log("Waiting for group menu to load")
     loop_count = 0
-    while not bot.find_and_click("gift",tap=False) and bot.find_and_click("group", accuracy=0.99):
+    while True:
+        screenshot = bot.screenshot()
+        if bot.find_and_click("gift", tap=False, screenshot=screenshot) or not bot.find_and_click("group", accuracy=0.99, screenshot=screenshot):
+            break
         loop_count += 1
         if loop_count > 20:
             bot.log("ERROR: Group menu failed to load")
             return False
-        time.sleep(0.3)
+        bot.wait("ANIMATION")
 
-    counter = 0
-    while not bot.find_and_click("groupfullyloaded", tap=False,accuracy=0.8):
-        counter += 1
-        time.sleep(0.2)
-        if counter > 10:
-            bot.log("ERROR: Group screen failed to load")
-            return False
+    if not wait_for(bot, "groupfullyloaded", timeout=3.0, accuracy=0.8, tap=False):
+        bot.log("ERROR: Group screen failed to load")
+        return False
 
     # Phase 2: Gifts
     bot.log("Phase 2: Processing gifts")
-    offset_x = random.randint(1, 5)
-    offset_y = random.randint(1, 5)
-    gift_clicks = 0
-    while bot.find_and_click("gift", offset_x=offset_x, offset_y=offset_y, accuracy=0.98):
-        gift_clicks += 1
-        if gift_clicks > 20:
-            break
-        time.sleep(0.3)
+    bot.tap_while_visible("gift", accuracy=0.98,
+                          offset_x=random.randint(1, 5), offset_y=random.randint(1, 5))
 
-    time.sleep(1)
+    bot.wait("SHORT")
 
     loop_count = 0
-    while not bot.find_and_click("giftscreen", accuracy=0.99, tap=False) and bot.find_and_click("gift"):
+    while True:
+        screenshot = bot.screenshot()
+        if bot.find_and_click("giftscreen", accuracy=0.99, tap=False, screenshot=screenshot) or not bot.find_and_click("gift", screenshot=screenshot):
+            break
         loop_count += 1
         if loop_count > 20:
             break
-        time.sleep(0.3)
+        bot.wait("ANIMATION")
 
     if bot.find_and_click("giftcollect",accuracy=0.96):
         bot.log("Collecting gifts")
-        time.sleep(1)
+        bot.wait("SHORT")
         bot.tap(250, 880)
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     if bot.find_and_click("claimall"):
         bot.log("Claiming all rewards")
-        time.sleep(1)
+        bot.wait("SHORT")
         bot.tap(250, 880)
-        time.sleep(1)
+        bot.wait("SHORT")
         bot.tap(250, 880)
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     if bot.find_and_click("giftscreenx", accuracy=0.99):
         bot.log("Gift screen closed")
@@ -717,23 +765,26 @@ def do_group(bot, device):
     while not bot.find_and_click("plan", tap=False):
         counter += 1
         bot.tap(250, 880)
-        time.sleep(0.5)
+        bot.wait("SETTLE")
         if counter == 10:
             bot.log("ERROR: Plan button not found")
             return False
 
     bot.find_and_click("plan")
-    time.sleep(1)
+    bot.wait("SHORT")
 
     invest_count = 0
     loop_count = 0
-    while not bot.find_and_click("grouppaidinvest", accuracy=0.99, tap=False):
+    while True:
+        screenshot = bot.screenshot()
+        if bot.find_and_click("grouppaidinvest", accuracy=0.99, tap=False, screenshot=screenshot):
+            break
         loop_count += 1
         if loop_count > 20:
             break
-        if bot.find_and_click("invest", accuracy=0.99):
+        if bot.find_and_click("invest", accuracy=0.99, screenshot=screenshot):
             invest_count += 1
-        time.sleep(0.2)
+        bot.wait("TAP")
     bot.log(f"Made {invest_count} investments")
 
     # Phase 4: Zone Activities
@@ -744,25 +795,19 @@ def do_group(bot, device):
         if loop_count > 20:
             bot.log("ERROR: Zone button not found")
             return False
-        time.sleep(0.2)
+        bot.wait("TAP")
         bot.tap(250, 880)
         bot.find_and_click("rallyback")
 
-    offset_x = random.randint(1, 5)
-    offset_y = random.randint(1, 5)
-    zone_clicks = 0
-    while bot.find_and_click("zone", offset_x=offset_x, offset_y=offset_y, accuracy=0.98):
-        zone_clicks += 1
-        if zone_clicks > 20:
-            break
-        time.sleep(0.5)
+    bot.tap_while_visible("zone", accuracy=0.98, delay="SETTLE",
+                          offset_x=random.randint(1, 5), offset_y=random.randint(1, 5))
 
-    time.sleep(1.5)
+    bot.wait("TRANSITION")
 
     if bot.find_and_click("groupclaim"):
         bot.log("Zone rewards claimed")
 
-    time.sleep(0.3)
+    bot.wait("ANIMATION")
 
     # Phase 5: Assist Buildings
     bot.log("Phase 5: Looking for buildings to assist")
@@ -771,40 +816,29 @@ def do_group(bot, device):
     offset_y = random.randint(1, 35)
     buildings_found = True
 
-    while not bot.find_and_click("assist", accuracy=0.92, offset_x=offset_x, offset_y=offset_y) and counter <= 10:
-        if bot.find_and_click("groupzonenormal", accuracy=0.95, tap=False):
+    while counter <= 10:
+        screenshot = bot.screenshot()
+        if bot.find_and_click("assist", accuracy=0.92, offset_x=offset_x, offset_y=offset_y, screenshot=screenshot):
+            break
+        if bot.find_and_click("groupzonenormal", accuracy=0.95, tap=False, screenshot=screenshot):
             bot.log("Zone in normal state - no buildings need assistance")
             counter = 10
             buildings_found = False
         counter += 1
-        time.sleep(0.1)
+        bot.wait("POLL")
         bot.swipe(270, 490, 400, 490)
 
     if buildings_found and counter <= 6:
         bot.log(f"Building found requiring assistance")
         bot.find_and_click("assist")
-        time.sleep(2)
+        bot.wait("MEDIUM")
         assist(bot, use_min_fans=True)
-    elif buildings_found:
-        offset_x = random.randint(1, 30)
-        offset_y = random.randint(1, 35)
-        back_count = 0
-        while bot.find_and_click("back", accuracy=0.92, offset_x=offset_x, offset_y=offset_y):
-            back_count += 1
-            if back_count > 20:
-                break
-            time.sleep(1)
-            offset_x = random.randint(1, 30)
-            offset_y = random.randint(1, 35)
     else:
-        back_count = 0
-        while bot.find_and_click("back", accuracy=0.92, offset_x=offset_x, offset_y=offset_y):
-            back_count += 1
-            if back_count > 20:
-                break
-            time.sleep(1)
+        if buildings_found:
             offset_x = random.randint(1, 30)
             offset_y = random.randint(1, 35)
+        bot.tap_while_visible("back", accuracy=0.92, delay="SHORT", offset_x=offset_x, offset_y=offset_y,
+                              offset_range=((1, 30), (1, 35)))
 
     if not buildings_found:
         # Zone is in normal state - all buildings complete, cooldown will start
@@ -825,83 +859,63 @@ def do_street(bot, device):
     if not bot.find_and_click("street"):
         bot.log("Street button not found - skipping")
         return
-    time.sleep(2)
+    bot.wait("MEDIUM")
 
-    counter = 0
-    while not bot.find_and_click("streetback", tap=False) and not bot.find_and_click("offlineincomeclaim"):
-        time.sleep(0.1)
-        counter += 1
-        if counter > 100:
-            bot.log("Street screen load timeout")
-            return
+    if not wait_for_condition(
+            lambda: bot.find_and_click("streetback", tap=False) or bot.find_and_click("offlineincomeclaim"),
+            timeout=15.0):
+        bot.log("Street screen load timeout")
+        return
 
-    counter = 0
-    while not bot.find_and_click("streetback", tap=False):
-        time.sleep(0.1)
-        counter += 1
-        if counter > 100:
-            bot.log("Street back button not found")
-            return
+    if not wait_for(bot, "streetback", timeout=15.0, accuracy=0.9, tap=False):
+        bot.log("Street back button not found")
+        return
 
     bot.find_and_click("tokyo2street", accuracy=0.99)
-    time.sleep(2)
+    bot.wait("MEDIUM")
 
     if bot.find_and_click("streetxpready", accuracy=0.99):
-        loop_count = 0
-        while not bot.find_and_click("streetxpreadyselected", accuracy=0.99):
-            loop_count += 1
-            if loop_count > 20:
-                break
-            time.sleep(0.1)
-            bot.find_and_click("streetback", tap=False)
+        wait_for(bot, "streetxpreadyselected", timeout=4.0)
 
-        time.sleep(1)
+        bot.wait("SHORT")
         bot.find_and_click("collectxp")
-        time.sleep(2)
+        bot.wait("MEDIUM")
         bot.tap(250, 880)
-        time.sleep(1)
+        bot.wait("SHORT")
         bot.tap(250, 880)
-        time.sleep(1)
+        bot.wait("SHORT")
         bot.find_and_click("tokyo2street")
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     if bot.find_and_click("demoassistant", accuracy=0.99):
-        time.sleep(1)
+        bot.wait("SHORT")
         if bot.find_and_click("demosready", accuracy=0.99):
-            time.sleep(2)
+            bot.wait("MEDIUM")
             loop_count = 0
             while bot.find_and_click("democomplete"):
                 loop_count += 1
                 if loop_count > 20:
                     break
-                time.sleep(0.2)
-                inner_loop_count = 0
-                while not bot.find_and_click("tapscreentocontinue"):
-                    inner_loop_count += 1
-                    if inner_loop_count > 20:
-                        break
-                    time.sleep(0.1)
+                bot.wait("TAP")
+                wait_for(bot, "tapscreentocontinue", timeout=4.0, accuracy=0.9)
                 inner_loop_count = 0
                 while bot.find_and_click("tapscreentocontinue"):
                     inner_loop_count += 1
                     if inner_loop_count > 20:
                         break
-                    time.sleep(0.1)
-                time.sleep(0.5)
+                    bot.wait("POLL")
+                bot.wait("SETTLE")
 
             loop_count = 0
             while bot.find_and_click("back"):
                 loop_count += 1
                 if loop_count > 20:
                     break
-                time.sleep(0.1)
+                bot.wait("POLL")
 
-    loop_count = 0
-    while bot.find_and_click("streetback"):
-        loop_count += 1
-        if loop_count > 20:
-            break
-        time.sleep(0.1)
+    if bot.find_and_click("streetback"):
+        if not wait_for_condition(lambda: bot.current_screen(MAP_SCREENS, ttl=0), timeout=2.0):
+            bot.find_and_click("streetback")
 
     if hasattr(bot, 'gui') and bot.gui:
         bot.gui.function_states['doStreet'].set(False)
@@ -912,7 +926,7 @@ def do_help(bot, device):
     try:
         if not bot.find_and_click("help", accuracy=0.99):
             bot.log("WARNING: Help button not found")
-        time.sleep(0.5)
+        bot.wait("SETTLE")
     except Exception as e:
         bot.log(f"ERROR in do_help: {e}")
         raise
@@ -923,8 +937,8 @@ def do_heal(bot, device):
     if not bot.find_and_click("healassist", accuracy=0.91):
         bot.log("Dragging to find heal assist")
         bot.swipe(230, 830, 230, 700)
-        time.sleep(3)
-    time.sleep(0.5)
+        bot.wait("LONG")
+    bot.wait("SETTLE")
 
 
 def do_coin(bot, device):
@@ -936,20 +950,26 @@ def do_coin(bot, device):
 def do_parking(bot, device):
     """Perform parking-related activities"""
     bot.log("Phase 1: Verifying screen state")
-    on_map = bot.find_and_click("screen-map", accuracy=0.99, tap=False)
-    on_main = bot.find_and_click("screen-main", accuracy=0.99, tap=False)
+    screen = bot.current_screen(MAP_SCREENS)
 
-    if not (on_map or on_main):
+    if screen is None:
         bot.log("ERROR: Not on map or main screen - aborting")
         return
 
-    if on_map:
+    if screen == "screen-map":
         bot.find_and_click('screen-map')
-    time.sleep(0.3)
-
-    first_check = bot.find_all('main-parking-activespot', accuracy=0.99, search_region=(10, 570, 85, 20))
-    time.sleep(0.3)
-    second_check = bot.find_all('main-parking-activespot', accuracy=0.99, search_region=(10, 570, 85, 20))
+    bot.wait("ANIMATION")
+
+    # Count the active spots on two frames to rule out a mid-animation
+    # count. The second frame is only matched again if the spots area changed.
+    first_screenshot = bot.screenshot()
+    first_check = bot.find_all('main-parking-activespot', accuracy=0.99, screenshot=first_screenshot)
+    second_check = first_check
+    if first_check['count'] == 6:
+        bot.wait("ANIMATION")
+        second_screenshot = bot.screenshot()
+        if not region_stable(first_screenshot, second_screenshot, PARKING_SPOTS_ROI):
+            second_check = bot.find_all('main-parking-activespot', accuracy=0.99, screenshot=second_screenshot)
 
     if first_check['count'] == 6 and second_check['count'] == 6:
         bot.log("Parking - All parking spots are currently active!")
@@ -958,7 +978,7 @@ def do_parking(bot, device):
         bot.log(f'First: {first_check}')
         bot.log(f'Second: {second_check}')
         bot.find_and_click('main-parking-button')
-        time.sleep(2)
+        bot.wait("MEDIUM")
         bot.log(bot.find_all('parking-main-claim'))
 
         loop_count = 0
@@ -966,99 +986,83 @@ def do_parking(bot, device):
             loop_count += 1
             if loop_count > 20:
                 break
-            inner_loop_count = 0
-            while not bot.find_and_click('parking-main-coin', accuracy=0.99, tap=False):
-                inner_loop_count += 1
-                if inner_loop_count > 20:
-                    break
-                time.sleep(0.1)
+            wait_for(bot, 'parking-main-coin', timeout=4.0, tap=False)
 
             inner_loop_count = 0
             while bot.find_and_click('parking-main-coin', tap=False):
-                loop_count += 1
-                if loop_count > 20:
+                inner_loop_count += 1
+                if inner_loop_count > 20:
                     break
                 bot.tap(420, 90)
-                time.sleep(1)
+                bot.wait("SHORT")
 
-            time.sleep(1)
-        return
-        bot.swipe(270, 630, 270, -700)
-        if bot.find_and_click('parking-main-gardencarpark'):
-            time.sleep(2)
-
-        for counter in range(6):
-            bot.find_and_click('parking-lot-findspot')
-            time.sleep(2)
-        else:
-            return
-        log("Finished Parking!")
+            bot.wait("SHORT")
 
 
 def do_gig(bot, device):
     """Perform gig activities"""
     bot.log("Phase 1: Verifying screen state")
-    on_map = bot.find_and_click("screen-map", accuracy=0.99, tap=False)
-    on_main = bot.find_and_click("screen-main", accuracy=0.99, tap=False)
+    screen = bot.current_screen(MAP_SCREENS)
 
-    if not (on_map or on_main):
+    if screen is None:
         bot.log("ERROR: Not on map or main screen - aborting")
         return
 
-    if on_main:
+    if screen == "screen-main":
         bot.find_and_click('screen-main')
-        time.sleep(1)
+        bot.wait("SHORT")
 
     loop_count = 0
     while bot.find_and_click('map-agent-collections'):
         loop_count += 1
         if loop_count > 20:
             break
-        time.sleep(1)
+        bot.wait("SHORT")
 
-    time.sleep(1)
+    bot.wait("SHORT")
 
     loop_count = 0
     while bot.find_and_click('opportunity-agentgig-unselected'):
         loop_count += 1
         if loop_count > 20:
             break
-        time.sleep(1)
+        bot.wait("SHORT")
 
     if bot.find_and_click('opportunity-close-rewards'):
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     performed = False
+    screenshot = bot.screenshot()
     # Check if we're still on the map screen (gig menu didn't open properly)
-    if bot.find_and_click('screen-map', tap=False):
+    if bot.find_and_click('screen-map', tap=False, screenshot=screenshot):
         bot.log("WARNING: Still on map screen - gig menu may not have opened")
         return  # Don't uncheck - this is a navigation issue, not "no gigs available"
-    elif (bot.find_and_click('opportunity-red-target', search_region=(0, 160, 540, 510), accuracy=0.98) or
-          bot.find_and_click('opportunity-yellow-target', search_region=(0, 160, 540, 510), accuracy=0.98) or
-          bot.find_and_click('opportunity-purple-target', search_region=(0, 160, 540, 510), accuracy=0.98) or
-          bot.find_and_click('opportunity-blue-target', search_region=(0, 160, 540, 510), accuracy=0.98)):
+    elif (bot.find_and_click('opportunity-red-target', accuracy=0.98, screenshot=screenshot) or
+          bot.find_and_click('opportunity-yellow-target', accuracy=0.98, screenshot=screenshot) or
+          bot.find_and_click('opportunity-purple-target', accuracy=0.98, screenshot=screenshot) or
+          bot.find_and_click('opportunity-blue-target', accuracy=0.98, screenshot=screenshot)):
         performed = True
-        time.sleep(1)
+        bot.wait("SHORT")
         if bot.find_and_click('opportunity-driving'):
-            time.sleep(1)
+            bot.wait("SHORT")
             bot.tap(0, 160)
-            time.sleep(1)
+            bot.wait("SHORT")
             bot.find_and_click('fixgenericback')
-            time.sleep(2)
+            bot.wait("MEDIUM")
             return
         bot.find_and_click('opportunity-go')
-        time.sleep(3)
+        bot.wait("LONG")
         bot.find_and_click('map-agent-rob')
         bot.find_and_click('map-agent-send')
         bot.find_and_click('map-agent-perform')
-        time.sleep(2)
+        bot.wait("MEDIUM")
         bot.find_and_click('driveto')
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     if bot.find_and_click('opportunity-close-rewards'):
-        time.sleep(2)
+        bot.wait("MEDIUM")
         bot.find_and_click('fixgenericback')
-        time.sleep(2)
+        bot.wait("MEDIUM")
 
     if not performed:
         if bot.gui:
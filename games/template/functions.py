@@ -47,13 +47,18 @@ def do_recover(bot, device):
         # Navigate to home screen
         if not bot.find_and_click('home_icon', tap=False):
             bot.tap(270, 850)  # Tap home position
+
+        # Pixel-level state checks: compare whole screen areas with
+        # bot.changed_blocks(before, after) instead of per-pixel Python loops
     """
     _ = device  # Unused in this template
     log("Fix/Recover: Checking game state...")
 
-    # Example: Close any popups by looking for close button
-    # if bot.find_and_click('close_popup'):
-    #     time.sleep(0.5)
+    # Example: Close any popups by looking for close button, then wait for
+    # the popup to go away (returns early as soon as the screen changes)
+    # screenshot = bot.screenshot()
+    # if bot.find_and_click('close_popup', screenshot=screenshot):
+    #     bot.wait_for_change(screenshot, timeout=1.0)
 
     # Example: Navigate to home screen
     # if not bot.find_and_click('home_screen', tap=False):
@@ -115,6 +120,12 @@ def do_example_task(bot, device):
     # if bot.find_and_click('target_image', tap=False):
     #     log("Target found on screen")
 
+    # Check several images against one screenshot, tapping the first found
+    # (stops matching at the first hit - cheaper than chained find_and_click)
+    # name, _ = bot.find_first_of(['close_popup', ('back_button', 0.95)])
+    # if name:
+    #     log(f"Tapped {name}")
+
     # Example: Return False to prevent cooldown from starting
     # if not bot.find_and_click('required_screen', tap=False):
     #     log("ERROR: Not on required screen - aborting")
@@ -156,10 +167,12 @@ def do_collect_rewards(bot, device):
     while loop_count < max_loops:
         loop_count += 1
 
-        # Example: Look for reward to collect
-        # if bot.find_and_click('reward_icon'):
+        # Example: Look for reward to collect, waiting only as long as the
+        # collect animation takes instead of a fixed sleep
+        # screenshot = bot.screenshot()
+        # if bot.find_and_click('reward_icon', screenshot=screenshot):
         #     log(f"Collected reward {loop_count}")
-        #     time.sleep(0.5)
+        #     bot.wait_for_change(screenshot, timeout=1.0)
         # else:
         #     log("No more rewards found")
         #     break
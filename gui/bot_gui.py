@@ -11,19 +11,54 @@ Key features:
 - Device list from master.conf devices
 """
 
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk
-import threading
+from collections import deque
 from datetime import datetime
+from itertools import islice
+
+import cv2 as cv
 
+from core.android import Android
 from core.config_loader import load_config, get_serial
+from core.utils import log_timestamp, queue_db_log
 from core.log_database import LogDatabase
 from core.ldplayer import LDPlayer
 
+# LDPlayer running status shared by every BotGUI in the process: one
+# "ldconsole list2" answers for all instances for LD_STATUS_TTL seconds
+LD_STATUS_TTL = 3.0
+_ld_status_cache = {}  # Instance index -> (monotonic time, running)
+_ld_status_lock = threading.Lock()
+
+
+def _clear_ld_status_cache():
+    """Forget cached LDPlayer statuses (after starting/stopping an instance)"""
+    with _ld_status_lock:
+        _ld_status_cache.clear()
+
 
 class BotGUI:
     """Generic GUI class for bot interface - config-driven"""
 
+    # Pending log lines and status changes are applied to the widgets on a
+    # fixed tick (~30 Hz) instead of one Tk callback per log() call
+    UI_FLUSH_MS = 33
+    # Delay before a scheduled state write, so bursts of toggles coalesce
+    STATE_DEBOUNCE_MS = 75
+    # Most queued log lines moved into the log widget per UI tick
+    LOG_DRAIN_MAX = 1000
+    # Lines kept in the log widget. log_buffer still holds max_log_lines and
+    # the Logs button opens the full history; a short widget keeps Tk's
+    # line layout (word wrap) cheap when scrolling.
+    LOG_WIDGET_LINES = 100
+
     def __init__(self, root, device_name, config=None, enable_remote=False):
         """Initialize BotGUI with window and widgets
 
@@ -70,6 +105,7 @@ class BotGUI:
         # Screenshot state
         self.screenshot_running = False
         self.screenshot_thread = None
+        self._screenshot_andy = None  # Connection kept for Screenshot while the bot is stopped
         self.live_screenshot_running = False
         self.live_screenshot_thread = None
 
@@ -77,11 +113,22 @@ class BotGUI:
         self.remote_monitoring_running = False
         self.remote_monitoring_thread = None
 
-        # Log buffer
-        self.log_buffer = []
-        self.detailed_log_buffer = []
-        self.cooldown_labels = {}
+        # Lines logged from any thread, not yet shown. Only the Tk thread
+        # consumes it, moving lines into log_buffer and the log widget.
         self.max_log_lines = 300
+        self._log_queue = queue.SimpleQueue()
+        # Lines shown in the log widget (Tk thread only; drops the oldest
+        # line once max_log_lines is reached)
+        self.log_buffer = deque(maxlen=self.max_log_lines)
+        # Latest (status, action) from update_status() not yet shown
+        self._pending_status = None
+        self._status_lock = threading.Lock()
+        # True while a debounced _update_full_state() is scheduled
+        self._state_update_pending = False
+        # State values last written by _update_full_state()
+        self._last_sent_state = {}
+        self.detailed_log_buffer = deque(maxlen=self.max_log_lines)
+        self.cooldown_labels = {}
         self.user_scrolling = False
 
         # Cooldown tracking
@@ -90,6 +137,9 @@ class BotGUI:
         # Command triggers
         self.command_triggers = self._init_command_triggers()
 
+        # LDPlayer controller, created from master.conf on first use
+        self._ld = None
+
         # Debug logging
         self.log_db = None
         if self.debug.get():
@@ -102,7 +152,15 @@ class BotGUI:
             self.state_manager = StateManager(self.device_name)
         self._state_update_counter = 0
 
+        # While minimized, log lines only go to log_buffer; the widget is
+        # refilled from it once the window is shown again
+        self._log_widget_hidden = False
+        self._log_widget_stale = False
+
         self.create_widgets()
+        self.root.after(self.UI_FLUSH_MS, self._flush_ui)
+        self.root.bind('<Unmap>', self._on_root_unmap, add='+')
+        self.root.bind('<Map>', self._on_root_map, add='+')
 
         # Check LD status on startup
         self._check_ld_status()
@@ -131,23 +189,57 @@ class BotGUI:
         self.root.resizable(False, False)
 
     def _init_function_states(self):
-        """Initialize function states from config function_layout"""
+        """Initialize function states and widget metadata from config
+
+        Also precomputes what the functions and commands sections render:
+        the function layout, checkbox labels ("doRally" -> "Rally") and the
+        (id, label) of each command button.
+        """
         function_layout = self.config.get('function_layout', [])
+        self._function_layout = function_layout
+        self._display_names = {}
         for row in function_layout:
             for func_name in row:
                 var = tk.BooleanVar(value=False)
                 # Add trace to update state manager when checkbox changes
-                var.trace_add('write', lambda *args, name=func_name: self._on_checkbox_change(name))
+                var.trace_add('write', self._on_checkbox_change)
                 self.function_states[func_name] = var
+                self._display_names[func_name] = func_name[2:] if func_name.startswith('do') else func_name
+
+        # Start/stop is handled by its own button
+        self._command_specs = []
+        for command in self.config.get('commands', []):
+            command_id = command.get('id', '')
+            if command_id != 'start_stop':
+                self._command_specs.append((command_id, command.get('label', command_id)))
+
+    def _on_checkbox_change(self, *args):
+        """Called when any function checkbox is toggled
 
-    def _on_checkbox_change(self, func_name):
-        """Called when a function checkbox is toggled"""
+        Which checkbox changed doesn't matter: the scheduled state update
+        reads all of them.
+        """
         try:
             if self._has_state_manager():
-                self._update_full_state()
+                self._schedule_full_state()
         except Exception:
             pass
 
+    def _schedule_full_state(self):
+        """Schedule one _update_full_state() for a burst of changes
+
+        Each checkbox or setting change would otherwise serialize the whole
+        state; changes within STATE_DEBOUNCE_MS share a single write.
+        """
+        if not self._state_update_pending:
+            self._state_update_pending = True
+            self.root.after(self.STATE_DEBOUNCE_MS, self._flush_full_state)
+
+    def _flush_full_state(self):
+        """Write the state scheduled by _schedule_full_state()"""
+        self._state_update_pending = False
+        self._update_full_state()
+
     def _has_state_manager(self):
         """Check if state manager is available"""
         return self.state_manager is not None
@@ -164,10 +256,9 @@ class BotGUI:
 
     def _get_timestamp(self, detailed=False):
         """Get formatted timestamp for logs"""
-        now = datetime.now()
         if detailed:
-            return now.strftime("%H:%M:%S.%f")[:-3]
-        return now.strftime("%H:%M:%S")
+            return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        return log_timestamp()
 
     def create_widgets(self):
         """Create all GUI widgets and layout the interface"""
@@ -223,31 +314,25 @@ class BotGUI:
         functions_frame = ttk.LabelFrame(parent, text="Functions", padding=1)
         functions_frame.pack(fill="x", padx=1)
 
-        row_layout = self.config.get('function_layout', [])
-
-        for row_items in row_layout:
-            row_frame = ttk.Frame(functions_frame)
-            row_frame.pack(fill="x", padx=1, pady=1)
+        function_states = self.function_states
+        display_names = self._display_names
 
+        # Checkbox and cooldown label pairs are gridded straight onto the
+        # section frame - no per-row or per-item frames
+        for row, row_items in enumerate(self._function_layout):
+            column = 0
             for func_name in row_items:
-                if func_name in self.function_states:
-                    var = self.function_states[func_name]
-
-                    # Create display label by removing "do" prefix
-                    if func_name.startswith('do'):
-                        display_name = func_name[2:]
-                    else:
-                        display_name = func_name
+                if func_name in function_states:
+                    var = function_states[func_name]
+                    display_name = display_names[func_name]
 
-                    item_frame = ttk.Frame(row_frame)
-                    item_frame.pack(side="left", padx=2, pady=0)
+                    cb = ttk.Checkbutton(functions_frame, text=display_name, variable=var)
+                    cb.grid(row=row, column=column, sticky="w", padx=(3, 0), pady=1)
 
-                    cb = ttk.Checkbutton(item_frame, text=display_name, variable=var)
-                    cb.pack(side="left")
-
-                    cooldown_label = ttk.Label(item_frame, text="", foreground="gray")
-                    cooldown_label.pack(side="left", padx=(2, 0))
+                    cooldown_label = ttk.Label(functions_frame, text="", foreground="gray")
+                    cooldown_label.grid(row=row, column=column + 1, sticky="w", padx=(2, 2), pady=1)
                     self.cooldown_labels[func_name] = cooldown_label
+                    column += 2
 
     def _create_controls_section(self, parent):
         """Create the control buttons section"""
@@ -257,68 +342,47 @@ class BotGUI:
         controls_frame = ttk.LabelFrame(right_frame, text="Controls", padding=2)
         controls_frame.pack(fill="x", pady=1)
 
-        # Debug and Fix checkboxes
-        debug_fix_frame = ttk.Frame(controls_frame)
-        debug_fix_frame.pack(fill="x", pady=1)
-        ttk.Checkbutton(debug_fix_frame, text="Debug",
-                        variable=self.debug).pack(side="left")
-        ttk.Checkbutton(debug_fix_frame, text="Fix",
-                        variable=self.fix_enabled).pack(side="left", padx=(10, 0))
+        # Everything is gridded straight onto controls_frame: the Debug/Fix
+        # checkboxes share row 0, each button spans both columns below
+        ttk.Checkbutton(controls_frame, text="Debug",
+                        variable=self.debug).grid(row=0, column=0, sticky="w", pady=1)
+        ttk.Checkbutton(controls_frame, text="Fix",
+                        variable=self.fix_enabled).grid(row=0, column=1, sticky="w", padx=(10, 0), pady=1)
 
         # Screenshot button
-        screenshot_button_frame = ttk.Frame(controls_frame)
-        screenshot_button_frame.pack(fill="x", pady=(4, 1))
-        self.screenshot_button = ttk.Button(screenshot_button_frame, text="Screenshot",
+        self.screenshot_button = ttk.Button(controls_frame, text="Screenshot",
                                             command=self.toggle_screenshot)
-        self.screenshot_button.pack(fill="x")
+        self.screenshot_button.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(4, 1))
 
         # LDPlayer button
-        ldplayer_button_frame = ttk.Frame(controls_frame)
-        ldplayer_button_frame.pack(fill="x", pady=(1, 1))
-        self.ldplayer_button = ttk.Button(ldplayer_button_frame, text="LDPlayer",
+        self.ldplayer_button = ttk.Button(controls_frame, text="LDPlayer",
                                           command=self.show_ldplayer_dialog)
-        self.ldplayer_button.pack(fill="x")
+        self.ldplayer_button.grid(row=2, column=0, columnspan=2, sticky="ew", pady=1)
 
         # Logs button
-        open_log_button_frame = ttk.Frame(controls_frame)
-        open_log_button_frame.pack(fill="x", pady=(1, 1))
-        self.open_log_button = ttk.Button(open_log_button_frame, text="Logs",
+        self.open_log_button = ttk.Button(controls_frame, text="Logs",
                                           command=self.open_log_viewer)
-        self.open_log_button.pack(fill="x")
+        self.open_log_button.grid(row=3, column=0, columnspan=2, sticky="ew", pady=1)
 
         # Details button
-        details_button_frame = ttk.Frame(controls_frame)
-        details_button_frame.pack(fill="x", pady=(1, 1))
-        self.details_button = ttk.Button(details_button_frame, text="Details",
+        self.details_button = ttk.Button(controls_frame, text="Details",
                                          command=self.show_details_dialog)
-        self.details_button.pack(fill="x")
+        self.details_button.grid(row=4, column=0, columnspan=2, sticky="ew", pady=1)
 
         # Start/Stop button
-        button_frame = ttk.Frame(controls_frame)
-        button_frame.pack(fill="x", pady=(1, 2))
-        self.toggle_button = ttk.Button(button_frame, text="Start", command=self.toggle_bot)
-        self.toggle_button.pack(fill="x")
+        self.toggle_button = ttk.Button(controls_frame, text="Start", command=self.toggle_bot)
+        self.toggle_button.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(1, 2))
 
     def _create_commands_section(self, parent):
         """Create commands section from config"""
         commands_frame = ttk.LabelFrame(parent, text="Commands", padding=2)
         commands_frame.pack(fill="x", padx=1, pady=(2, 0))
 
-        button_row = ttk.Frame(commands_frame)
-        button_row.pack(fill="x")
-
-        commands = self.config.get('commands', [])
-        for command in commands:
-            command_id = command.get('id', '')
-            label = command.get('label', command_id)
-
-            if command_id == 'start_stop':
-                continue  # Skip start/stop, it's handled separately
-
+        for column, (command_id, label) in enumerate(self._command_specs):
             # Create button for this command
-            btn = ttk.Button(button_row, text=label,
+            btn = ttk.Button(commands_frame, text=label,
                              command=lambda cid=command_id: self._trigger_command(cid))
-            btn.pack(side="left", padx=2, pady=1)
+            btn.grid(row=0, column=column, padx=2, pady=1)
 
     def _trigger_command(self, command_id):
         """Trigger a command by ID"""
@@ -365,32 +429,52 @@ class BotGUI:
         This handles the actual GUI logging. External code should call
         core.utils.log() which will delegate here for GUI updates.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
+        formatted_message = f"[{log_timestamp()}] {message}"
 
-        self.log_buffer.append(formatted_message)
+        # Shown by the next _flush_ui tick (thread-safe)
+        self._log_queue.put_nowait(formatted_message)
 
-        # Maintain buffer size
-        while len(self.log_buffer) > self.max_log_lines:
-            self.log_buffer.pop(0)
+        # Log to state manager for web interface and to the debug database
+        # (if debug enabled). Both are written by the background log writer,
+        # which batches bursts of messages into one transaction each.
+        log_db = self.log_db if self.log_db and self.debug.get() else None
+        if self.state_manager or log_db:
+            queue_db_log(self.state_manager, log_db, message, screenshot)
 
-        # Update log widget (thread-safe)
-        self.root.after(0, self._update_log_widget)
+    def _update_log_widget(self):
+        """Append queued log lines to log_buffer and the log text widget
 
-        # Log to state manager for web interface
-        if self.state_manager:
-            self.state_manager.add_log(message, screenshot)
+        Only the new lines are inserted; once the widget holds more than
+        LOG_WIDGET_LINES lines the oldest ones are removed in a single delete.
+        At most LOG_DRAIN_MAX lines are taken per call so a flood of log
+        messages can't stall the Tk thread; the rest wait for the next tick.
+        """
+        lines = []
+        log_queue = self._log_queue
+        try:
+            while len(lines) < self.LOG_DRAIN_MAX:
+                lines.append(log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not lines:
+            return
 
-        # Log to database if debug enabled
-        if self.log_db and self.debug.get():
-            self.log_db.add_log_entry(message, screenshot)
+        self.log_buffer.extend(lines)
+        if self._log_widget_hidden:
+            self._log_widget_stale = True
+            return
+        # Older lines would be trimmed again straight away
+        lines = lines[-self.LOG_WIDGET_LINES:]
 
-    def _update_log_widget(self):
-        """Update the log text widget with current buffer"""
         try:
             self.log_text.config(state=tk.NORMAL)
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(tk.END, "\n".join(self.log_buffer))
+            separator = "" if self.log_text.compare("end-1c", "==", "1.0") else "\n"
+            self.log_text.insert(tk.END, separator + "\n".join(lines))
+
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            excess = line_count - self.LOG_WIDGET_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
             self.log_text.config(state=tk.DISABLED)
 
             # Auto-scroll to bottom unless user is scrolling
@@ -399,19 +483,67 @@ class BotGUI:
         except:
             pass
 
+    def _on_root_unmap(self, event):
+        """Stop updating the log widget while the window is minimized"""
+        # Toplevel bindings also fire for every child widget
+        if event.widget is self.root:
+            self._log_widget_hidden = True
+
+    def _on_root_map(self, event):
+        """Catch the log widget up when the window is shown again"""
+        if event.widget is not self.root or not self._log_widget_hidden:
+            return
+        self._log_widget_hidden = False
+        if self._log_widget_stale:
+            self._log_widget_stale = False
+            self._refill_log_widget()
+
+    def _refill_log_widget(self):
+        """Replace the log widget contents with the newest lines of log_buffer"""
+        buffer = self.log_buffer
+        lines = list(islice(buffer, max(0, len(buffer) - self.LOG_WIDGET_LINES), None))
+        try:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.delete("1.0", tk.END)
+            self.log_text.insert(tk.END, "\n".join(lines))
+            self.log_text.config(state=tk.DISABLED)
+            if not self.user_scrolling:
+                self.log_text.see(tk.END)
+        except:
+            pass
+
+    def _flush_ui(self):
+        """Apply pending log lines and status changes, then schedule the next tick"""
+        try:
+            if not self._log_queue.empty():
+                self._update_log_widget()
+
+            with self._status_lock:
+                pending_status, self._pending_status = self._pending_status, None
+            if pending_status is not None:
+                self._apply_status(*pending_status)
+        finally:
+            self.root.after(self.UI_FLUSH_MS, self._flush_ui)
+
     def update_status(self, status, action=""):
-        """Update status labels and current action"""
-        def _update():
-            if status == "Running":
-                self.status_bot_label.config(text="Running", foreground="green")
-            elif status == "Stopped":
-                self.status_bot_label.config(text="Stopped", foreground="red")
-            elif status == "Error":
-                self.status_bot_label.config(text="Error", foreground="orange")
+        """Update status labels and current action
 
-            self.current_action_label.config(text=action)
+        Thread-safe: only the latest status is kept and applied on the next
+        UI tick, so bursts of updates cost one widget update.
+        """
+        with self._status_lock:
+            self._pending_status = (status, action)
 
-        self.root.after(0, _update)
+    def _apply_status(self, status, action):
+        """Show a bot status and current action in the labels (main thread)"""
+        if status == "Running":
+            self.status_bot_label.config(text="Running", foreground="green")
+        elif status == "Stopped":
+            self.status_bot_label.config(text="Stopped", foreground="red")
+        elif status == "Error":
+            self.status_bot_label.config(text="Error", foreground="orange")
+
+        self.current_action_label.config(text=action)
 
     def set_controller(self, controller):
         """Set the bot controller reference
@@ -444,8 +576,8 @@ class BotGUI:
         # Start live screenshot updater for remote monitoring
         self.start_live_screenshot_updater()
 
-        # Update state
-        self._update_full_state()
+        # Update state (full resync)
+        self._update_full_state(full=True)
 
     def stop_bot(self):
         """Stop the bot via controller"""
@@ -463,7 +595,7 @@ class BotGUI:
         self._update_status_label()
         self.current_action_label.config(text="Action: None")
         self.log("Stop button pressed - halting execution")
-        self._update_full_state()
+        self._update_full_state(full=True)
 
     def get_checkbox(self, func_name):
         """Get checkbox state for a function"""
@@ -493,10 +625,6 @@ class BotGUI:
 
     def _capture_screenshots(self):
         """Capture screenshots in a separate thread"""
-        import os
-        import time
-        import subprocess
-        from core.android import Android
         try:
             # Get interval
             try:
@@ -518,8 +646,8 @@ class BotGUI:
                 self.root.after(0, lambda: self.screenshot_button.config(text="Screenshot"))
                 return
 
-            # Connect to device
-            screenshot_andy = Android(serial)
+            # Connect to device (reusing an existing connection when possible)
+            screenshot_andy = self._get_screenshot_android(serial)
 
             # Single or continuous capture
             if interval == 0:
@@ -534,7 +662,7 @@ class BotGUI:
             else:
                 # Continuous capture
                 while self.screenshot_running:
-                    self._save_screenshot(screenshot_andy, device, screenshot_dir)
+                    self._save_screenshot(screenshot_andy, device, screenshot_dir, fast=True)
                     if self.screenshot_running:  # Check again before sleeping
                         time.sleep(interval)
 
@@ -543,26 +671,46 @@ class BotGUI:
             self.screenshot_running = False
             self.root.after(0, lambda: self.screenshot_button.config(text="Screenshot"))
 
-    def _save_screenshot(self, andy, device, screenshot_dir):
+    def _get_screenshot_android(self, serial):
+        """Get an Android connection for the Screenshot button
+
+        Uses the running bot's connection if there is one, otherwise a
+        connection kept across Screenshot presses, so repeated captures
+        don't repeat the ADB handshake.
+
+        Args:
+            serial: Device serial
+
+        Returns:
+            Android: Connected Android instance
+        """
+        if self.andy is not None and self.andy.serial_number == serial:
+            return self.andy
+        if self._screenshot_andy is None or self._screenshot_andy.serial_number != serial:
+            self._screenshot_andy = Android(serial)
+        return self._screenshot_andy
+
+    def _save_screenshot(self, andy, device, screenshot_dir, fast=False):
         """Save a single screenshot with timestamp
 
         Args:
             andy: Android instance
             device: Device name for filename
             screenshot_dir: Directory to save screenshots
+            fast: Use the fastest PNG compression (continuous capture), trading
+                  larger files for much cheaper encoding. Still lossless.
 
         Returns:
             str: Filepath of saved screenshot, or None if error
         """
-        import os
-        import cv2 as cv
 
         try:
             screenshot = andy.capture_screen()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{device}_{timestamp}.png"
             filepath = os.path.join(screenshot_dir, filename)
-            cv.imwrite(filepath, screenshot)
+            params = [int(cv.IMWRITE_PNG_COMPRESSION), 1] if fast else []
+            cv.imwrite(filepath, screenshot, params)
             self.log(f"Screenshot saved: {filename}")
             return filepath
         except Exception as e:
@@ -633,24 +781,27 @@ class BotGUI:
 
         def on_start():
             try:
-                ld = LDPlayer.from_config()
+                ld = self._get_ld()
                 ld.launch(index=index)
+                _clear_ld_status_cache()
                 status_var.set(f"Started {self.device_name}")
             except Exception as e:
                 status_var.set(f"Error: {e}")
 
         def on_stop():
             try:
-                ld = LDPlayer.from_config()
+                ld = self._get_ld()
                 ld.quit(index=index)
+                _clear_ld_status_cache()
                 status_var.set(f"Stopped {self.device_name}")
             except Exception as e:
                 status_var.set(f"Error: {e}")
 
         def on_reboot():
             try:
-                ld = LDPlayer.from_config()
+                ld = self._get_ld()
                 ld.reboot(index=index)
+                _clear_ld_status_cache()
                 status_var.set(f"Rebooting {self.device_name}")
             except Exception as e:
                 status_var.set(f"Error: {e}")
@@ -672,7 +823,7 @@ class BotGUI:
                 status_var.set("No app_package in config")
                 return
             try:
-                ld = LDPlayer.from_config()
+                ld = self._get_ld()
                 ld.run_app(app_package, index=index)
                 status_var.set(f"Started app")
             except Exception as e:
@@ -683,7 +834,7 @@ class BotGUI:
                 status_var.set("No app_package in config")
                 return
             try:
-                ld = LDPlayer.from_config()
+                ld = self._get_ld()
                 ld.kill_app(app_package, index=index)
                 status_var.set(f"Stopped app")
             except Exception as e:
@@ -701,9 +852,6 @@ class BotGUI:
         Launches the LogViewer application in a separate process, automatically
         selecting the current device and session (if debug mode is active).
         """
-        import subprocess
-        import sys
-        import os
 
         # Get the path to LogViewer.py (in tools/ directory)
         log_viewer_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tools', 'LogViewer.py')
@@ -826,15 +974,43 @@ class BotGUI:
 
     def _on_settings_change(self, *args):
         """Called when settings change"""
-        self._update_full_state()
+        self._schedule_full_state()
+
+    def _get_ld(self):
+        """Get the LDPlayer controller, reading master.conf only on first use
+
+        Returns:
+            LDPlayer: Shared controller instance
+
+        Raises:
+            FileNotFoundError, KeyError: As LDPlayer.from_config() (not cached, so
+                                         fixing master.conf takes effect on retry)
+        """
+        if self._ld is None:
+            self._ld = LDPlayer.from_config()
+        return self._ld
 
     def _check_ld_status(self):
-        """Check LDPlayer running status"""
+        """Check LDPlayer running status
+
+        Uses the shared status cache while it is younger than LD_STATUS_TTL,
+        otherwise lists all instances once and refreshes every entry.
+        """
         try:
             device_config = self.config.get('devices', {}).get(self.device_name, {})
             index = device_config.get('index', 0)
-            ld = LDPlayer.from_config()
-            self.ld_running_state = ld.is_running(index=index)
+            with _ld_status_lock:
+                now = time.monotonic()
+                entry = _ld_status_cache.get(index)
+                if entry is None or now - entry[0] >= LD_STATUS_TTL:
+                    instances = self._get_ld().list_instances()
+                    for instance in instances:
+                        running = instance['android_started'] and instance['pid'] != -1
+                        _ld_status_cache[instance['index']] = (now, running)
+                    entry = _ld_status_cache.get(index)
+                    if entry is None or entry[0] != now:
+                        entry = _ld_status_cache[index] = (now, False)
+            self.ld_running_state = entry[1]
             if self._has_state_manager():
                 self.state_manager.update_ld_running(self.ld_running_state)
         except Exception:
@@ -850,8 +1026,15 @@ class BotGUI:
         bot_color = "green" if self.is_running else "red"
         self.status_bot_label.config(text=bot_text, foreground=bot_color)
 
-    def _update_full_state(self):
-        """Update full state to state manager"""
+    def _update_full_state(self, full=False):
+        """Update state in the state manager
+
+        Only values that changed since the last write are sent, and nothing
+        is written if none did.
+
+        Args:
+            full: Send every value, e.g. to resync after starting/stopping
+        """
         if not self._has_state_manager():
             return
 
@@ -867,7 +1050,15 @@ class BotGUI:
             for func_name, var in self.function_states.items():
                 state[func_name] = var.get()
 
-            self.state_manager.update_state(state)
+            last_sent = self._last_sent_state
+            if full:
+                changes = state
+            else:
+                changes = {key: value for key, value in state.items()
+                           if key not in last_sent or last_sent[key] != value}
+            if changes:
+                self.state_manager.update_state(changes)
+                last_sent.update(changes)
         except Exception:
             pass
 
@@ -880,31 +1071,37 @@ class BotGUI:
             return
 
         self.live_screenshot_running = True
-        import time
 
         def screenshot_update_loop():
-            ld_check_counter = 0
+            next_ld_check = 0.0
+            last_error = 0.0
             while self.live_screenshot_running:
+                # Only capture while a remote viewer is reading this device's
+                # screenshot; otherwise poll slowly until one shows up
+                watched = False
                 try:
-                    if self.is_running and self.andy is not None and self._has_state_manager():
+                    if (self.is_running and self.andy is not None and self._has_state_manager()
+                            and self.state_manager.has_active_viewer()):
+                        watched = True
                         screenshot = self.andy.capture_screen()
                         if screenshot is not None:
                             self.state_manager.update_screenshot(screenshot)
                 except Exception as e:
                     # Log screenshot errors periodically (not every loop)
-                    if ld_check_counter == 0:
+                    if time.monotonic() - last_error >= 10:
+                        last_error = time.monotonic()
                         print(f"[Screenshot] Error: {e}")
 
-                ld_check_counter += 1
-                if ld_check_counter >= 20:
-                    ld_check_counter = 0
+                # LD status is checked every 10 seconds regardless of viewers
+                if time.monotonic() >= next_ld_check:
+                    next_ld_check = time.monotonic() + 10
                     try:
                         self._check_ld_status()
                         self.root.after(0, self._update_status_label)
                     except Exception:
                         pass
 
-                time.sleep(0.5)
+                time.sleep(0.5 if watched else 2.0)
 
         self.live_screenshot_thread = threading.Thread(
             target=screenshot_update_loop,
@@ -918,6 +1115,8 @@ class BotGUI:
         self.live_screenshot_running = False
         if self.live_screenshot_thread:
             self.live_screenshot_thread.join(timeout=1.0)
+        if self._has_state_manager():
+            self.state_manager.flush_screenshot()
 
     def start_remote_monitoring(self):
         """Start background thread to monitor remote commands"""
@@ -928,26 +1127,38 @@ class BotGUI:
             return
 
         self.remote_monitoring_running = True
-        import time
 
         def remote_monitor_loop():
             while self.remote_monitoring_running:
+                # Blocks until a command is sent from this process, or ~250ms
+                # before polling for commands from the web server
+                try:
+                    if not self.state_manager.wait_for_commands():
+                        continue
+                except Exception:
+                    time.sleep(0.25)
+                    continue
+                if not self.remote_monitoring_running:
+                    break
                 try:
                     if hasattr(self, 'state_manager'):
                         commands = self.state_manager.get_pending_commands()
+                        processed_ids = []
                         for cmd in commands:
                             try:
                                 self._process_remote_command(cmd)
                             except Exception:
                                 pass
                             finally:
-                                try:
-                                    self.state_manager.mark_command_processed(cmd['id'])
-                                except Exception:
-                                    pass
+                                processed_ids.append(cmd['id'])
+                        # Mark the whole batch processed in one transaction
+                        if processed_ids:
+                            try:
+                                self.state_manager.mark_commands_processed(processed_ids)
+                            except Exception:
+                                pass
                 except Exception:
                     pass
-                time.sleep(0.25)
 
         self.remote_monitoring_thread = threading.Thread(
             target=remote_monitor_loop,
@@ -959,6 +1170,8 @@ class BotGUI:
     def stop_remote_monitoring(self):
         """Stop the remote monitoring thread"""
         self.remote_monitoring_running = False
+        if self._has_state_manager():
+            self.state_manager.notify_commands()  # Wake the loop so it exits now
         if self.remote_monitoring_thread:
             self.remote_monitoring_thread.join(timeout=1.0)
 
@@ -967,7 +1180,7 @@ class BotGUI:
         if name in self.function_states:
             self.function_states[name].set(enabled)
             self.log(f"Remote: {name} set to {enabled}")
-            self._update_full_state()
+            self._schedule_full_state()
 
     def _set_setting(self, name, value):
         """Set a setting value and update state (called from main thread)"""
@@ -977,7 +1190,7 @@ class BotGUI:
             self.debug.set(bool(value))
         elif name == 'fix_enabled':
             self.fix_enabled.set(bool(value))
-        self._update_full_state()
+        self._schedule_full_state()
 
     def _execute_remote_tap(self, x, y):
         """Execute a remote tap command via queue for serialized execution"""
@@ -1046,7 +1259,7 @@ class BotGUI:
         try:
             device_config = self.config.get('devices', {}).get(self.device_name, {})
             index = device_config.get('index', 0)
-            ld = LDPlayer.from_config()
+            ld = self._get_ld()
             app_package = self.config.get('app_package', '')
 
             if cmd_type == 'ld_start':
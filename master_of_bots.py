@@ -52,7 +52,9 @@ import signal
 import subprocess
 import base64
 import queue
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Optional, Callable, Any, List
 
 # Add project root to path
@@ -62,15 +64,15 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.bot import BOT, BotStoppedException
 from core.android import Android, AndroidStoppedException
 from core.config_loader import load_config, load_master_config, get_serial
+from core.timings import get_speed_multiplier
 from core.ldplayer import LDPlayer, launch_devices_if_needed
-from core.utils import build_function_map, build_command_map
+from core.utils import build_function_map, build_command_map, log_timestamp, queue_db_log, flush_db_logs
 from core.log_database import LogDatabase, get_available_devices, clear_all_devices_logs
 
 
 def log_master(message: str):
     """Print timestamped log message for Master/WebServer"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}]{message}")
+    print(f"[{log_timestamp()}]{message}")
 
 
 # =============================================================================
@@ -144,9 +146,9 @@ class HeadlessBot:
         self.last_run_times: Dict[str, float] = {}
         self.cooldown_labels: Dict[str, Any] = {}  # Dummy for compatibility
 
-        # Log buffer
-        self.log_buffer: List[str] = []
+        # Log buffer (deque drops the oldest line once max_log_lines is reached)
         self.max_log_lines = 100
+        self.log_buffer: deque = deque(maxlen=self.max_log_lines)
 
         # Direct screenshot storage (in-memory, no database needed)
         self.latest_screenshot: Any = None
@@ -229,7 +231,7 @@ class HeadlessBot:
             state['studio_stop'] = self.studio_stop.get()
 
             # Add recent logs
-            state['current_log'] = '\n'.join(self.log_buffer[-10:]) if self.log_buffer else ''
+            state['current_log'] = '\n'.join(self.recent_logs(10))
 
             # Build unified queue display
             queue_items = []
@@ -311,13 +313,10 @@ class HeadlessBot:
             screenshot: Optional screenshot for debug logging to database
             console: If True, also print to console (for system/framework messages)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}][{self.device_name}] {message}"
+        entry = f"[{log_timestamp()}][{self.device_name}] {message}"
 
         with self._lock:
-            self.log_buffer.append(entry)
-            if len(self.log_buffer) > self.max_log_lines:
-                self.log_buffer = self.log_buffer[-self.max_log_lines:]
+            self.log_buffer.append(entry)  # deque(maxlen) trims itself
 
         # Print to console only for system/framework messages
         if console:
@@ -336,12 +335,17 @@ class HeadlessBot:
                 # Create log database if not already created
                 if self.log_db is None:
                     self.log_db = LogDatabase(self.device_name)
-                    print(f"[{timestamp}][{self.device_name}] Debug log DB created: {self.log_db.db_path}")
-                # Add entry with screenshot
-                self.log_db.add_log_entry(message, screenshot)
+                    print(f"[{log_timestamp()}][{self.device_name}] Debug log DB created: {self.log_db.db_path}")
+                # Add entry with screenshot (written by the background log writer)
+                queue_db_log(None, self.log_db, message, screenshot)
             except Exception as e:
                 # Don't let database errors break logging
-                print(f"[{timestamp}][{self.device_name}] Debug log DB error: {e}")
+                print(f"[{log_timestamp()}][{self.device_name}] Debug log DB error: {e}")
+
+    def recent_logs(self, count: int) -> List[str]:
+        """Get the last count log lines, oldest first"""
+        with self._lock:
+            return list(islice(self.log_buffer, max(0, len(self.log_buffer) - count), None))
 
     def update_status(self, status: str, message: str = ""):
         """Update status display"""
@@ -405,6 +409,8 @@ class HeadlessBot:
         """Close the debug log database if open"""
         if self.log_db is not None:
             try:
+                # Write entries still queued for this database before ending its session
+                flush_db_logs()
                 self.log_db.close_session()
                 self.log_db.conn.close()
             except Exception:
@@ -589,7 +595,7 @@ class MasterBotManager:
                     'debug_enabled': bot.debug.get(),
                     'sleep_time': bot.sleep_time.get(),
                 },
-                'log': bot.log_buffer[-10:] if bot.log_buffer else []
+                'log': bot.recent_logs(10)
             }
             states.append(state)
         return states
@@ -619,6 +625,7 @@ class MasterBotManager:
             botobj = BOT(andy, findimg_path=self.findimg_path)
             botobj.set_gui(bot)
             botobj.should_stop = False
+            botobj.speed_multiplier = get_speed_multiplier(self.config, device_name)
             # Tell BOT that main loop handles command processing (not background thread)
             botobj._main_loop_processes_commands = True
             bot.bot = botobj
@@ -1093,7 +1100,7 @@ def create_web_server(manager: MasterBotManager, config: dict):
 
                     # Only include last 5 log lines in list view for performance
                     # Full logs are fetched via /api/bots/<device_name> endpoint
-                    bot_state['current_log'] = '\n'.join(bot.log_buffer[-5:]) if bot.log_buffer else ''
+                    bot_state['current_log'] = '\n'.join(bot.recent_logs(5))
 
                     all_bots.append(bot_state)
                 except Exception as bot_error:
@@ -322,6 +322,10 @@ Examples:
     # Start the GUI main loop (no remote monitoring in local mode)
     root.mainloop()
 
+    # Let the last screenshot write finish before exiting
+    if gui.state_manager:
+        gui.state_manager.close()
+
 
 if __name__ == "__main__":
     main()
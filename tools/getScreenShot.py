@@ -4,21 +4,31 @@ Screenshot utility for Android devices via ADB.
 Captures screenshots from connected Android devices and saves them to file.
 """
 
-import argparse
+import functools
+import hashlib
 import json
 import logging
+import re
+import socket
+import struct
 import subprocess
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
-import cv2 as cv
-import numpy as np
+from types import SimpleNamespace
+from typing import Optional, Tuple, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+    import numpy as np
 
 # Add parent directory to path for core imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.android import Android
+# cv2, numpy and core.android (which loads both) are imported where they are
+# used, so --help and argument/config errors exit without loading them
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +45,38 @@ EXIT_CAPTURE_ERROR = 3
 EXIT_SAVE_ERROR = 4
 EXIT_INVALID_ARGS = 5
 
+# minicap streaming (https://github.com/DeviceFarmer/minicap) - the minicap
+# binary and minicap.so must already be pushed to MINICAP_DIR on the device
+MINICAP_DIR = '/data/local/tmp'
+MINICAP_PORT = 1313
+MINICAP_BANNER_SIZE = 24
+
+# Fastest-encode settings per output format. PNG stays the default because
+# needle images are cropped from these screenshots and must be lossless.
+PNG_COMPRESSION = 1
+DEFAULT_JPEG_QUALITY = 85
+
+DEFAULT_OUTPUT = 'tempScreenShot.png'
+FORMAT_CHOICES = ('png', 'jpg', 'bmp')
+
+# "x1,y1,x2,y2" with optional spaces around the numbers
+_REGION_RE = re.compile(r'\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*')
+
+# Options the argv fast path understands: flag -> (attribute, takes a value)
+_FAST_OPTIONS = {
+    '-s': ('serial', True), '--serial': ('serial', True),
+    '-c': ('config', True), '--config': ('config', True),
+    '-o': ('output', True), '--output': ('output', True),
+    '-f': ('format', True), '--format': ('format', True),
+    '-v': ('verbose', False), '--verbose': ('verbose', False),
+    '-q': ('quiet', False), '--quiet': ('quiet', False),
+    '-m': ('minicap', False), '--minicap': ('minicap', False),
+    '-p': ('paint', False), '--paint': ('paint', False),
+}
+
+# Config path -> (mtime, parsed config), so repeated loads skip the JSON parse
+_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 def load_config(config_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
@@ -58,15 +100,24 @@ def load_config(config_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
         ]
 
     for path in paths:
-        if path.exists():
-            try:
-                with open(path, 'r') as f:
-                    config = json.load(f)
-                    logger.debug(f"Loaded configuration from: {path}")
-                    return config
-            except Exception as e:
-                logger.warning(f"Failed to load config from {path}: {e}")
-                continue
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+
+        cached = _config_cache.get(str(path))
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with open(path, 'r') as f:
+                config = json.load(f)
+                logger.debug(f"Loaded configuration from: {path}")
+                _config_cache[str(path)] = (mtime, config)
+                return config
+        except Exception as e:
+            logger.warning(f"Failed to load config from {path}: {e}")
+            continue
 
     logger.debug("No configuration file found, using defaults")
     return None
@@ -95,18 +146,171 @@ def get_serial_from_config(config: Optional[Dict[str, Any]], user: str) -> Optio
     return None
 
 
+class MinicapStream:
+    """Reads JPEG frames from a minicap server running on the device.
+
+    minicap encodes frames on the device and streams them over a forwarded
+    socket, so once connected each frame costs only a socket read and a
+    JPEG decode instead of a full screencap + PNG round trip.
+    """
+
+    def __init__(self, device, port: int = MINICAP_PORT, quality: int = DEFAULT_JPEG_QUALITY):
+        """
+        Initialize a minicap stream for a device.
+
+        Args:
+            device: Connected ppadb Device - commands go over the ADB server
+                    socket instead of spawning adb client processes
+            port: Local TCP port to forward the minicap socket to
+            quality: JPEG quality 0-100 minicap encodes frames with on the device
+        """
+        self.device = device
+        self.port = port
+        self.quality = quality
+        self._server = None  # ADB shell connection running minicap
+        self._sock = None
+
+    def _recv_exact(self, size: int) -> bytes:
+        """
+        Read exactly size bytes from the minicap socket.
+
+        Raises:
+            ConnectionError: If the socket closes before size bytes arrive
+        """
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = self._sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("minicap socket closed")
+            buf += chunk
+        return bytes(buf)
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start minicap on the device and connect to its frame stream.
+
+        Args:
+            timeout: Seconds to wait for minicap to accept connections
+
+        Returns:
+            True if the stream is ready, False otherwise
+        """
+        try:
+            size_output = self.device.shell('wm size', timeout=timeout)
+            size_match = re.search(r'(\d+)x(\d+)', size_output)
+            if not size_match:
+                logger.warning(f"Could not read display size for minicap: {size_output.strip()}")
+                return False
+            width, height = size_match.groups()
+            projection = f"{width}x{height}@{width}x{height}/0"
+
+            # minicap runs for as long as this shell connection stays open;
+            # its output is discarded on the device so the unread socket never fills
+            self._server = self.device.create_connection(timeout=timeout)
+            self._server.send(
+                f'shell:LD_LIBRARY_PATH={MINICAP_DIR} {MINICAP_DIR}/minicap '
+                f'-P {projection} -Q {self.quality} -S >/dev/null 2>&1'
+            )
+            self.device.forward(f'tcp:{self.port}', 'localabstract:minicap')
+
+            # The forward accepts connections before minicap listens - retry
+            # until the 24-byte banner arrives
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    self._sock = socket.create_connection(('127.0.0.1', self.port), timeout=timeout)
+                    banner = self._recv_exact(MINICAP_BANNER_SIZE)
+                    break
+                except OSError:
+                    if self._sock:
+                        self._sock.close()
+                        self._sock = None
+                    if time.monotonic() >= deadline:
+                        raise
+                    time.sleep(0.1)
+
+            _, _, _, real_w, real_h, _, _, _, _ = struct.unpack('<BBIIIIIBB', banner)
+            logger.info(f"minicap stream ready ({real_w}x{real_h})")
+            return True
+        except Exception as e:
+            logger.warning(f"minicap unavailable, using screencap: {e}")
+            self.close()
+            return False
+
+    def read_frame(self) -> 'np.ndarray':
+        """
+        Read and decode the next frame from the stream.
+
+        Returns:
+            Frame as a BGR numpy array
+
+        Raises:
+            ConnectionError: If the stream is closed
+            ValueError: If the frame cannot be decoded
+        """
+        import cv2 as cv
+        import numpy as np
+
+        frame_size = struct.unpack('<I', self._recv_exact(4))[0]
+        frame = cv.imdecode(np.frombuffer(self._recv_exact(frame_size), np.uint8), cv.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError("Failed to decode minicap frame")
+        return frame
+
+    def close(self) -> None:
+        """Close the stream, stop minicap and remove the port forward."""
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+        if self._server:
+            self._server.close()
+            self._server = None
+            try:
+                self.device.killforward(f'tcp:{self.port}')
+            except Exception as e:
+                logger.debug(f"Could not remove minicap port forward: {e}")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_android(serial: str):
+    """
+    Get a shared Android connection for a device serial.
+
+    Repeated ScreenshotCapture instances for the same device reuse one
+    connection instead of paying the ADB device list and transport setup
+    each time. Call _get_android.cache_clear() to drop stale connections.
+    """
+    from core.android import Android
+
+    return Android(serial)
+
+
 class ScreenshotCapture:
     """Handles screenshot capture from Android devices."""
 
-    def __init__(self, device_serial: str):
+    def __init__(self, device_serial: str, use_minicap: bool = False,
+                 minicap_quality: int = DEFAULT_JPEG_QUALITY,
+                 minicap_port: int = MINICAP_PORT):
         """
         Initialize screenshot capture for a device.
 
         Args:
             device_serial: Serial number of the Android device
+            use_minicap: Stream frames from minicap, falling back to screencap
+            minicap_quality: On-device JPEG quality for minicap frames
+            minicap_port: Local TCP port for the minicap forward - must be
+                          unique per device captured at the same time
         """
         self.device_serial = device_serial
         self.android = None
+        self.use_minicap = use_minicap
+        self.minicap_quality = minicap_quality
+        self.minicap_port = minicap_port
+        self.minicap = None
+        # Fingerprint and path of the last saved frame - an identical frame
+        # saved to the same path again skips the encode and write
+        self._last_hash = None
+        self._last_path = None
 
     def connect(self) -> bool:
         """
@@ -117,14 +321,48 @@ class ScreenshotCapture:
         """
         try:
             logger.info(f"Connecting to device: {self.device_serial}")
-            self.android = Android(self.device_serial)
+            self.android = _get_android(self.device_serial)
             logger.info("Successfully connected to device")
-            return True
         except Exception as e:
             logger.error(f"Failed to connect to device: {e}")
             return False
 
-    def capture(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        if self.use_minicap:
+            minicap = MinicapStream(self.android.device, port=self.minicap_port,
+                                    quality=self.minicap_quality)
+            if minicap.start():
+                self.minicap = minicap
+        return True
+
+    def close(self) -> None:
+        """Release the minicap stream, if one is open."""
+        if self.minicap:
+            self.minicap.close()
+            self.minicap = None
+
+    def __enter__(self) -> 'ScreenshotCapture':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _capture_screen(self) -> 'np.ndarray':
+        """
+        Capture a full frame over ADB, reconnecting once on failure.
+
+        The shared connection may have gone stale (device restarted, ADB
+        server reset) since it was cached, so a failed capture drops the
+        cached connections and retries once with a fresh one.
+        """
+        try:
+            return self.android.capture_screen()
+        except Exception as e:
+            logger.warning(f"Capture failed, reconnecting: {e}")
+            _get_android.cache_clear()
+            self.android = _get_android(self.device_serial)
+            return self.android.capture_screen()
+
+    def capture(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional['np.ndarray']:
         """
         Capture screenshot from the device.
 
@@ -134,19 +372,36 @@ class ScreenshotCapture:
         Returns:
             Screenshot as numpy array, or None if capture failed
         """
+        import numpy as np
+
         if not self.android:
             logger.error("Not connected to device. Call connect() first.")
             return None
 
         try:
             logger.info("Capturing screenshot...")
-            screenshot = self.android.capture_screen()
+            screenshot = None
+            if self.minicap:
+                try:
+                    screenshot = self.minicap.read_frame()
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"minicap read failed, using screencap: {e}")
+                    self.close()
+            if screenshot is None:
+                screenshot = self._capture_screen()
             logger.info("Captured full screenshot")
 
             # Crop to region if specified
             if region is not None and screenshot is not None:
                 x1, y1, x2, y2 = region
-                screenshot = screenshot[y1:y2, x1:x2]
+                # Copy the crop out so the full frame can be freed right away
+                # and the encoder gets a contiguous buffer
+                cropped = np.ascontiguousarray(screenshot[y1:y2, x1:x2])
+                if cropped.size == 0:
+                    height, width = screenshot.shape[:2]
+                    logger.error(f"Region {region} is empty or outside the {width}x{height} screen")
+                    return None
+                screenshot = cropped
                 logger.info(f"Cropped to region: {region}")
 
             return screenshot
@@ -154,18 +409,23 @@ class ScreenshotCapture:
             logger.error(f"Failed to capture screenshot: {e}")
             return None
 
-    def save(self, screenshot: np.ndarray, output_path: str, format: str = 'png') -> Optional[str]:
+    def save(self, screenshot: 'np.ndarray', output_path: str, format: str = 'png',
+             quality: int = DEFAULT_JPEG_QUALITY) -> Optional[str]:
         """
         Save screenshot to file.
 
         Args:
             screenshot: Screenshot as numpy array (already in BGR/BGRA format from Android class)
             output_path: Path where to save the screenshot
-            format: Image format (png, jpg, bmp)
+            format: Image format (png, jpg, bmp) used when output_path has no extension
+            quality: JPEG quality 0-100 (ignored for other formats)
 
         Returns:
             Path to saved file if successful, None otherwise
         """
+        import cv2 as cv
+        import numpy as np
+
         try:
             # Ensure the output directory exists
             output_file = Path(output_path)
@@ -177,11 +437,36 @@ class ScreenshotCapture:
 
             logger.info(f"Saving screenshot to: {output_file}")
 
+            # Hashing the raw pixels takes a few ms against tens of ms for the encode
+            frame_hash = hashlib.blake2b(np.ascontiguousarray(screenshot).data, digest_size=16)
+            frame_hash.update(repr(screenshot.shape).encode())
+            frame_hash = frame_hash.digest()
+            if (frame_hash == self._last_hash and self._last_path == str(output_file)
+                    and output_file.exists()):
+                logger.info(f"Screenshot unchanged, keeping: {output_file}")
+                return str(output_file)
+
+            suffix = output_file.suffix.lower()
+            if suffix in ('.jpg', '.jpeg'):
+                params = [cv.IMWRITE_JPEG_QUALITY, quality, cv.IMWRITE_JPEG_OPTIMIZE, 0,
+                          cv.IMWRITE_JPEG_PROGRESSIVE, 0]
+            elif suffix == '.png':
+                params = [cv.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION]
+            else:
+                params = []
+
             # The Android.capture_screen() already returns image in BGR/BGRA format (OpenCV format)
-            # So we can save it directly without color conversion
-            success = cv.imwrite(str(output_file), screenshot)
+            # Screen captures are fully opaque, so the alpha channel is dropped: the
+            # encoder then handles 3 bytes per pixel instead of 4 and PNGs come out smaller
+            if screenshot.ndim == 3 and screenshot.shape[2] == 4 and screenshot[:, :, 3].min() == 255:
+                screenshot = cv.cvtColor(screenshot, cv.COLOR_BGRA2BGR)
+            success, encoded = cv.imencode(suffix, screenshot, params)
+            if success:
+                output_file.write_bytes(encoded.tobytes())
 
             if success:
+                self._last_hash = frame_hash
+                self._last_path = str(output_file)
                 logger.info(f"Screenshot saved successfully: {output_file}")
                 return str(output_file)
             else:
@@ -206,13 +491,12 @@ def parse_region(region_str: str) -> Tuple[int, int, int, int]:
     Raises:
         ValueError: If region format is invalid
     """
-    try:
-        coords = [int(x.strip()) for x in region_str.split(',')]
-        if len(coords) != 4:
-            raise ValueError("Region must have exactly 4 coordinates")
-        return (coords[0], coords[1], coords[2], coords[3])
-    except Exception as e:
-        raise ValueError(f"Invalid region format. Expected 'x1,y1,x2,y2': {e}")
+    match = _REGION_RE.fullmatch(region_str)
+    if not match:
+        raise ValueError(f"Invalid region format. Expected 'x1,y1,x2,y2' "
+                         f"with non-negative integers: {region_str!r}")
+    x1, y1, x2, y2 = map(int, match.groups())
+    return (x1, y1, x2, y2)
 
 
 def open_in_mspaint(file_path: str) -> bool:
@@ -233,8 +517,16 @@ def open_in_mspaint(file_path: str) -> bool:
 
         # Explicitly call mspaint.exe to avoid default image viewer
         if sys.platform == 'win32':
-            # Use subprocess.Popen to avoid blocking
-            subprocess.Popen(['mspaint.exe', abs_path])
+            # Detach Paint from this console and don't let it inherit our
+            # handles, so the script exits as soon as Paint is launched
+            subprocess.Popen(
+                ['mspaint.exe', abs_path],
+                creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                close_fds=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
             logger.info("Opened screenshot in MS Paint")
             return True
         else:
@@ -251,13 +543,59 @@ def open_in_mspaint(file_path: str) -> bool:
         return False
 
 
-def parse_arguments() -> argparse.Namespace:
+def parse_simple_arguments(argv: list) -> Optional[SimpleNamespace]:
+    """
+    Parse the common invocations without importing argparse.
+
+    Scripted callers mostly pass a user or serial and an output path; building
+    an ArgumentParser costs more than the rest of startup before the capture.
+    Anything beyond an optional user and the flags in _FAST_OPTIONS (--help,
+    --region, --quality, '=' forms, bad values) returns None so that
+    parse_arguments() handles it with its full validation and messages.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        Parsed arguments, or None if argparse is needed
+    """
+    args = SimpleNamespace(
+        user=None, serial=None, config=None, output=DEFAULT_OUTPUT, region=None,
+        format='png', quality=DEFAULT_JPEG_QUALITY, verbose=False, quiet=False,
+        minicap=False, paint=False
+    )
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        option = _FAST_OPTIONS.get(arg)
+        if option is None:
+            if arg.startswith('-') or args.user is not None:
+                return None
+            args.user = arg
+        elif option[1]:
+            i += 1
+            if i >= len(argv) or argv[i].startswith('-'):
+                return None
+            setattr(args, option[0], argv[i])
+        else:
+            setattr(args, option[0], True)
+        i += 1
+
+    if args.format not in FORMAT_CHOICES:
+        return None
+    return args
+
+
+def parse_arguments() -> 'argparse.Namespace':
     """
     Parse command-line arguments.
 
     Returns:
         Parsed arguments
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Capture screenshots from Android devices via ADB',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -268,13 +606,14 @@ Examples:
   %(prog)s Device1 -r 100,100,500,500           # Capture region
   %(prog)s Device1 -f jpg -v                    # Save as JPEG with verbose output
   %(prog)s Device1 -s emulator-5554             # Use serial directly
+  %(prog)s Device1,Device2                      # Capture several devices in parallel
         """
     )
 
     parser.add_argument(
         'user',
         nargs='?',
-        help='User/device name from Toons configuration'
+        help='User/device name from Toons configuration (comma-separated for several devices)'
     )
 
     parser.add_argument(
@@ -289,8 +628,8 @@ Examples:
 
     parser.add_argument(
         '-o', '--output',
-        default='tempScreenShot.png',
-        help='Output file path (default: tempScreenShot.png)'
+        default=DEFAULT_OUTPUT,
+        help=f'Output file path (default: {DEFAULT_OUTPUT})'
     )
 
     parser.add_argument(
@@ -300,11 +639,18 @@ Examples:
 
     parser.add_argument(
         '-f', '--format',
-        choices=['png', 'jpg', 'bmp'],
+        choices=FORMAT_CHOICES,
         default='png',
         help='Output image format (default: png)'
     )
 
+    parser.add_argument(
+        '-Q', '--quality',
+        type=int,
+        default=DEFAULT_JPEG_QUALITY,
+        help=f'JPEG quality 0-100, also used for minicap frames (default: {DEFAULT_JPEG_QUALITY})'
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -317,6 +663,12 @@ Examples:
         help='Suppress all output except errors'
     )
 
+    parser.add_argument(
+        '-m', '--minicap',
+        action='store_true',
+        help='Capture via a minicap stream (minicap must be installed in /data/local/tmp)'
+    )
+
     parser.add_argument(
         '-p', '--paint',
         action='store_true',
@@ -333,7 +685,7 @@ def main() -> int:
     Returns:
         Exit code
     """
-    args = parse_arguments()
+    args = parse_simple_arguments(sys.argv[1:]) or parse_arguments()
 
     # Configure logging level
     if args.verbose:
@@ -347,33 +699,38 @@ def main() -> int:
     # Get screenshot config settings with defaults
     screenshot_config = config.get('screenshot', {}) if config else {}
     default_open_in_paint = screenshot_config.get('open_in_paint', False)
+    use_minicap = args.minicap or screenshot_config.get('minicap', False)
 
     # Get default device from config if user not specified
     default_device = config.get('default_device') if config else None
     user = args.user if args.user else default_device
 
-    # Determine device serial (priority: CLI --serial > config file)
-    device_serial = None
+    # Determine device serials (priority: CLI --serial > config file)
+    # as (user or serial, serial) pairs
+    targets = []
 
     if args.serial:
-        device_serial = args.serial
-        logger.debug(f"Using serial from command line: {device_serial}")
+        targets.append((args.serial, args.serial))
+        logger.debug(f"Using serial from command line: {args.serial}")
     elif user:
-        # Get serial from config file
-        if config:
-            device_serial = get_serial_from_config(config, user)
+        # Get serials from config file
+        if not config:
+            logger.error("Configuration file not found. Please create master.conf")
+            return EXIT_INVALID_ARGS
+        for name in (u.strip() for u in user.split(',')):
+            if not name:
+                continue
+            device_serial = get_serial_from_config(config, name)
             if device_serial:
-                logger.debug(f"Resolved user '{user}' to serial from config: {device_serial}")
+                logger.debug(f"Resolved user '{name}' to serial from config: {device_serial}")
+                targets.append((name, device_serial))
             else:
-                logger.error(f"Unknown user: {user}")
+                logger.error(f"Unknown user: {name}")
                 available_users = list(config.get('devices', {}).keys())
                 if available_users:
                     logger.error(f"Available users: {', '.join(available_users)}")
                 return EXIT_INVALID_ARGS
-        else:
-            logger.error("Configuration file not found. Please create master.conf")
-            return EXIT_INVALID_ARGS
-    else:
+    if not targets:
         logger.error("Either --serial, user argument, or default_device in config is required")
         return EXIT_INVALID_ARGS
 
@@ -387,34 +744,59 @@ def main() -> int:
             logger.error(f"Invalid region: {e}")
             return EXIT_INVALID_ARGS
 
-    # Create screenshot capture instance
-    capturer = ScreenshotCapture(device_serial)
-
-    # Connect to device
-    if not capturer.connect():
-        logger.error("Failed to connect to device")
-        return EXIT_CONNECTION_ERROR
-
-    # Capture screenshot
-    screenshot = capturer.capture(region)
-    if screenshot is None:
-        logger.error("Failed to capture screenshot")
-        return EXIT_CAPTURE_ERROR
-
-    # Save screenshot
-    saved_path = capturer.save(screenshot, args.output, args.format)
-    if not saved_path:
-        logger.error("Failed to save screenshot")
-        return EXIT_SAVE_ERROR
-
-    logger.info("Screenshot capture completed successfully")
-
-    # Open in MS Paint if requested via CLI arg or config default
-    should_open_paint = args.paint or default_open_in_paint
-    if should_open_paint:
-        open_in_mspaint(saved_path)
-
-    return EXIT_SUCCESS
+    def capture_one(name: str, device_serial: str, output_path: str,
+                    minicap_port: int = MINICAP_PORT) -> int:
+        """Connect to, capture and save one device; returns its exit code."""
+        # Each device gets its own capture instance (ADB connection, minicap
+        # stream on its own local port)
+        capturer = ScreenshotCapture(device_serial, use_minicap=use_minicap,
+                                     minicap_quality=args.quality,
+                                     minicap_port=minicap_port)
+
+        # Connect to device
+        if not capturer.connect():
+            logger.error(f"Failed to connect to device: {name}")
+            return EXIT_CONNECTION_ERROR
+
+        # Capture screenshot
+        with capturer:
+            screenshot = capturer.capture(region)
+        if screenshot is None:
+            logger.error(f"Failed to capture screenshot: {name}")
+            return EXIT_CAPTURE_ERROR
+
+        # Save screenshot
+        saved_path = capturer.save(screenshot, output_path, args.format, args.quality)
+        if not saved_path:
+            logger.error(f"Failed to save screenshot: {name}")
+            return EXIT_SAVE_ERROR
+
+        # Open in MS Paint if requested via CLI arg or config default
+        if args.paint or default_open_in_paint:
+            open_in_mspaint(saved_path)
+
+        return EXIT_SUCCESS
+
+    if len(targets) == 1:
+        name, device_serial = targets[0]
+        exit_code = capture_one(name, device_serial, args.output)
+    else:
+        # ADB round trips dominate - capture all devices at once, one file each.
+        # Local forward ports are global, so each device's minicap gets its own.
+        output = Path(args.output)
+        with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="capture") as executor:
+            futures = [
+                executor.submit(capture_one, name, device_serial,
+                                str(output.with_name(f"{output.stem}_{name}{output.suffix}")),
+                                MINICAP_PORT + i)
+                for i, (name, device_serial) in enumerate(targets)
+            ]
+            exit_codes = [future.result() for future in futures]
+        exit_code = next((code for code in exit_codes if code != EXIT_SUCCESS), EXIT_SUCCESS)
+
+    if exit_code == EXIT_SUCCESS:
+        logger.info("Screenshot capture completed successfully")
+    return exit_code
 
 
 if __name__ == "__main__":